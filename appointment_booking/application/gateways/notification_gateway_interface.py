@@ -1,6 +1,7 @@
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Sequence, Tuple
 
 
 class INotificationGateway(ABC):
@@ -13,6 +14,35 @@ class INotificationGateway(ABC):
         self, appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
     ) -> None:
         """
-        Send or log a confirmation notification for a booked appointment.
+        Send, log or queue a confirmation notification for a booked appointment.
+        Called inside the booking transaction, so it must not block on a remote provider.
+        """
+        pass
+
+    @abstractmethod
+    def schedule_appointment_reminders(
+        self, appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
+    ) -> None:
+        """
+        Arrange reminders ahead of the appointment. Called inside the booking transaction.
+        """
+        pass
+
+    @abstractmethod
+    def send_series_confirmation(
+        self, patient_name: str, appointments: Sequence[Tuple[uuid.UUID, str, datetime]]
+    ) -> None:
+        """
+        Send one confirmation for several ``(appointment_id, doctor_name, appointment_time)``
+        booked together. Called inside the booking transaction.
+        """
+        pass
+
+    @abstractmethod
+    def schedule_series_reminders(
+        self, patient_name: str, appointments: Sequence[Tuple[uuid.UUID, str, datetime]]
+    ) -> None:
+        """
+        Arrange reminders ahead of each of several appointments. Called inside the booking transaction.
         """
         pass
@@ -1,6 +1,6 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from appointment_booking.domain.entities import Appointment
 
@@ -17,9 +17,23 @@ class IAppointmentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def create(self, appointment: Appointment) -> Appointment:
+        """
+        Insert a new appointment (a single INSERT, no upsert lookup).
+        """
+        pass
+
+    @abstractmethod
+    def create_many(self, appointments: Sequence[Appointment]) -> List[Appointment]:
+        """
+        Insert several new appointments at once (one bulk INSERT).
+        """
+        pass
+
     @abstractmethod
     def find_by_slot_id(self, slot_id: uuid.UUID) -> Optional[Appointment]:
         """
-        Find an appointment by its slot_id if it exists.
+        Find the appointment (not canceled) booked on slot_id, if any.
         """
         pass
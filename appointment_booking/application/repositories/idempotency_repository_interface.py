@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """
+    The response first given to a request carrying an idempotency key.
+    """
+
+    request_fingerprint: str
+    status_code: int
+    body: dict
+
+
+class IIdempotencyRepository(ABC):
+    """
+    Defines the contract for claiming idempotency keys and storing their responses.
+    """
+
+    @abstractmethod
+    def find(self, key: str) -> Optional[StoredResponse]:
+        """
+        Return the stored response for an unexpired key, if a request with it completed.
+        """
+        pass
+
+    @abstractmethod
+    def claim(self, key: str, request_fingerprint: str, expires_at: datetime) -> bool:
+        """
+        Claim a key for the current transaction. Returns False if another request holds it.
+        Uniqueness is enforced by the database, so concurrent claims cannot both succeed.
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, key: str, status_code: int, body: dict) -> None:
+        """
+        Store the response of the request that claimed ``key``.
+        """
+        pass
+
+    @abstractmethod
+    def purge_expired(self, now: datetime, batch_size: int) -> int:
+        """
+        Delete up to ``batch_size`` expired keys; returns how many were deleted.
+        """
+        pass
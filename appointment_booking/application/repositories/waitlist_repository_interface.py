@@ -0,0 +1,52 @@
+import uuid
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterable, Optional, Set
+
+from appointment_booking.domain.entities import WaitlistEntry
+
+
+class IWaitlistRepository(ABC):
+    """
+    Defines the contract for storing and claiming waitlist entries.
+    """
+
+    @abstractmethod
+    def add(self, entry: WaitlistEntry) -> WaitlistEntry:
+        """
+        Persist a waiting entry, or return the patient's existing waiting entry for the same doctor and day.
+        """
+        pass
+
+    @abstractmethod
+    def find_by_id(self, entry_id: int) -> Optional[WaitlistEntry]:
+        pass
+
+    @abstractmethod
+    def first_waiting(self, doctor_id: uuid.UUID, day: date) -> Optional[WaitlistEntry]:
+        """
+        Return the oldest waiting entry for the doctor and day, if any.
+        """
+        pass
+
+    @abstractmethod
+    def days_with_waiters(self, doctor_id: uuid.UUID, days: Iterable[date]) -> Set[date]:
+        """
+        Return those of ``days`` on which someone is waiting for the doctor (one query).
+        """
+        pass
+
+    @abstractmethod
+    def promote(self, entry_id: int, appointment_id: uuid.UUID) -> bool:
+        """
+        Move a waiting entry to promoted, recording its appointment. Conditional on the entry
+        still waiting, so a waiter is promoted at most once; returns False if it was not.
+        """
+        pass
+
+    @abstractmethod
+    def leave(self, entry_id: int) -> bool:
+        """
+        Take a waiting entry off the waitlist. Returns False if it was not waiting.
+        """
+        pass
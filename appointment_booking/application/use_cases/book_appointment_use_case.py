@@ -1,6 +1,10 @@
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
 
 from appointment_booking.application.gateways.notification_gateway_interface import INotificationGateway
 from appointment_booking.application.repositories.appointment_repository_interface import IAppointmentRepository
@@ -11,11 +15,27 @@ from appointment_booking.domain.entities import Appointment
 from doctor_availability.services import SlotService
 
 
+@dataclass
+class BatchBookingResult:
+    """
+    Outcome of booking several slots at once: the appointments made, in time order, and the
+    requested slots that were not free.
+    """
+
+    appointments: List[Appointment] = field(default_factory=list)
+    unavailable: List[uuid.UUID] = field(default_factory=list)
+
+
 class BookAppointmentUseCase:
     """
     Handles the business logic for booking an appointment:
-    - Checks if the slot is available.
-    - Reserves the slot and creates an Appointment entity.
+    - Reserves the slot if it is available (atomic compare-and-set).
+    - Creates an Appointment entity in the same transaction.
+    - Queues the confirmation in that transaction too (transactional outbox).
+
+    Checkout flows can book in two phases instead: ``hold`` keeps the slot for a few minutes
+    and ``confirm_hold`` books it for whoever presents the hold token before it expires.
+    ``execute_batch`` books a series of slots (e.g. a course of treatment) in one go.
     """
 
     def __init__(self, appointment_repository: IAppointmentRepository, notification_gateway: INotificationGateway):
@@ -25,39 +45,121 @@ class BookAppointmentUseCase:
     def execute(self, slot_id: uuid.UUID, patient_id: uuid.UUID, patient_name: str) -> Optional[Appointment]:
         """
         Book an appointment for a given slot if it's free.
+        The slot reservation, the appointment insert and the queued confirmation share one transaction.
         """
-        # 1. Check if an appointment already exists for this slot
-        existing_appointment = self.appointment_repository.find_by_slot_id(slot_id)
-        if existing_appointment:
-            # Slot is already booked
-            return None
+        with transaction.atomic():
+            # 1. Reserve the slot with a conditional UPDATE; None means the slot
+            #    does not exist or someone else already holds it.
+            slot = SlotService.reserve_slot(slot_id)
+            if slot is None:
+                return None
+
+            # 2. Create appointment entity
+            new_appointment = Appointment(
+                slot_id=slot_id,
+                patient_id=patient_id,
+                patient_name=patient_name,
+                reserved_at=datetime.now(timezone.utc),
+                slot_time=slot.time,
+                doctor_id=slot.doctor_id,
+            )
+
+            # 3. Persist appointment and queue its confirmation
+            return self._persist(new_appointment, slot)
+
+    def execute_batch(
+        self, slot_ids: Sequence[uuid.UUID], patient_id: uuid.UUID, patient_name: str, all_or_nothing: bool = True
+    ) -> BatchBookingResult:
+        """
+        Book several slots for one patient in one transaction: one conditional UPDATE reserves
+        them, one bulk INSERT creates the appointments and a single confirmation covers them all.
+        With ``all_or_nothing`` nothing is booked unless every slot is free; otherwise the free
+        slots are booked and the rest reported as unavailable.
+        """
+        with transaction.atomic():
+            slots, unavailable = SlotService.reserve_slots(slot_ids, all_or_nothing=all_or_nothing)
+            if not slots:
+                return BatchBookingResult(unavailable=unavailable)
+
+            reserved_at = datetime.now(timezone.utc)
+            appointments = self.appointment_repository.create_many(
+                [
+                    Appointment(
+                        slot_id=slot.id,
+                        patient_id=patient_id,
+                        patient_name=patient_name,
+                        reserved_at=reserved_at,
+                        slot_time=slot.time,
+                        doctor_id=slot.doctor_id,
+                    )
+                    for slot in slots
+                ]
+            )
+            series = [(appointment.id, slot.doctor.name, slot.time) for appointment, slot in zip(appointments, slots)]
+            self.notification_gateway.send_series_confirmation(patient_name=patient_name, appointments=series)
+            self.notification_gateway.schedule_series_reminders(patient_name=patient_name, appointments=series)
+        return BatchBookingResult(appointments=appointments, unavailable=unavailable)
 
-        # 2. Check if slot is actually available (not reserved)
-        slot = SlotService.get_slot_by_id(slot_id)
-        if not slot or slot.is_reserved:
-            # Slot not found or already reserved
+    def hold(self, slot_id: uuid.UUID) -> Optional[Tuple[uuid.UUID, datetime]]:
+        """
+        Hold a free slot. Returns the hold token and when the hold expires, or None if the slot
+        does not exist or is not free.
+        """
+        held = SlotService.hold_slot(slot_id)
+        if held is None:
             return None
+        slot, token = held
+        return token, slot.held_until
 
-        # 3. Mark slot as reserved
-        SlotService.reserve_slot(slot_id)
+    def confirm_hold(
+        self, slot_id: uuid.UUID, hold_token: uuid.UUID, patient_id: uuid.UUID, patient_name: str
+    ) -> Optional[Appointment]:
+        """
+        Book a held slot. The hold's confirmation, the appointment insert and the queued
+        confirmation share one transaction. Returns None if the token is wrong or the hold expired.
+        """
+        with transaction.atomic():
+            slot = SlotService.confirm_hold(slot_id, hold_token)
+            if slot is None:
+                return None
 
-        # 4. Create appointment entity
-        new_appointment = Appointment(
-            slot_id=slot_id,
-            patient_id=patient_id,
-            patient_name=patient_name,
-            reserved_at=datetime.now(timezone.utc),
-        )
+            new_appointment = Appointment(
+                slot_id=slot_id,
+                patient_id=patient_id,
+                patient_name=patient_name,
+                reserved_at=datetime.now(timezone.utc),
+                slot_time=slot.time,
+                doctor_id=slot.doctor_id,
+            )
+            return self._persist(new_appointment, slot)
 
-        # 5. Persist appointment
-        saved_appointment = self.appointment_repository.save(new_appointment)
+    async def aexecute(self, slot_id: uuid.UUID, patient_id: uuid.UUID, patient_name: str) -> Optional[Appointment]:
+        """
+        Async variant of ``execute``.
 
-        # 6. Send confirmation notification
-        self.notification_gateway.send_appointment_confirmation(
-            appointment_id=saved_appointment.id,
-            patient_name=saved_appointment.patient_name,
-            doctor_name=slot.doctor.name,  # from the slot
-            appointment_time=slot.time,
-        )
+        The reservation and the appointment insert must commit together, which the async ORM
+        cannot do, so ``execute`` runs as a whole on a worker thread: a failure leaves no slot
+        reserved, and listeners only hear about reservations that committed.
+        """
+        return await sync_to_async(self.execute)(slot_id, patient_id, patient_name)
 
+    def _persist(self, appointment: Appointment, slot) -> Appointment:
+        """
+        Insert the appointment, queue its confirmation and schedule its reminders atomically
+        (joins an outer transaction).
+        """
+        with transaction.atomic(savepoint=False):
+            saved_appointment = self.appointment_repository.create(appointment)
+            self.notification_gateway.send_appointment_confirmation(
+                appointment_id=saved_appointment.id,
+                patient_name=saved_appointment.patient_name,
+                doctor_name=slot.doctor.name,  # from the slot
+                appointment_time=slot.time,
+            )
+            self.notification_gateway.schedule_appointment_reminders(
+                appointment_id=saved_appointment.id,
+                patient_name=saved_appointment.patient_name,
+                doctor_name=slot.doctor.name,
+                appointment_time=slot.time,
+            )
         return saved_appointment
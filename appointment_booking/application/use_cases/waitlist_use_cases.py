@@ -0,0 +1,109 @@
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Union
+
+from django.db import transaction
+from django.utils import timezone
+
+from appointment_booking.application.repositories.waitlist_repository_interface import IWaitlistRepository
+from appointment_booking.application.use_cases.book_appointment_use_case import BookAppointmentUseCase
+from appointment_booking.domain.entities import Appointment, WaitlistEntry
+from doctor_availability.services import SlotService
+
+# How many waiters a single slot is offered to before giving up; only exceeded when
+# concurrent promotions keep taking the head of the queue first
+MAX_PROMOTION_ATTEMPTS = 5
+
+# Free slots of the day offered to the queue when a patient joins it
+JOIN_SLOT_LOOKAHEAD = 10
+
+# Returned by PromoteWaitlistUseCase.execute when the day's queue is empty, as opposed to None
+# for a slot that could not be booked (past or taken)
+NOBODY_WAITING = object()
+
+
+class PromoteWaitlistUseCase:
+    """
+    Books a freed or newly created slot for the first patient waiting for that doctor and day.
+
+    The booking and the waitlist entry's promotion share one transaction: the slot is reserved
+    with the usual compare-and-set, and the entry moves to promoted with a conditional UPDATE,
+    so concurrent releases can neither double-book a slot nor promote a waiter twice.
+    """
+
+    def __init__(self, waitlist_repository: IWaitlistRepository, book_appointment: BookAppointmentUseCase):
+        self.waitlist_repository = waitlist_repository
+        self.book_appointment = book_appointment
+
+    def execute(
+        self, slot_id: uuid.UUID, doctor_id: uuid.UUID, slot_time: datetime
+    ) -> Union[Appointment, object, None]:
+        """
+        Offer the slot to the waitlist. Returns the appointment booked for the promoted waiter,
+        ``NOBODY_WAITING`` when the day's queue is empty, or None when the slot could not be
+        booked (it is in the past or was taken) and the queue is left as it is.
+        """
+        if slot_time <= timezone.now():
+            return None
+
+        day = timezone.localdate(slot_time)
+        for _ in range(MAX_PROMOTION_ATTEMPTS):
+            entry = self.waitlist_repository.first_waiting(doctor_id, day)
+            if entry is None:
+                return NOBODY_WAITING
+
+            with transaction.atomic():
+                appointment = self.book_appointment.execute(
+                    slot_id=slot_id, patient_id=entry.patient_id, patient_name=entry.patient_name
+                )
+                if appointment is None:
+                    # Someone else booked the slot first
+                    return None
+                if self.waitlist_repository.promote(entry.id, appointment.id):
+                    return appointment
+                # A concurrent promotion took this waiter; undo the booking and offer the slot to the next one
+                transaction.set_rollback(True)
+        return None
+
+
+class JoinWaitlistUseCase:
+    """
+    Puts a patient on a doctor's waitlist for a day.
+
+    If the doctor still has free slots that day they are offered to the queue right away,
+    so a patient never waits behind a slot nobody took.
+    """
+
+    def __init__(self, waitlist_repository: IWaitlistRepository, promote: PromoteWaitlistUseCase):
+        self.waitlist_repository = waitlist_repository
+        self.promote = promote
+
+    def execute(self, doctor_id: uuid.UUID, day: date, patient_id: uuid.UUID, patient_name: str) -> WaitlistEntry:
+        """
+        Register the patient (once: joining again returns the existing entry) and return the
+        entry, already promoted if a free slot was found for it.
+        """
+        entry = self.waitlist_repository.add(
+            WaitlistEntry(doctor_id=doctor_id, day=day, patient_id=patient_id, patient_name=patient_name)
+        )
+        if entry.status != WaitlistEntry.WAITING:
+            return entry
+
+        free_slots = SlotService.list_available_slots(
+            doctor_id=doctor_id,
+            time_from=max(_start_of(day), timezone.now()),
+            time_to=_start_of(day + timedelta(days=1)),
+        )[:JOIN_SLOT_LOOKAHEAD]
+        for slot in free_slots:
+            # Patients ahead in the queue are served first. NOBODY_WAITING falls through: this
+            # entry left the queue concurrently, which the re-read below sees
+            if self.promote.execute(slot.id, doctor_id, slot.time) is None:
+                continue
+            entry = self.waitlist_repository.find_by_id(entry.id)
+            if entry.status != WaitlistEntry.WAITING:
+                break
+        return entry
+
+
+def _start_of(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()), timezone.get_current_timezone())
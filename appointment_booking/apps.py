@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AppointmentBookingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "appointment_booking"
+
+    def ready(self):
+        # Connect the waitlist to slot releases and creations
+        from appointment_booking.infrastructure import waitlist_receivers  # noqa: F401
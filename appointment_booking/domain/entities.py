@@ -1,6 +1,7 @@
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, timezone
+from typing import Optional
 
 
 @dataclass
@@ -15,3 +16,26 @@ class Appointment:
     patient_id: uuid.UUID = field(default_factory=uuid.uuid4)
     patient_name: str = ""
     reserved_at: datetime = field(default_factory=datetime.utcnow)
+    slot_time: Optional[datetime] = None
+    doctor_id: Optional[uuid.UUID] = None
+
+
+@dataclass
+class WaitlistEntry:
+    """
+    A patient waiting for any slot of a doctor on a given day.
+    Entries are served first come, first served; ``id`` orders them.
+    """
+
+    WAITING = "waiting"
+    PROMOTED = "promoted"
+    LEFT = "left"
+
+    doctor_id: uuid.UUID
+    day: date
+    patient_id: uuid.UUID
+    patient_name: str
+    id: Optional[int] = None
+    status: str = WAITING
+    appointment_id: Optional[uuid.UUID] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
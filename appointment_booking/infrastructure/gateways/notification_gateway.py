@@ -1,22 +1,45 @@
 import uuid
 from datetime import datetime
+from typing import Sequence, Tuple
 
 from appointment_booking.application.gateways.notification_gateway_interface import INotificationGateway
-from appointment_confirmation.confirmation_service import send_appointment_confirmation
+from appointment_confirmation import reminders
+from appointment_confirmation.outbox import enqueue_appointment_confirmation, enqueue_series_confirmation
 
 
 class NotificationGateway(INotificationGateway):
     """
-    Concrete implementation of INotificationGateway using the
-    appointment_confirmation module's simplest function.
+    Concrete implementation of INotificationGateway that queues the confirmation
+    in the appointment_confirmation outbox; the ``process_outbox`` worker sends it.
+    Reminders are left to the appointment_confirmation reminder scheduler.
     """
 
     def send_appointment_confirmation(
         self, appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
     ) -> None:
-        send_appointment_confirmation(
-            appointment_id=str(appointment_id),
+        enqueue_appointment_confirmation(
+            appointment_id=appointment_id,
             patient_name=patient_name,
             doctor_name=doctor_name,
             appointment_time=appointment_time,
         )
+
+    def schedule_appointment_reminders(
+        self, appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
+    ) -> None:
+        reminders.record_booked(
+            appointment_id=appointment_id,
+            patient_name=patient_name,
+            doctor_name=doctor_name,
+            appointment_time=appointment_time,
+        )
+
+    def send_series_confirmation(
+        self, patient_name: str, appointments: Sequence[Tuple[uuid.UUID, str, datetime]]
+    ) -> None:
+        enqueue_series_confirmation(patient_name=patient_name, appointments=appointments)
+
+    def schedule_series_reminders(
+        self, patient_name: str, appointments: Sequence[Tuple[uuid.UUID, str, datetime]]
+    ) -> None:
+        reminders.record_booked_many(patient_name=patient_name, appointments=appointments)
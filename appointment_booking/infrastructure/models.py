@@ -17,6 +17,79 @@ class AppointmentModel(models.Model):
     reserved_at = models.DateTimeField(default=now)
     is_completed = models.BooleanField(default=False)
     is_canceled = models.BooleanField(default=False)
+    # Copied from the slot at booking time so appointment queries need no cross-module join
+    slot_time = models.DateTimeField(null=True, blank=True)
+    doctor_id = models.UUIDField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # A doctor's open appointments in time order: one range scan (id breaks ties for keyset pages)
+            models.Index(
+                fields=["doctor_id", "is_canceled", "is_completed", "slot_time", "id"],
+                name="appointment_doctor_open_idx",
+            ),
+            # A slot's appointments, for lookups and joins from the slot side
+            models.Index(fields=["slot_id", "is_canceled"], name="appointment_slot_idx"),
+        ]
 
     def __str__(self):
         return f"Appointment({self.patient_name}, {self.slot_id})"
+
+
+class WaitlistEntryModel(models.Model):
+    """
+    Infrastructure representation of a WaitlistEntry.
+    The auto-increment id is the queue position: lower ids are served first.
+    """
+
+    WAITING = "waiting"
+    PROMOTED = "promoted"
+    LEFT = "left"
+    STATUS_CHOICES = [(WAITING, "Waiting"), (PROMOTED, "Promoted"), (LEFT, "Left")]
+
+    doctor_id = models.UUIDField()
+    day = models.DateField()
+    patient_id = models.UUIDField()
+    patient_name = models.CharField(max_length=255)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=WAITING)
+    appointment_id = models.UUIDField(null=True, blank=True)
+    created_at = models.DateTimeField(default=now)
+
+    class Meta:
+        indexes = [
+            # The head of a doctor's queue for a day: the first entry of one index range
+            models.Index(
+                fields=["doctor_id", "day", "id"],
+                name="waitlist_waiting_idx",
+                condition=models.Q(status="waiting"),
+            ),
+        ]
+        constraints = [
+            # A patient waits at most once per doctor and day
+            models.UniqueConstraint(
+                fields=["doctor_id", "day", "patient_id"],
+                condition=models.Q(status="waiting"),
+                name="waitlist_one_waiting_entry",
+            ),
+        ]
+
+    def __str__(self):
+        return f"WaitlistEntry({self.patient_name}, {self.doctor_id}, {self.day})"
+
+
+class IdempotencyKeyModel(models.Model):
+    """
+    The response first given to a request with an ``Idempotency-Key`` header, replayed to retries.
+    The key is the primary key: of two concurrent requests with the same key only one can insert it.
+    """
+
+    key = models.CharField(max_length=255, primary_key=True)
+    request_fingerprint = models.CharField(max_length=64)
+    # Null while the claiming request is still running (only visible inside its transaction)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(default=now)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"IdempotencyKey({self.key})"
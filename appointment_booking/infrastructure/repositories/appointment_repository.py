@@ -1,9 +1,11 @@
 import uuid
-from typing import Optional
+from typing import List, Optional, Sequence
 
+from appointment_booking import signals
 from appointment_booking.application.repositories.appointment_repository_interface import IAppointmentRepository
 from appointment_booking.domain.entities import Appointment
 from appointment_booking.infrastructure.models import AppointmentModel
+from doctor_appointment_app import versions
 
 
 class AppointmentRepository(IAppointmentRepository):
@@ -19,22 +21,71 @@ class AppointmentRepository(IAppointmentRepository):
                 "slot_id": appointment.slot_id,
                 "patient_id": appointment.patient_id,
                 "patient_name": appointment.patient_name,
+                "slot_time": appointment.slot_time,
+                "doctor_id": appointment.doctor_id,
             },
         )
 
+        versions.bump_version_on_commit(versions.APPOINTMENTS)
+
         # Synchronize domain entity with stored data
         appointment.id = appointment_model.id
         return appointment
 
+    def create(self, appointment: Appointment) -> Appointment:
+        AppointmentModel.objects.create(
+            id=appointment.id,
+            slot_id=appointment.slot_id,
+            patient_id=appointment.patient_id,
+            patient_name=appointment.patient_name,
+            reserved_at=appointment.reserved_at,
+            slot_time=appointment.slot_time,
+            doctor_id=appointment.doctor_id,
+        )
+        versions.bump_version_on_commit(versions.APPOINTMENTS)
+        self._announce_booked([appointment])
+        return appointment
+
+    def create_many(self, appointments: Sequence[Appointment]) -> List[Appointment]:
+        AppointmentModel.objects.bulk_create(
+            [
+                AppointmentModel(
+                    id=appointment.id,
+                    slot_id=appointment.slot_id,
+                    patient_id=appointment.patient_id,
+                    patient_name=appointment.patient_name,
+                    reserved_at=appointment.reserved_at,
+                    slot_time=appointment.slot_time,
+                    doctor_id=appointment.doctor_id,
+                )
+                for appointment in appointments
+            ]
+        )
+        versions.bump_version_on_commit(versions.APPOINTMENTS)
+        self._announce_booked(appointments)
+        return list(appointments)
+
     def find_by_slot_id(self, slot_id: uuid.UUID) -> Optional[Appointment]:
         try:
-            app_model = AppointmentModel.objects.get(slot_id=slot_id)
+            # A canceled appointment releases its slot, which can then be booked again
+            app_model = AppointmentModel.objects.get(slot_id=slot_id, is_canceled=False)
             return Appointment(
                 id=app_model.id,
                 slot_id=app_model.slot_id,
                 patient_id=app_model.patient_id,
                 patient_name=app_model.patient_name,
                 reserved_at=app_model.reserved_at,
+                slot_time=app_model.slot_time,
+                doctor_id=app_model.doctor_id,
             )
         except AppointmentModel.DoesNotExist:
             return None
+
+    @staticmethod
+    def _announce_booked(appointments: Sequence[Appointment]) -> None:
+        signals.appointments_booked.send(
+            sender=AppointmentRepository,
+            appointments=[
+                (appointment.id, appointment.doctor_id, appointment.slot_time) for appointment in appointments
+            ],
+        )
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Optional
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from appointment_booking.application.repositories.idempotency_repository_interface import (
+    IIdempotencyRepository,
+    StoredResponse,
+)
+from appointment_booking.infrastructure.models import IdempotencyKeyModel
+
+
+class IdempotencyRepository(IIdempotencyRepository):
+    """
+    Concrete implementation of IIdempotencyRepository using Django ORM.
+    """
+
+    def find(self, key: str) -> Optional[StoredResponse]:
+        record = (
+            IdempotencyKeyModel.objects.filter(key=key, expires_at__gt=timezone.now(), status_code__isnull=False)
+            .only("request_fingerprint", "status_code", "response_body")
+            .first()
+        )
+        if record is None:
+            return None
+        return StoredResponse(record.request_fingerprint, record.status_code, record.response_body)
+
+    def claim(self, key: str, request_fingerprint: str, expires_at: datetime) -> bool:
+        # An expired key may be reused
+        IdempotencyKeyModel.objects.filter(key=key, expires_at__lte=timezone.now()).delete()
+        try:
+            # The savepoint keeps the caller's transaction usable when a concurrent claim wins
+            with transaction.atomic():
+                IdempotencyKeyModel.objects.create(
+                    key=key, request_fingerprint=request_fingerprint, expires_at=expires_at
+                )
+        except IntegrityError:
+            return False
+        return True
+
+    def complete(self, key: str, status_code: int, body: dict) -> None:
+        IdempotencyKeyModel.objects.filter(key=key).update(status_code=status_code, response_body=body)
+
+    def purge_expired(self, now: datetime, batch_size: int) -> int:
+        keys = list(IdempotencyKeyModel.objects.filter(expires_at__lte=now).values_list("key", flat=True)[:batch_size])
+        deleted, _ = IdempotencyKeyModel.objects.filter(key__in=keys).delete()
+        return deleted
@@ -0,0 +1,81 @@
+import uuid
+from datetime import date
+from typing import Iterable, Optional, Set
+
+from django.db import IntegrityError, transaction
+
+from appointment_booking.application.repositories.waitlist_repository_interface import IWaitlistRepository
+from appointment_booking.domain.entities import WaitlistEntry
+from appointment_booking.infrastructure.models import WaitlistEntryModel
+
+
+class WaitlistRepository(IWaitlistRepository):
+    """
+    Concrete implementation of IWaitlistRepository using Django ORM.
+    """
+
+    def add(self, entry: WaitlistEntry) -> WaitlistEntry:
+        existing = self._waiting(entry.doctor_id, entry.day).filter(patient_id=entry.patient_id).first()
+        if existing is not None:
+            return self._to_entity(existing)
+        try:
+            # The savepoint keeps an outer transaction usable if a concurrent add wins the unique constraint
+            with transaction.atomic():
+                entry_model = WaitlistEntryModel.objects.create(
+                    doctor_id=entry.doctor_id,
+                    day=entry.day,
+                    patient_id=entry.patient_id,
+                    patient_name=entry.patient_name,
+                    created_at=entry.created_at,
+                )
+        except IntegrityError:
+            entry_model = self._waiting(entry.doctor_id, entry.day).get(patient_id=entry.patient_id)
+        return self._to_entity(entry_model)
+
+    def find_by_id(self, entry_id: int) -> Optional[WaitlistEntry]:
+        try:
+            return self._to_entity(WaitlistEntryModel.objects.get(id=entry_id))
+        except WaitlistEntryModel.DoesNotExist:
+            return None
+
+    def first_waiting(self, doctor_id: uuid.UUID, day: date) -> Optional[WaitlistEntry]:
+        entry_model = self._waiting(doctor_id, day).order_by("id").first()
+        return self._to_entity(entry_model) if entry_model else None
+
+    def days_with_waiters(self, doctor_id: uuid.UUID, days: Iterable[date]) -> Set[date]:
+        return set(
+            WaitlistEntryModel.objects.filter(
+                doctor_id=doctor_id, day__in=list(days), status=WaitlistEntryModel.WAITING
+            )
+            .values_list("day", flat=True)
+            .distinct()
+        )
+
+    def promote(self, entry_id: int, appointment_id: uuid.UUID) -> bool:
+        updated = WaitlistEntryModel.objects.filter(id=entry_id, status=WaitlistEntryModel.WAITING).update(
+            status=WaitlistEntryModel.PROMOTED, appointment_id=appointment_id
+        )
+        return updated == 1
+
+    def leave(self, entry_id: int) -> bool:
+        updated = WaitlistEntryModel.objects.filter(id=entry_id, status=WaitlistEntryModel.WAITING).update(
+            status=WaitlistEntryModel.LEFT
+        )
+        return updated == 1
+
+    @staticmethod
+    def _waiting(doctor_id: uuid.UUID, day: date):
+        return WaitlistEntryModel.objects.filter(doctor_id=doctor_id, day=day, status=WaitlistEntryModel.WAITING)
+
+    @staticmethod
+    def _to_entity(entry_model: WaitlistEntryModel) -> WaitlistEntry:
+        return WaitlistEntry(
+            id=entry_model.id,
+            doctor_id=entry_model.doctor_id,
+            day=entry_model.day,
+            patient_id=entry_model.patient_id,
+            patient_name=entry_model.patient_name,
+            status=entry_model.status,
+            appointment_id=entry_model.appointment_id,
+            created_at=entry_model.created_at,
+        )
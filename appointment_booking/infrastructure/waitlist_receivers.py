@@ -0,0 +1,51 @@
+"""
+Hands slots that become available to the waitlist.
+
+Connected in ``AppointmentBookingConfig.ready``. The doctor_availability signals are sent inside
+the transaction that freed or created the slot, so a promotion commits or rolls back with it.
+"""
+
+import uuid
+from datetime import datetime
+from typing import List, Tuple
+
+from django.dispatch import receiver
+from django.utils import timezone
+
+from appointment_booking.application.use_cases.book_appointment_use_case import BookAppointmentUseCase
+from appointment_booking.application.use_cases.waitlist_use_cases import NOBODY_WAITING, PromoteWaitlistUseCase
+from appointment_booking.infrastructure.gateways.notification_gateway import NotificationGateway
+from appointment_booking.infrastructure.repositories.appointment_repository import AppointmentRepository
+from appointment_booking.infrastructure.repositories.waitlist_repository import WaitlistRepository
+from doctor_availability.signals import slots_created, slots_released
+
+
+def build_promote_use_case() -> PromoteWaitlistUseCase:
+    return PromoteWaitlistUseCase(
+        waitlist_repository=WaitlistRepository(),
+        book_appointment=BookAppointmentUseCase(
+            appointment_repository=AppointmentRepository(), notification_gateway=NotificationGateway()
+        ),
+    )
+
+
+@receiver(slots_released, dispatch_uid="waitlist_promote_on_release")
+@receiver(slots_created, dispatch_uid="waitlist_promote_on_create")
+def promote_waiters(sender, doctor_id: uuid.UUID, slots: List[Tuple[uuid.UUID, datetime]], **kwargs):
+    """
+    Offer each slot, earliest first, to the waitlist for its day.
+    """
+    # One query tells which of the slots' days have a queue; usually none do
+    waiting_days = WaitlistRepository().days_with_waiters(doctor_id, {timezone.localdate(t) for _, t in slots})
+    if not waiting_days:
+        return
+
+    promote = build_promote_use_case()
+    for slot_id, slot_time in slots:
+        day = timezone.localdate(slot_time)
+        if day not in waiting_days:
+            continue
+        # None means this slot is past or taken; the queue still gets the day's other slots
+        if promote.execute(slot_id, doctor_id, slot_time) is NOBODY_WAITING:
+            # Nobody is left waiting that day; skip its remaining slots
+            waiting_days.discard(day)
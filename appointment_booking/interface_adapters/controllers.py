@@ -1,20 +1,46 @@
+import json
+
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from appointment_booking.application.use_cases.book_appointment_use_case import BookAppointmentUseCase
+from appointment_booking.application.use_cases.waitlist_use_cases import JoinWaitlistUseCase
 from appointment_booking.infrastructure.gateways.notification_gateway import NotificationGateway
 from appointment_booking.infrastructure.repositories.appointment_repository import AppointmentRepository
+from appointment_booking.infrastructure.repositories.waitlist_repository import WaitlistRepository
+from appointment_booking.infrastructure.waitlist_receivers import build_promote_use_case
+from doctor_availability.services import SlotsChanged
+
+from .idempotency import idempotent
+from .serializers import (
+    BookAppointmentSerializer,
+    BookAppointmentsSerializer,
+    ConfirmHoldSerializer,
+    HoldSlotSerializer,
+    JoinWaitlistSerializer,
+)
 
-from .serializers import BookAppointmentSerializer
+SLOT_UNAVAILABLE = "Slot is already booked or invalid."
+SLOTS_UNAVAILABLE = "None of the requested slots could be booked."
+SLOTS_CHANGED = "Some of the requested slots were booked meanwhile; try again."
+HOLD_INVALID = "Hold is invalid or has expired."
+WAITLIST_ENTRY_NOT_FOUND = "Waitlist entry not found."
 
 
 class BookAppointmentController(APIView):
     """
     API Controller to book an appointment.
+    Retries sent with the same ``Idempotency-Key`` header get the first response back.
     """
 
     def post(self, request):
+        return idempotent(request, lambda: self._book(request))
+
+    def _book(self, request):
         serializer = BookAppointmentSerializer(data=request.data)
         if serializer.is_valid():
             slot_id = serializer.validated_data["slot_id"]
@@ -31,16 +57,165 @@ class BookAppointmentController(APIView):
             appointment = use_case.execute(slot_id=slot_id, patient_id=patient_id, patient_name=patient_name)
 
             if not appointment:
-                return Response({"detail": "Slot is already booked or invalid."}, status=status.HTTP_400_BAD_REQUEST)
-
-            return Response(
-                {
-                    "id": str(appointment.id),
-                    "slot_id": str(appointment.slot_id),
-                    "patient_id": str(appointment.patient_id),
-                    "patient_name": appointment.patient_name,
-                    "reserved_at": appointment.reserved_at.isoformat(),
-                },
-                status=status.HTTP_201_CREATED,
-            )
+                return Response({"detail": SLOT_UNAVAILABLE}, status=status.HTTP_400_BAD_REQUEST)
+
+            return Response(_to_response_data(appointment), status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class BookAppointmentsController(APIView):
+    """
+    API Controller to book several slots for one patient at once (e.g. a course of treatment).
+    Accepts an ``Idempotency-Key`` header like the single booking endpoint.
+    """
+
+    def post(self, request):
+        try:
+            return idempotent(request, lambda: self._book(request))
+        except SlotsChanged:
+            # Raised through the idempotency transaction, so the key is free for the retry
+            return Response({"detail": SLOTS_CHANGED}, status=status.HTTP_409_CONFLICT)
+
+    def _book(self, request):
+        serializer = BookAppointmentsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        result = _booking_use_case().execute_batch(**serializer.validated_data)
+        data = {
+            "appointments": [_to_response_data(appointment) for appointment in result.appointments],
+            "unavailable_slot_ids": [str(slot_id) for slot_id in result.unavailable],
+        }
+        if not result.appointments:
+            return Response({"detail": SLOTS_UNAVAILABLE, **data}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class HoldSlotController(APIView):
+    """
+    API Controller to hold a slot for a few minutes (first phase of a two-phase booking).
+    """
+
+    def post(self, request):
+        serializer = HoldSlotSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        held = _booking_use_case().hold(serializer.validated_data["slot_id"])
+        if held is None:
+            return Response({"detail": SLOT_UNAVAILABLE}, status=status.HTTP_400_BAD_REQUEST)
+
+        hold_token, expires_at = held
+        return Response(
+            {
+                "slot_id": str(serializer.validated_data["slot_id"]),
+                "hold_token": str(hold_token),
+                "expires_at": expires_at.isoformat(),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class ConfirmHoldController(APIView):
+    """
+    API Controller to book a held slot (second phase of a two-phase booking).
+    """
+
+    def post(self, request):
+        serializer = ConfirmHoldSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        appointment = _booking_use_case().confirm_hold(**serializer.validated_data)
+        if not appointment:
+            return Response({"detail": HOLD_INVALID}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(_to_response_data(appointment), status=status.HTTP_201_CREATED)
+
+
+@csrf_exempt
+@require_POST
+async def book_appointment_async(request):
+    """
+    Async API controller to book an appointment, for the ASGI entry point.
+    Same contract as ``BookAppointmentController``.
+    """
+    try:
+        data = json.loads(request.body or b"{}")
+    except ValueError:
+        return JsonResponse({"detail": "Malformed JSON."}, status=status.HTTP_400_BAD_REQUEST)
+
+    serializer = BookAppointmentSerializer(data=data)
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    use_case = BookAppointmentUseCase(
+        appointment_repository=AppointmentRepository(), notification_gateway=NotificationGateway()
+    )
+    appointment = await use_case.aexecute(**serializer.validated_data)
+    if not appointment:
+        return JsonResponse({"detail": SLOT_UNAVAILABLE}, status=status.HTTP_400_BAD_REQUEST)
+
+    return JsonResponse(_to_response_data(appointment), status=status.HTTP_201_CREATED)
+
+
+class WaitlistController(APIView):
+    """
+    API Controller to join a doctor's waitlist for a day.
+    """
+
+    def post(self, request):
+        serializer = JoinWaitlistSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = JoinWaitlistUseCase(waitlist_repository=WaitlistRepository(), promote=build_promote_use_case())
+        entry = use_case.execute(**serializer.validated_data)
+        return Response(_to_waitlist_data(entry), status=status.HTTP_201_CREATED)
+
+
+class WaitlistEntryController(APIView):
+    """
+    API Controller to check on or leave a waitlist entry.
+    """
+
+    def get(self, request, entry_id):
+        entry = WaitlistRepository().find_by_id(entry_id)
+        if entry is None:
+            return Response({"detail": WAITLIST_ENTRY_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
+        return Response(_to_waitlist_data(entry), status=status.HTTP_200_OK)
+
+    def delete(self, request, entry_id):
+        repository = WaitlistRepository()
+        if repository.find_by_id(entry_id) is None:
+            return Response({"detail": WAITLIST_ENTRY_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
+        if not repository.leave(entry_id):
+            return Response({"detail": "Waitlist entry is no longer waiting."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+def _booking_use_case() -> BookAppointmentUseCase:
+    return BookAppointmentUseCase(
+        appointment_repository=AppointmentRepository(), notification_gateway=NotificationGateway()
+    )
+
+
+def _to_waitlist_data(entry) -> dict:
+    return {
+        "id": entry.id,
+        "doctor_id": str(entry.doctor_id),
+        "day": entry.day.isoformat(),
+        "patient_id": str(entry.patient_id),
+        "patient_name": entry.patient_name,
+        "status": entry.status,
+        "appointment_id": str(entry.appointment_id) if entry.appointment_id else None,
+    }
+
+
+def _to_response_data(appointment) -> dict:
+    return {
+        "id": str(appointment.id),
+        "slot_id": str(appointment.slot_id),
+        "patient_id": str(appointment.patient_id),
+        "patient_name": appointment.patient_name,
+        "reserved_at": appointment.reserved_at.isoformat(),
+    }
@@ -0,0 +1,74 @@
+"""
+``Idempotency-Key`` support for booking requests.
+
+The first request with a key claims it by inserting a row keyed on it, runs, and stores its
+response in the same transaction. A retry with the key gets the stored response back without
+running the use case again. A duplicate racing with the first request waits on the key's unique
+index instead of a lock and then replays the committed response; if the first request failed,
+nothing was stored and the key is free again.
+"""
+
+import hashlib
+import json
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from appointment_booking.application.repositories.idempotency_repository_interface import IIdempotencyRepository
+from appointment_booking.infrastructure.repositories.idempotency_repository import IdempotencyRepository
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+DEFAULT_KEY_TTL = 24 * 60 * 60  # seconds
+
+KEY_INVALID = f"{IDEMPOTENCY_HEADER} must be 1 to {MAX_KEY_LENGTH} characters."
+KEY_REUSED = f"{IDEMPOTENCY_HEADER} was already used for a different request."
+KEY_IN_USE = f"A request with this {IDEMPOTENCY_HEADER} is still in progress."
+
+
+def request_fingerprint(request) -> str:
+    """
+    Hash of what the request asks for, so a key reused for another request is caught.
+    """
+    payload = json.dumps([request.method, request.path, request.data], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def idempotent(
+    request, handle: Callable[[], Response], repository: Optional[IIdempotencyRepository] = None
+) -> Response:
+    """
+    Run ``handle`` once per ``Idempotency-Key``; requests without the header run it as usual.
+    """
+    key = request.headers.get(IDEMPOTENCY_HEADER)
+    if key is None:
+        return handle()
+    if not 0 < len(key) <= MAX_KEY_LENGTH:
+        return Response({"detail": KEY_INVALID}, status=status.HTTP_400_BAD_REQUEST)
+
+    repository = repository or IdempotencyRepository()
+    fingerprint = request_fingerprint(request)
+    stored = repository.find(key)
+    if stored is None:
+        ttl = getattr(settings, "IDEMPOTENCY_KEY_TTL", DEFAULT_KEY_TTL)
+        with transaction.atomic():
+            if repository.claim(key, fingerprint, timezone.now() + timedelta(seconds=ttl)):
+                response = handle()
+                repository.complete(key, response.status_code, response.data)
+                return response
+        # A concurrent request claimed the key first and has committed by now
+        stored = repository.find(key)
+        if stored is None:
+            return Response({"detail": KEY_IN_USE}, status=status.HTTP_409_CONFLICT)
+
+    if stored.request_fingerprint != fingerprint:
+        return Response({"detail": KEY_REUSED}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+    response = Response(stored.body, status=stored.status_code)
+    response[REPLAYED_HEADER] = "true"
+    return response
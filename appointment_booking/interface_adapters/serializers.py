@@ -1,7 +1,52 @@
+from django.utils.timezone import localdate
 from rest_framework import serializers
 
+from doctor_availability.services import SlotService
+
+# Most slots booked by one batch request
+MAX_BATCH_SIZE = 50
+
 
 class BookAppointmentSerializer(serializers.Serializer):
     slot_id = serializers.UUIDField()
     patient_id = serializers.UUIDField()
     patient_name = serializers.CharField(max_length=255)
+
+
+class BookAppointmentsSerializer(serializers.Serializer):
+    slot_ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=MAX_BATCH_SIZE)
+    patient_id = serializers.UUIDField()
+    patient_name = serializers.CharField(max_length=255)
+    # False books whichever slots are free and reports the others
+    all_or_nothing = serializers.BooleanField(default=True)
+
+
+class HoldSlotSerializer(serializers.Serializer):
+    slot_id = serializers.UUIDField()
+
+
+class ConfirmHoldSerializer(BookAppointmentSerializer):
+    hold_token = serializers.UUIDField()
+
+
+class JoinWaitlistSerializer(serializers.Serializer):
+    doctor_id = serializers.UUIDField()
+    day = serializers.DateField()
+    patient_id = serializers.UUIDField()
+    patient_name = serializers.CharField(max_length=255)
+
+    def validate_doctor_id(self, value):
+        """
+        Ensure the doctor exists.
+        """
+        if not SlotService.doctor_exists(value):
+            raise serializers.ValidationError("Doctor with the provided ID does not exist.")
+        return value
+
+    def validate_day(self, value):
+        """
+        Ensure the day is not in the past.
+        """
+        if value < localdate():
+            raise serializers.ValidationError("Day must not be in the past.")
+        return value
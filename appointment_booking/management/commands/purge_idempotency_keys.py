@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from appointment_booking.infrastructure.repositories.idempotency_repository import IdempotencyRepository
+
+
+class Command(BaseCommand):
+    help = "Delete expired Idempotency-Key records (run it periodically, e.g. from cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Keys deleted per query.")
+
+    def handle(self, *args, **options):
+        repository = IdempotencyRepository()
+        now = timezone.now()
+        total = 0
+        while True:
+            deleted = repository.purge_expired(now, options["batch_size"])
+            total += deleted
+            if deleted < options["batch_size"]:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {total} expired idempotency key(s)."))
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:39
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_slot_details(apps, schema_editor):
+    # Backfill from the booked slot in one UPDATE; rows whose slot is gone stay NULL
+    AppointmentModel = apps.get_model("appointment_booking", "AppointmentModel")
+    Slot = apps.get_model("doctor_availability", "Slot")
+    slot = Slot.objects.filter(id=OuterRef("slot_id"))
+    AppointmentModel.objects.filter(slot_time__isnull=True).update(
+        slot_time=Subquery(slot.values("time")[:1]),
+        doctor_id=Subquery(slot.values("doctor_id")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("appointment_booking", "0003_alter_appointmentmodel_reserved_at"),
+        ("doctor_availability", "0002_slot_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="appointmentmodel",
+            name="doctor_id",
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="appointmentmodel",
+            name="slot_time",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(copy_slot_details, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="appointmentmodel",
+            index=models.Index(
+                fields=["doctor_id", "is_canceled", "is_completed", "slot_time", "id"],
+                name="appointment_doctor_open_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:47
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("appointment_booking", "0004_appointment_slot_time_and_doctor"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WaitlistEntryModel",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("doctor_id", models.UUIDField()),
+                ("day", models.DateField()),
+                ("patient_id", models.UUIDField()),
+                ("patient_name", models.CharField(max_length=255)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("waiting", "Waiting"), ("promoted", "Promoted"), ("left", "Left")],
+                        default="waiting",
+                        max_length=10,
+                    ),
+                ),
+                ("appointment_id", models.UUIDField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "waiting")),
+                        fields=["doctor_id", "day", "id"],
+                        name="waitlist_waiting_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("status", "waiting")),
+                        fields=("doctor_id", "day", "patient_id"),
+                        name="waitlist_one_waiting_entry",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.5 on 2026-10-18 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("appointment_booking", "0006_idempotencykeymodel"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointmentmodel",
+            index=models.Index(fields=["slot_id", "is_canceled"], name="appointment_slot_idx"),
+        ),
+    ]
@@ -0,0 +1,9 @@
+"""
+Signals other modules can connect to without importing their code into this one.
+"""
+
+from django.dispatch import Signal
+
+# Sent by the appointment repository inside the transaction that inserts new appointments, with
+# ``appointments``: ``(appointment_id, doctor_id, slot_time)`` triples
+appointments_booked = Signal()
@@ -0,0 +1,95 @@
+import uuid
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from appointment_booking.infrastructure.models import AppointmentModel
+from appointment_confirmation import outbox
+from appointment_confirmation.models import OutboxMessage, ReminderEvent
+from doctor_availability.models import Doctor, Slot
+
+
+class BatchBookingAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.doctor = Doctor.objects.create(name="Dr. Ahmed")
+        self.slots = [
+            Slot.objects.create(doctor=self.doctor, time=now() + timedelta(weeks=week), cost=100) for week in (3, 1, 2)
+        ]
+        self.url = reverse("book-appointments")
+
+    def book(self, slots, **extra):
+        payload = {
+            "slot_ids": [str(slot.id) for slot in slots],
+            "patient_id": str(uuid.uuid4()),
+            "patient_name": "Alice",
+            **extra,
+        }
+        return self.client.post(self.url, payload, format="json")
+
+    def test_books_every_slot_with_one_confirmation(self):
+        # Lock-read, one UPDATE, one bulk INSERT, the confirmation and the reminder events (plus savepoints),
+        # and the dashboard counters: one UPDATE per day for the reserved slots and again for the appointments
+        call_command("rebuild_dashboard", stdout=StringIO())
+        with self.assertNumQueries(13):
+            response = self.book(self.slots)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["unavailable_slot_ids"], [])
+
+        booked = [appointment["slot_id"] for appointment in response.data["appointments"]]
+        in_time_order = sorted(self.slots, key=lambda slot: slot.time)
+        self.assertEqual(booked, [str(slot.id) for slot in in_time_order])
+        self.assertEqual(Slot.objects.filter(is_reserved=True).count(), 3)
+        self.assertEqual(AppointmentModel.objects.filter(doctor_id=self.doctor.id).count(), 3)
+
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.kind, outbox.APPOINTMENT_SERIES_CONFIRMATION)
+        self.assertEqual(len(message.payload["appointments"]), 3)
+        self.assertEqual(ReminderEvent.objects.count(), 3)
+
+    def test_all_or_nothing_books_nothing_if_a_slot_is_taken(self):
+        Slot.objects.filter(id=self.slots[1].id).update(is_reserved=True)
+
+        response = self.book(self.slots)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["unavailable_slot_ids"], [str(self.slots[1].id)])
+        self.assertEqual(Slot.objects.filter(is_reserved=True).count(), 1)
+        self.assertFalse(AppointmentModel.objects.exists())
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_best_effort_books_the_free_slots(self):
+        Slot.objects.filter(id=self.slots[1].id).update(is_reserved=True)
+        unknown = Slot(id=uuid.uuid4())
+
+        response = self.book([*self.slots, unknown], all_or_nothing=False)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["appointments"]), 2)
+        self.assertEqual(response.data["unavailable_slot_ids"], [str(self.slots[1].id), str(unknown.id)])
+        self.assertEqual(AppointmentModel.objects.count(), 2)
+
+    def test_slot_taken_between_the_read_and_the_update_rolls_back(self):
+        # Without row locks (SQLite) another booker can reserve a slot after it was read as free:
+        # the conditional UPDATE then misses it and the batch must not report it as booked
+        update = QuerySet.update
+        taken = self.slots[1]
+
+        def concurrent_booking_first(queryset, **kwargs):
+            if queryset.model is Slot and kwargs == {"is_reserved": True}:
+                update(Slot.objects.filter(id=taken.id), is_reserved=True)
+            return update(queryset, **kwargs)
+
+        with patch.object(QuerySet, "update", concurrent_booking_first):
+            response = self.book(self.slots, all_or_nothing=False)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        # Everything rolled back, the stand-in for the other booker included (it ran in this transaction)
+        self.assertFalse(Slot.objects.filter(is_reserved=True).exists())
+        self.assertFalse(AppointmentModel.objects.exists())
+        self.assertFalse(OutboxMessage.objects.exists())
@@ -1,11 +1,17 @@
 import uuid
+from io import StringIO
+from unittest.mock import patch
 
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
 from django.utils.timezone import now, timedelta
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from appointment_booking.infrastructure.models import AppointmentModel
+from appointment_booking.infrastructure.repositories.appointment_repository import AppointmentRepository
+from appointment_confirmation.models import OutboxMessage
 from doctor_availability.models import Doctor, Slot
 
 
@@ -37,6 +43,27 @@ class BookAppointmentAPITest(TestCase):
         self.slot.refresh_from_db()
         self.assertTrue(self.slot.is_reserved)
 
+        # The slot's time and doctor are copied onto the appointment
+        appointment = AppointmentModel.objects.get(id=response.data["id"])
+        self.assertEqual(appointment.slot_time, self.slot.time)
+        self.assertEqual(appointment.doctor_id, self.doctor.id)
+
+        # The confirmation is queued for the outbox worker, not sent inline
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.status, OutboxMessage.PENDING)
+        self.assertEqual(message.payload["appointment_id"], response.data["id"])
+        self.assertEqual(message.payload["doctor_name"], "Dr. Ahmed")
+
+    @patch("appointment_confirmation.transports.LoggingTransport.send_messages", side_effect=ConnectionError("down"))
+    def test_failing_provider_does_not_affect_booking(self, mock_send):
+        """
+        Booking only queues the confirmation, so a provider outage is invisible to the request.
+        """
+        response = self.client.post(self.url, data=self.payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        mock_send.assert_not_called()
+        self.assertTrue(OutboxMessage.objects.filter(status=OutboxMessage.PENDING).exists())
+
     def test_book_already_reserved_slot(self):
         """
         Reserve the slot, then try booking again.
@@ -48,3 +75,72 @@ class BookAppointmentAPITest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("detail", response.data)
         self.assertEqual(response.data["detail"], "Slot is already booked or invalid.")
+
+    def test_book_same_slot_twice(self):
+        """
+        The second booking loses the compare-and-set and no second appointment is written.
+        """
+        first = self.client.post(self.url, data=self.payload, format="json")
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+
+        self.payload["patient_name"] = "Bob"
+        second = self.client.post(self.url, data=self.payload, format="json")
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(AppointmentModel.objects.filter(slot_id=self.slot.id).count(), 1)
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+    def test_book_appointment_query_count(self):
+        """
+        A booking costs one conditional UPDATE, one slot+doctor SELECT, the appointment,
+        outbox and reminder-event INSERTs, plus the savepoint pair of the booking transaction.
+        The dashboard projection adds an UPDATE each for the reserved slot and the new appointment.
+        """
+        call_command("rebuild_dashboard", stdout=StringIO())
+        with self.assertNumQueries(9):
+            response = self.client.post(self.url, data=self.payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+class BookAppointmentAsyncAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = Doctor.objects.create(name="Dr. Ahmed")
+
+    def setUp(self):
+        self.slot = Slot.objects.create(doctor=self.doctor, time=now() + timedelta(days=1), cost=100.00)
+        self.url = reverse("book-appointment-async")
+        self.payload = {
+            "slot_id": str(self.slot.id),
+            "patient_id": str(uuid.uuid4()),
+            "patient_name": "Alice",
+        }
+
+    async def test_book_appointment_async(self):
+        response = await self.async_client.post(self.url, data=self.payload, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["patient_name"], "Alice")
+
+        await self.slot.arefresh_from_db()
+        self.assertTrue(self.slot.is_reserved)
+        self.assertTrue(await AppointmentModel.objects.filter(slot_id=self.slot.id).aexists())
+
+        self.assertEqual(await OutboxMessage.objects.acount(), 1)
+
+        response = await self.async_client.post(self.url, data=self.payload, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["detail"], "Slot is already booked or invalid.")
+
+    async def test_failed_async_booking_leaves_the_slot_free(self):
+        # The reservation shares the insert's transaction, so it rolls back with it
+        with patch.object(AppointmentRepository, "create", side_effect=RuntimeError("insert failed")):
+            with self.assertRaises(RuntimeError):
+                await self.async_client.post(self.url, data=self.payload, content_type="application/json")
+
+        await self.slot.arefresh_from_db()
+        self.assertFalse(self.slot.is_reserved)
+        self.assertFalse(await AppointmentModel.objects.aexists())
+
+    async def test_book_appointment_async_invalid_payload(self):
+        response = await self.async_client.post(self.url, data={"slot_id": "x"}, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("patient_id", response.json())
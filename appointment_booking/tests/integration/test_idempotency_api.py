@@ -0,0 +1,80 @@
+import uuid
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from appointment_booking.infrastructure.models import AppointmentModel, IdempotencyKeyModel
+from appointment_booking.infrastructure.repositories.idempotency_repository import IdempotencyRepository
+from doctor_availability.models import Doctor, Slot
+
+
+class IdempotentBookingAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.doctor = Doctor.objects.create(name="Dr. Ahmed")
+        self.slot = Slot.objects.create(doctor=self.doctor, time=now() + timedelta(days=1), cost=100)
+        self.url = reverse("book-appointment")
+        self.payload = {"slot_id": str(self.slot.id), "patient_id": str(uuid.uuid4()), "patient_name": "Alice"}
+
+    def book(self, payload=None, key="retry-1"):
+        return self.client.post(self.url, payload or self.payload, format="json", HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retry_replays_the_first_response(self):
+        first = self.book()
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+
+        with patch(
+            "appointment_booking.application.use_cases.book_appointment_use_case.BookAppointmentUseCase.execute"
+        ) as execute:
+            retry = self.book()
+        execute.assert_not_called()
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(AppointmentModel.objects.count(), 1)
+
+    def test_key_reused_for_another_request_is_rejected(self):
+        self.book()
+        other_slot = Slot.objects.create(doctor=self.doctor, time=now() + timedelta(days=2), cost=100)
+        response = self.book({**self.payload, "slot_id": str(other_slot.id)})
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        other_slot.refresh_from_db()
+        self.assertFalse(other_slot.is_reserved)
+
+    def test_failed_request_frees_the_key(self):
+        with patch(
+            "appointment_booking.application.use_cases.book_appointment_use_case.BookAppointmentUseCase.execute",
+            side_effect=RuntimeError("boom"),
+        ):
+            with self.assertRaises(RuntimeError):
+                self.book()
+        self.assertFalse(IdempotencyKeyModel.objects.exists())
+        self.assertEqual(self.book().status_code, status.HTTP_201_CREATED)
+
+    def test_requests_without_a_key_are_not_recorded(self):
+        self.client.post(self.url, self.payload, format="json")
+        self.assertFalse(IdempotencyKeyModel.objects.exists())
+        self.assertEqual(self.book(key="").status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_a_key_can_be_claimed_once(self):
+        repository = IdempotencyRepository()
+        expires_at = now() + timedelta(minutes=1)
+        self.assertTrue(repository.claim("retry-1", "a" * 64, expires_at))
+        self.assertFalse(repository.claim("retry-1", "a" * 64, expires_at))
+
+    @override_settings(IDEMPOTENCY_KEY_TTL=-1)
+    def test_expired_keys_can_be_reused_and_are_purged(self):
+        self.book()
+        second_slot = Slot.objects.create(doctor=self.doctor, time=now() + timedelta(days=2), cost=100)
+        response = self.book({**self.payload, "slot_id": str(second_slot.id)})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        call_command("purge_idempotency_keys", stdout=StringIO())
+        self.assertFalse(IdempotencyKeyModel.objects.exists())
@@ -0,0 +1,68 @@
+import uuid
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from appointment_booking.infrastructure.models import AppointmentModel
+from doctor_availability.models import Doctor, Slot
+
+
+class SlotHoldAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.doctor = Doctor.objects.create(name="Dr. Ahmed")
+        self.slot = Slot.objects.create(doctor=self.doctor, time=now() + timedelta(days=1), cost=100)
+
+    def hold(self):
+        return self.client.post(reverse("hold-slot"), {"slot_id": str(self.slot.id)}, format="json")
+
+    def confirm(self, hold_token):
+        return self.client.post(
+            reverse("confirm-hold"),
+            {
+                "slot_id": str(self.slot.id),
+                "hold_token": hold_token,
+                "patient_id": str(uuid.uuid4()),
+                "patient_name": "Alice",
+            },
+            format="json",
+        )
+
+    def test_hold_then_confirm_books_the_slot(self):
+        response = self.hold()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn("expires_at", response.data)
+
+        # While held the slot cannot be booked or held by anyone else
+        self.assertEqual(self.hold().status_code, status.HTTP_400_BAD_REQUEST)
+        booking = self.client.post(
+            reverse("book-appointment"),
+            {"slot_id": str(self.slot.id), "patient_id": str(uuid.uuid4()), "patient_name": "Bob"},
+            format="json",
+        )
+        self.assertEqual(booking.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(self.confirm(str(uuid.uuid4())).status_code, status.HTTP_400_BAD_REQUEST)
+        confirmed = self.confirm(response.data["hold_token"])
+        self.assertEqual(confirmed.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(AppointmentModel.objects.get(id=confirmed.data["id"]).slot_id, self.slot.id)
+
+        # A hold confirms once
+        self.assertEqual(self.confirm(response.data["hold_token"]).status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(SLOT_HOLD_TTL=-1)
+    def test_expired_hold_cannot_be_confirmed_and_is_swept(self):
+        hold_token = self.hold().data["hold_token"]
+        self.assertEqual(self.confirm(hold_token).status_code, status.HTTP_400_BAD_REQUEST)
+
+        call_command("release_expired_holds", "--once", stdout=StringIO())
+        self.slot.refresh_from_db()
+        self.assertFalse(self.slot.is_reserved)
+        self.assertIsNone(self.slot.hold_token)
+        self.assertFalse(AppointmentModel.objects.exists())
@@ -0,0 +1,195 @@
+import uuid
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.timezone import localdate, now, timedelta
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from appointment_booking.infrastructure.models import AppointmentModel, WaitlistEntryModel
+from appointment_confirmation.models import OutboxMessage
+from appointment_management.adapters.outbound.appointment_repository_adapter import AppointmentRepositoryAdapter
+from doctor_availability.models import Doctor, Slot
+from doctor_availability.services import SlotService
+
+
+class WaitlistAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.doctor = Doctor.objects.create(name="Dr. Ahmed")
+        self.slot_time = now().replace(hour=12, minute=0, second=0, microsecond=0) + timedelta(days=2)
+        self.day = localdate(self.slot_time)
+        self.url = reverse("join-waitlist")
+
+    def join(self, patient_name, patient_id=None):
+        return self.client.post(
+            self.url,
+            {
+                "doctor_id": str(self.doctor.id),
+                "day": self.day.isoformat(),
+                "patient_id": str(patient_id or uuid.uuid4()),
+                "patient_name": patient_name,
+            },
+            format="json",
+        )
+
+    def book(self, slot):
+        response = self.client.post(
+            reverse("book-appointment"),
+            {"slot_id": str(slot.id), "patient_id": str(uuid.uuid4()), "patient_name": "Booked"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data["id"]
+
+    def test_joining_while_a_slot_is_free_books_it_right_away(self):
+        slot = Slot.objects.create(doctor=self.doctor, time=self.slot_time, cost=100)
+
+        response = self.join("Alice")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["status"], "promoted")
+        appointment = AppointmentModel.objects.get(id=response.data["appointment_id"])
+        self.assertEqual((appointment.slot_id, appointment.patient_name), (slot.id, "Alice"))
+
+    def test_patient_registers_once(self):
+        patient_id = uuid.uuid4()
+        first = self.join("Alice", patient_id)
+        second = self.join("Alice", patient_id)
+        self.assertEqual(first.data["status"], "waiting")
+        self.assertEqual(first.data["id"], second.data["id"])
+        self.assertEqual(WaitlistEntryModel.objects.count(), 1)
+
+    def test_second_cancel_after_a_waitlist_rebook_keeps_the_new_booking(self):
+        slot = Slot.objects.create(doctor=self.doctor, time=self.slot_time, cost=100)
+        appointment_id = self.book(slot)
+        waiter = self.join("Alice").data
+        url = reverse("cancel-appointment", args=[appointment_id])
+
+        self.assertEqual(self.client.post(url).status_code, status.HTTP_200_OK)
+        waiter = self.client.get(reverse("waitlist-entry", args=[waiter["id"]])).data
+        self.assertEqual(waiter["status"], "promoted")
+
+        self.assertEqual(self.client.post(url).status_code, status.HTTP_400_BAD_REQUEST)
+        slot.refresh_from_db()
+        self.assertTrue(slot.is_reserved)
+        self.assertFalse(AppointmentModel.objects.get(id=waiter["appointment_id"]).is_canceled)
+
+    def test_racing_cancel_that_read_the_appointment_open_keeps_the_new_booking(self):
+        # Replays the second of two concurrent cancels on storage without row locks: it read the
+        # appointment as open before the first one canceled it and the slot was rebooked
+        slot = Slot.objects.create(doctor=self.doctor, time=self.slot_time, cost=100)
+        appointment_id = self.book(slot)
+        waiter = self.join("Alice").data
+        repository = AppointmentRepositoryAdapter()
+        stale = repository.find_many_for_update([uuid.UUID(appointment_id)])
+        url = reverse("cancel-appointment", args=[appointment_id])
+        self.assertEqual(self.client.post(url).status_code, status.HTTP_200_OK)
+
+        with (
+            patch.object(AppointmentRepositoryAdapter, "find_many_for_update", return_value=stale),
+            patch.object(AppointmentRepositoryAdapter, "find_by_id", side_effect=stale.get),
+        ):
+            self.assertEqual(self.client.post(url).status_code, status.HTTP_400_BAD_REQUEST)
+        slot.refresh_from_db()
+        self.assertTrue(slot.is_reserved)
+        waiter = self.client.get(reverse("waitlist-entry", args=[waiter["id"]])).data
+        self.assertFalse(AppointmentModel.objects.get(id=waiter["appointment_id"]).is_canceled)
+
+    def test_released_slot_goes_to_the_first_waiter(self):
+        slot = Slot.objects.create(doctor=self.doctor, time=self.slot_time, cost=100)
+        appointment_id = self.book(slot)
+        first = self.join("Alice").data
+        second = self.join("Bob").data
+        OutboxMessage.objects.all().delete()
+
+        response = self.client.post(reverse("cancel-appointment", args=[appointment_id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        first = self.client.get(reverse("waitlist-entry", args=[first["id"]])).data
+        second = self.client.get(reverse("waitlist-entry", args=[second["id"]])).data
+        self.assertEqual(first["status"], "promoted")
+        self.assertEqual(second["status"], "waiting")
+        slot.refresh_from_db()
+        self.assertTrue(slot.is_reserved)
+        self.assertEqual(AppointmentModel.objects.get(id=first["appointment_id"]).slot_id, slot.id)
+
+        # The promoted patient is notified through the usual booking confirmation
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.payload["patient_name"], "Alice")
+
+    def test_past_slot_released_with_a_future_one_does_not_empty_the_queue(self):
+        # Clock at noon of the waitlist day: one booked slot earlier that day, one later
+        slots = []
+        for hours in (-1, 1):
+            slot = Slot.objects.create(
+                doctor=self.doctor, time=self.slot_time + timedelta(hours=hours), cost=100, is_reserved=True
+            )
+            AppointmentModel.objects.create(
+                slot_id=slot.id,
+                patient_id=uuid.uuid4(),
+                patient_name="Booked",
+                slot_time=slot.time,
+                doctor_id=self.doctor.id,
+            )
+            slots.append(slot)
+        past, future = slots
+
+        with patch("django.utils.timezone.now", return_value=self.slot_time):
+            entry = self.join("Alice").data
+            self.assertEqual(entry["status"], "waiting")
+            response = self.client.post(
+                reverse("bulk-cancel-appointments"),
+                {"appointment_ids": [str(a.id) for a in AppointmentModel.objects.all()]},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        entry = self.client.get(reverse("waitlist-entry", args=[entry["id"]])).data
+        self.assertEqual(entry["status"], "promoted")
+        self.assertEqual(AppointmentModel.objects.get(id=entry["appointment_id"]).slot_id, future.id)
+        past.refresh_from_db()
+        self.assertFalse(past.is_reserved)
+
+    def test_new_slots_go_to_waiters(self):
+        entry = self.join("Alice").data
+
+        SlotService.create_slot(self.doctor.id, self.slot_time, 100)
+        SlotService.create_slot(self.doctor.id, self.slot_time + timedelta(hours=1), 100)
+
+        self.assertEqual(WaitlistEntryModel.objects.get(id=entry["id"]).status, WaitlistEntryModel.PROMOTED)
+        self.assertEqual(Slot.objects.filter(is_reserved=True).count(), 1)
+
+    def test_leaving_the_waitlist(self):
+        entry = self.join("Alice").data
+        url = reverse("waitlist-entry", args=[entry["id"]])
+
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_400_BAD_REQUEST)
+        SlotService.create_slot(self.doctor.id, self.slot_time, 100)
+        self.assertFalse(Slot.objects.filter(is_reserved=True).exists())
+        self.assertEqual(self.client.get(reverse("waitlist-entry", args=[999])).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_join_validation(self):
+        response = self.client.post(
+            self.url,
+            {
+                "doctor_id": str(uuid.uuid4()),
+                "day": (localdate() - timedelta(days=1)).isoformat(),
+                "patient_id": str(uuid.uuid4()),
+                "patient_name": "Alice",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("doctor_id", response.data)
+        self.assertIn("day", response.data)
+
+    def test_head_of_queue_lookup_uses_the_waiting_index(self):
+        plan = (
+            WaitlistEntryModel.objects.filter(doctor_id=self.doctor.id, day=self.day, status=WaitlistEntryModel.WAITING)
+            .order_by("id")[:1]
+            .explain()
+        )
+        self.assertIn("waitlist_waiting_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
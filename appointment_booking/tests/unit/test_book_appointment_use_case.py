@@ -1,11 +1,12 @@
+import asyncio
 import unittest
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from appointment_booking.application.use_cases.book_appointment_use_case import BookAppointmentUseCase
-from appointment_booking.domain.entities import Appointment
 
 
+@patch("appointment_booking.application.use_cases.book_appointment_use_case.transaction", MagicMock())
 class TestBookAppointmentUseCase(unittest.TestCase):
     def setUp(self):
         self.mock_repo = MagicMock()
@@ -14,33 +15,65 @@ class TestBookAppointmentUseCase(unittest.TestCase):
             appointment_repository=self.mock_repo, notification_gateway=self.mock_gateway
         )
 
-    def test_slot_already_booked(self):
-        # Setup
+    @patch("appointment_booking.application.use_cases.book_appointment_use_case.SlotService")
+    def test_slot_already_booked(self, mock_slot_service):
+        # Setup: the conditional UPDATE affects no rows
         slot_id = uuid.uuid4()
-        self.mock_repo.find_by_slot_id.return_value = Appointment(
-            slot_id=slot_id,
-            patient_id=uuid.uuid4(),
-            patient_name="Existing Patient",
-        )
+        mock_slot_service.reserve_slot.return_value = None
 
         # Act
         result = self.use_case.execute(slot_id, uuid.uuid4(), "New Patient")
 
         # Assert
         self.assertIsNone(result)
+        self.mock_repo.create.assert_not_called()
+        self.mock_gateway.send_appointment_confirmation.assert_not_called()
 
-    def test_slot_is_available(self):
+    @patch("appointment_booking.application.use_cases.book_appointment_use_case.SlotService")
+    def test_slot_is_available(self, mock_slot_service):
         slot_id = uuid.uuid4()
-        self.mock_repo.find_by_slot_id.return_value = None
-        # Mock SlotService as well
-        from doctor_availability.services import SlotService
-
-        SlotService.get_slot_by_id = MagicMock(return_value=MagicMock(is_reserved=False))
-        SlotService.reserve_slot = MagicMock()
+        mock_slot_service.reserve_slot.return_value = MagicMock(is_reserved=True)
 
-        self.mock_repo.save.side_effect = lambda app: app  # Return the same appointment object
+        self.mock_repo.create.side_effect = lambda app: app  # Return the same appointment object
 
         result = self.use_case.execute(slot_id, uuid.uuid4(), "John Doe")
         self.assertIsNotNone(result)
         self.assertEqual(result.patient_name, "John Doe")
-        SlotService.reserve_slot.assert_called_once_with(slot_id)
+        mock_slot_service.reserve_slot.assert_called_once_with(slot_id)
+        self.mock_gateway.send_appointment_confirmation.assert_called_once()
+
+    @patch("appointment_booking.application.use_cases.book_appointment_use_case.SlotService")
+    def test_aexecute_reserves_and_inserts_in_one_transaction(self, mock_slot_service):
+        # The sync path on a worker thread: a failed insert rolls the reservation back with it
+        mock_slot_service.reserve_slot.return_value = MagicMock()
+        self.mock_repo.create.side_effect = RuntimeError("insert failed")
+
+        with patch.object(self.use_case, "execute", wraps=self.use_case.execute) as execute:
+            with self.assertRaises(RuntimeError):
+                asyncio.run(self.use_case.aexecute(uuid.uuid4(), uuid.uuid4(), "John Doe"))
+        execute.assert_called_once()
+        mock_slot_service.reserve_slot.assert_called_once()
+        self.mock_gateway.send_appointment_confirmation.assert_not_called()
+
+    @patch("appointment_booking.application.use_cases.book_appointment_use_case.SlotService")
+    def test_execute_batch_reports_unavailable_slots(self, mock_slot_service):
+        taken = uuid.uuid4()
+        mock_slot_service.reserve_slots.return_value = ([], [taken])
+
+        result = self.use_case.execute_batch([taken], uuid.uuid4(), "John Doe")
+        self.assertEqual(result.appointments, [])
+        self.assertEqual(result.unavailable, [taken])
+        self.mock_repo.create_many.assert_not_called()
+        self.mock_gateway.send_series_confirmation.assert_not_called()
+
+    @patch("appointment_booking.application.use_cases.book_appointment_use_case.SlotService")
+    def test_execute_batch_sends_one_confirmation(self, mock_slot_service):
+        slots = [MagicMock(id=uuid.uuid4()), MagicMock(id=uuid.uuid4())]
+        mock_slot_service.reserve_slots.return_value = (slots, [])
+        self.mock_repo.create_many.side_effect = lambda appointments: appointments
+
+        result = self.use_case.execute_batch([slot.id for slot in slots], uuid.uuid4(), "John Doe", False)
+        self.assertEqual([appointment.slot_id for appointment in result.appointments], [slot.id for slot in slots])
+        mock_slot_service.reserve_slots.assert_called_once_with([slot.id for slot in slots], all_or_nothing=False)
+        self.mock_gateway.send_series_confirmation.assert_called_once()
+        self.assertEqual(len(self.mock_gateway.send_series_confirmation.call_args.kwargs["appointments"]), 2)
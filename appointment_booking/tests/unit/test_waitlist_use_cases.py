@@ -0,0 +1,60 @@
+import unittest
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from appointment_booking.application.use_cases.waitlist_use_cases import NOBODY_WAITING, PromoteWaitlistUseCase
+from appointment_booking.domain.entities import Appointment, WaitlistEntry
+
+
+@patch("appointment_booking.application.use_cases.waitlist_use_cases.transaction", MagicMock())
+class TestPromoteWaitlistUseCase(unittest.TestCase):
+    def setUp(self):
+        self.mock_waitlist = MagicMock()
+        self.mock_booking = MagicMock()
+        self.use_case = PromoteWaitlistUseCase(
+            waitlist_repository=self.mock_waitlist, book_appointment=self.mock_booking
+        )
+        self.doctor_id = uuid.uuid4()
+        self.slot_time = datetime.now(timezone.utc) + timedelta(days=1)
+
+    def entry(self, entry_id):
+        return WaitlistEntry(
+            id=entry_id, doctor_id=self.doctor_id, day=date.today(), patient_id=uuid.uuid4(), patient_name="P"
+        )
+
+    def test_books_the_first_waiter(self):
+        first = self.entry(1)
+        self.mock_waitlist.first_waiting.return_value = first
+        self.mock_booking.execute.return_value = Appointment(patient_id=first.patient_id)
+        self.mock_waitlist.promote.return_value = True
+
+        slot_id = uuid.uuid4()
+        appointment = self.use_case.execute(slot_id, self.doctor_id, self.slot_time)
+        self.assertEqual(appointment.patient_id, first.patient_id)
+        self.mock_booking.execute.assert_called_once_with(
+            slot_id=slot_id, patient_id=first.patient_id, patient_name="P"
+        )
+        self.mock_waitlist.promote.assert_called_once_with(1, appointment.id)
+
+    def test_moves_on_when_a_concurrent_promotion_took_the_waiter(self):
+        self.mock_waitlist.first_waiting.side_effect = [self.entry(1), self.entry(2)]
+        self.mock_booking.execute.side_effect = lambda **kwargs: Appointment(**kwargs)
+        self.mock_waitlist.promote.side_effect = [False, True]
+
+        self.assertIsNotNone(self.use_case.execute(uuid.uuid4(), self.doctor_id, self.slot_time))
+        self.assertEqual([c.args[0] for c in self.mock_waitlist.promote.call_args_list], [1, 2])
+
+    def test_gives_up_when_the_slot_is_taken_or_nobody_waits(self):
+        self.mock_waitlist.first_waiting.return_value = self.entry(1)
+        self.mock_booking.execute.return_value = None
+        self.assertIsNone(self.use_case.execute(uuid.uuid4(), self.doctor_id, self.slot_time))
+        self.mock_waitlist.promote.assert_not_called()
+
+        # An empty queue is told apart from a slot that cannot be booked
+        self.mock_waitlist.first_waiting.return_value = None
+        self.assertIs(self.use_case.execute(uuid.uuid4(), self.doctor_id, self.slot_time), NOBODY_WAITING)
+
+    def test_past_slots_are_not_offered(self):
+        self.assertIsNone(self.use_case.execute(uuid.uuid4(), self.doctor_id, self.slot_time - timedelta(days=2)))
+        self.mock_waitlist.first_waiting.assert_not_called()
@@ -1,7 +1,21 @@
 from django.urls import path
 
-from appointment_booking.interface_adapters.controllers import BookAppointmentController
+from appointment_booking.interface_adapters.controllers import (
+    BookAppointmentController,
+    BookAppointmentsController,
+    ConfirmHoldController,
+    HoldSlotController,
+    WaitlistController,
+    WaitlistEntryController,
+    book_appointment_async,
+)
 
 urlpatterns = [
     path("book/", BookAppointmentController.as_view(), name="book-appointment"),
+    path("book/batch/", BookAppointmentsController.as_view(), name="book-appointments"),
+    path("book/async/", book_appointment_async, name="book-appointment-async"),
+    path("hold/", HoldSlotController.as_view(), name="hold-slot"),
+    path("hold/confirm/", ConfirmHoldController.as_view(), name="confirm-hold"),
+    path("waitlist/", WaitlistController.as_view(), name="join-waitlist"),
+    path("waitlist/<int:entry_id>/", WaitlistEntryController.as_view(), name="waitlist-entry"),
 ]
@@ -0,0 +1,115 @@
+"""
+Per-destination circuit breakers for the outbox worker.
+
+After ``failure_threshold`` consecutive failures a destination's breaker opens and the worker
+stops calling it, deferring its messages instead of burning their retry attempts. Once
+``reset_timeout`` seconds have passed one trial chunk is let through (half-open): success
+closes the breaker, failure opens it for another period.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30  # seconds
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        Return True if a call may go out now. In the half-open state only one trial is allowed.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def retry_after(self) -> float:
+        """
+        Seconds until an open breaker lets a trial call through (0 when closed).
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Circuit for %s closed", self.name)
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                logger.warning("Circuit for %s opened after %d failure(s)", self.name, self._failures)
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+
+class CircuitBreakerRegistry:
+    """
+    Lazily creates one breaker per destination, configured from settings.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, destination: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(destination)
+            if breaker is None:
+                breaker = self._breakers[destination] = CircuitBreaker(
+                    destination,
+                    failure_threshold=getattr(
+                        settings, "CONFIRMATION_BREAKER_FAILURE_THRESHOLD", DEFAULT_FAILURE_THRESHOLD
+                    ),
+                    reset_timeout=getattr(settings, "CONFIRMATION_BREAKER_RESET_TIMEOUT", DEFAULT_RESET_TIMEOUT),
+                )
+            return breaker
+
+    def reset(self) -> None:
+        with self._lock:
+            self._breakers.clear()
+
+
+breakers = CircuitBreakerRegistry()
@@ -1,29 +1,34 @@
-import logging
 from datetime import datetime
+from typing import Sequence, Union
 
-logger = logging.getLogger(__name__)
+from .transports import ConfirmationMessage, SeriesConfirmationMessage, get_transport
 
 
 def send_appointment_confirmation(
     appointment_id: str, patient_name: str, doctor_name: str, appointment_time: datetime, **kwargs
 ) -> None:
     """
-    Sends a confirmation notification (logs a message) to both the patient and the doctor.
-    This is a minimalistic approach, as required by the 'simplest architecture possible'.
+    Sends a confirmation notification to both the patient and the doctor.
+    This is a minimalistic approach, as required by the 'simplest architecture possible':
+    delivery is left to the transport named by the CONFIRMATION_TRANSPORT setting
+    (by default it just logs the message).
     """
-    # For the sake of this assessment, we'll just log a message.
-    # In a real-world system, you'd integrate with an email service, SMS gateway, etc.
-
-    notification_message = (
-        f"Appointment Confirmation:\n"
-        f"Appointment ID: {appointment_id}\n"
-        f"Patient Name: {patient_name}\n"
-        f"Doctor Name: {doctor_name}\n"
-        f"Appointment Time: {appointment_time.isoformat()}\n"
+    send_appointment_confirmations(
+        [
+            ConfirmationMessage(
+                appointment_id=appointment_id,
+                patient_name=patient_name,
+                doctor_name=doctor_name,
+                appointment_time=appointment_time,
+            )
+        ]
     )
 
-    # Log the confirmation message
-    logger.info(notification_message)
 
-    # If desired, also "notify" the console or do more advanced steps here.
-    # For real emailing, integrate with an email API or Celery tasks, etc.
+def send_appointment_confirmations(
+    messages: Sequence[Union[ConfirmationMessage, SeriesConfirmationMessage]],
+) -> int:
+    """
+    Sends a batch of confirmations, over a single connection where the transport has one.
+    """
+    return get_transport().send_messages(messages)
@@ -0,0 +1,42 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from appointment_confirmation import outbox
+
+
+class Command(BaseCommand):
+    help = "Dispatch queued appointment confirmations from the outbox."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Rows claimed per round trip.")
+        parser.add_argument("--workers", type=int, default=8, help="Threads sending confirmations.")
+        parser.add_argument(
+            "--chunk-size", type=int, default=outbox.DEFAULT_CHUNK_SIZE, help="Messages sent per connection checkout."
+        )
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to sleep when idle.")
+        parser.add_argument(
+            "--lease", type=int, default=outbox.DEFAULT_LEASE_SECONDS, help="Seconds before a claim is abandoned."
+        )
+        parser.add_argument("--once", action="store_true", help="Exit once the outbox is drained.")
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+        with ThreadPoolExecutor(max_workers=options["workers"], thread_name_prefix="outbox") as executor:
+            try:
+                while True:
+                    sent, failed = outbox.process_batch(
+                        executor, options["batch_size"], options["lease"], options["chunk_size"]
+                    )
+                    total_sent += sent
+                    total_failed += failed
+                    if sent or failed:
+                        continue
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+            except KeyboardInterrupt:
+                pass
+
+        self.stdout.write(self.style.SUCCESS(f"Sent {total_sent} confirmation(s), {total_failed} failed."))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from appointment_confirmation import outbox
+from appointment_confirmation.models import DeadLetterMessage
+
+
+class Command(BaseCommand):
+    help = "Re-queue dead-lettered confirmations in the outbox with a fresh attempt budget."
+
+    def add_arguments(self, parser):
+        parser.add_argument("ids", nargs="*", type=int, help="Dead letters to replay.")
+        parser.add_argument("--all", action="store_true", help="Replay every dead letter.")
+        parser.add_argument("--kind", help="Only replay dead letters of this kind.")
+        parser.add_argument("--destination", help="Only replay dead letters bound for this destination.")
+
+    def handle(self, *args, **options):
+        if not options["ids"] and not options["all"]:
+            raise CommandError("Pass dead-letter ids or --all.")
+
+        dead_letters = DeadLetterMessage.objects.all()
+        if options["ids"]:
+            dead_letters = dead_letters.filter(id__in=options["ids"])
+        if options["kind"]:
+            dead_letters = dead_letters.filter(kind=options["kind"])
+        if options["destination"]:
+            dead_letters = dead_letters.filter(destination=options["destination"])
+
+        replayed = outbox.replay_dead_letters(dead_letters)
+        self.stdout.write(self.style.SUCCESS(f"Replayed {replayed} dead letter(s)."))
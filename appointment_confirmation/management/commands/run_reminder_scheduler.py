@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from appointment_confirmation.reminders import ReminderScheduler
+
+
+class Command(BaseCommand):
+    help = "Queue T-24h and T-1h appointment reminders as they fall due."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tick", type=float, default=1.0, help="Longest sleep between ticks, in seconds.")
+        parser.add_argument(
+            "--prune-every", type=int, default=3600, help="Seconds between deletions of old consumed events."
+        )
+
+    def handle(self, *args, **options):
+        scheduler = ReminderScheduler()
+        loaded = scheduler.start()
+        self.stdout.write(f"Loaded {loaded} reminder(s).")
+
+        last_prune = time.monotonic()
+        try:
+            while True:
+                queued = scheduler.run_once()
+                if queued:
+                    self.stdout.write(f"Queued {queued} reminder(s).")
+                if time.monotonic() - last_prune >= options["prune_every"]:
+                    scheduler.prune_events()
+                    last_prune = time.monotonic()
+
+                # New events can arrive at any time, so never sleep past one tick
+                wait = scheduler.seconds_until_next()
+                time.sleep(options["tick"] if wait is None else min(wait, options["tick"]))
+        except KeyboardInterrupt:
+            pass
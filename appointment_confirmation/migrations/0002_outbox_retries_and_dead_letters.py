@@ -0,0 +1,56 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:34
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def retry_failed_messages(apps, schema_editor):
+    # The "failed" status is gone: give those messages a fresh run under the retry policy
+    OutboxMessage = apps.get_model("appointment_confirmation", "OutboxMessage")
+    OutboxMessage.objects.filter(status="failed").update(status="pending", attempts=0, claim_token=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("appointment_confirmation", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeadLetterMessage",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("kind", models.CharField(max_length=64)),
+                ("payload", models.JSONField()),
+                ("destination", models.CharField(blank=True, default="", max_length=255)),
+                ("attempts", models.PositiveIntegerField()),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField()),
+                ("failed_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name="outboxmessage",
+            name="outbox_status_id_idx",
+        ),
+        migrations.AddField(
+            model_name="outboxmessage",
+            name="next_attempt_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(retry_failed_messages, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="outboxmessage",
+            name="status",
+            field=models.CharField(
+                choices=[("pending", "Pending"), ("processing", "Processing"), ("done", "Done")],
+                default="pending",
+                max_length=16,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="outboxmessage",
+            index=models.Index(fields=["status", "next_attempt_at", "id"], name="outbox_status_due_idx"),
+        ),
+    ]
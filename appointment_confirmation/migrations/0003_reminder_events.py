@@ -0,0 +1,24 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:37
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("appointment_confirmation", "0002_outbox_retries_and_dead_letters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReminderEvent",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("appointment_id", models.UUIDField()),
+                ("action", models.CharField(choices=[("booked", "Booked"), ("canceled", "Canceled")], max_length=16)),
+                ("payload", models.JSONField(blank=True, default=dict)),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
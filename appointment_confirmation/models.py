@@ -0,0 +1,78 @@
+from django.db import models
+from django.utils.timezone import now
+
+
+class OutboxMessage(models.Model):
+    """
+    A confirmation waiting to be sent, written in the same transaction as the booking
+    and dispatched later by the ``process_outbox`` worker.
+    """
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (PROCESSING, "Processing"),
+        (DONE, "Done"),
+    ]
+
+    kind = models.CharField(max_length=64)
+    payload = models.JSONField()
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    # Not claimed before this moment; pushed back after each failed attempt
+    next_attempt_at = models.DateTimeField(default=now)
+    claim_token = models.UUIDField(null=True, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(default=now)
+
+    class Meta:
+        indexes = [
+            # Workers claim the pending (or abandoned) rows that are due, oldest first
+            models.Index(fields=["status", "next_attempt_at", "id"], name="outbox_status_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"OutboxMessage({self.kind}, {self.status})"
+
+
+class DeadLetterMessage(models.Model):
+    """
+    An outbox message that ran out of delivery attempts; ``replay_dead_letters`` re-queues it.
+    """
+
+    kind = models.CharField(max_length=64)
+    payload = models.JSONField()
+    destination = models.CharField(max_length=255, blank=True, default="")
+    attempts = models.PositiveIntegerField()
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField()
+    failed_at = models.DateTimeField(default=now)
+
+    def __str__(self):
+        return f"DeadLetterMessage({self.kind}, {self.attempts} attempts)"
+
+
+class ReminderEvent(models.Model):
+    """
+    A booking or cancellation the reminder scheduler has to apply, written in the same
+    transaction as the change. The scheduler tails this table by id.
+    """
+
+    BOOKED = "booked"
+    CANCELED = "canceled"
+    ACTION_CHOICES = [
+        (BOOKED, "Booked"),
+        (CANCELED, "Canceled"),
+    ]
+
+    appointment_id = models.UUIDField()
+    action = models.CharField(max_length=16, choices=ACTION_CHOICES)
+    payload = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(default=now)
+
+    def __str__(self):
+        return f"ReminderEvent({self.action}, {self.appointment_id})"
@@ -0,0 +1,301 @@
+"""
+Transactional outbox for appointment confirmations.
+
+The booking path only inserts an ``OutboxMessage`` row inside its own transaction, so a
+confirmation exists if and only if the booking committed. The ``process_outbox`` worker
+claims rows in batches, dispatches them in chunks on a thread pool (each chunk goes out over
+one transport connection) and records the outcome.
+
+A failed message is rescheduled with jittered exponential backoff; after
+``CONFIRMATION_MAX_ATTEMPTS`` attempts it moves to the dead-letter table. While a destination's
+circuit breaker is open its messages are deferred without spending an attempt.
+"""
+
+import logging
+import random
+import uuid
+from concurrent.futures import Executor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from .circuit_breaker import breakers
+from .confirmation_service import send_appointment_confirmations
+from .models import DeadLetterMessage, OutboxMessage
+from .transports import ConfirmationMessage, SeriesConfirmationMessage, get_transport
+
+logger = logging.getLogger(__name__)
+
+APPOINTMENT_CONFIRMATION = "appointment_confirmation"
+APPOINTMENT_REMINDER = "appointment_reminder"
+APPOINTMENT_SERIES_CONFIRMATION = "appointment_series_confirmation"
+
+# A claim older than this is treated as abandoned by a crashed worker and may be taken again
+DEFAULT_LEASE_SECONDS = 300
+
+# Messages handed to the transport per call, i.e. per connection checkout
+DEFAULT_CHUNK_SIZE = 20
+
+DEFAULT_MAX_ATTEMPTS = 8
+DEFAULT_RETRY_BASE_DELAY = 2  # seconds before the second attempt, doubling afterwards
+DEFAULT_RETRY_MAX_DELAY = 3600
+
+
+def confirmation_payload(
+    appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
+) -> dict:
+    return {
+        "appointment_id": str(appointment_id),
+        "patient_name": patient_name,
+        "doctor_name": doctor_name,
+        "appointment_time": appointment_time.isoformat(),
+    }
+
+
+def enqueue_appointment_confirmation(
+    appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
+) -> OutboxMessage:
+    """
+    Queue a confirmation. Call it inside the booking transaction.
+    """
+    return OutboxMessage.objects.create(
+        kind=APPOINTMENT_CONFIRMATION,
+        payload=confirmation_payload(appointment_id, patient_name, doctor_name, appointment_time),
+    )
+
+
+def enqueue_series_confirmation(
+    patient_name: str, appointments: Sequence[Tuple[uuid.UUID, str, datetime]]
+) -> OutboxMessage:
+    """
+    Queue one confirmation for several ``(appointment_id, doctor_name, appointment_time)``
+    booked together. Call it inside the booking transaction.
+    """
+    return OutboxMessage.objects.create(
+        kind=APPOINTMENT_SERIES_CONFIRMATION,
+        payload={
+            "patient_name": patient_name,
+            "appointments": [
+                confirmation_payload(appointment_id, patient_name, doctor_name, appointment_time)
+                for appointment_id, doctor_name, appointment_time in appointments
+            ],
+        },
+    )
+
+
+def _confirmation_message(payload: dict) -> ConfirmationMessage:
+    return ConfirmationMessage(
+        appointment_id=payload["appointment_id"],
+        patient_name=payload["patient_name"],
+        doctor_name=payload["doctor_name"],
+        appointment_time=datetime.fromisoformat(payload["appointment_time"]),
+        reminder=payload.get("reminder", ""),
+    )
+
+
+def _send_confirmations(payloads: List[dict]) -> None:
+    send_appointment_confirmations([_confirmation_message(payload) for payload in payloads])
+
+
+def _send_series_confirmations(payloads: List[dict]) -> None:
+    send_appointment_confirmations(
+        [
+            SeriesConfirmationMessage(
+                patient_name=payload["patient_name"],
+                appointments=tuple(_confirmation_message(appointment) for appointment in payload["appointments"]),
+            )
+            for payload in payloads
+        ]
+    )
+
+
+def _confirmation_destination() -> str:
+    return get_transport().destination
+
+
+# Each handler delivers a list of payloads of its kind in one call
+HANDLERS: Dict[str, Callable[[List[dict]], None]] = {
+    APPOINTMENT_CONFIRMATION: _send_confirmations,
+    APPOINTMENT_REMINDER: _send_confirmations,
+    APPOINTMENT_SERIES_CONFIRMATION: _send_series_confirmations,
+}
+
+# Where each kind is delivered; failures are counted per destination by the circuit breakers
+DESTINATIONS: Dict[str, Callable[[], str]] = {
+    APPOINTMENT_CONFIRMATION: _confirmation_destination,
+    APPOINTMENT_REMINDER: _confirmation_destination,
+    APPOINTMENT_SERIES_CONFIRMATION: _confirmation_destination,
+}
+
+
+def destination_for(kind: str) -> str:
+    resolve = DESTINATIONS.get(kind)
+    return resolve() if resolve is not None else kind
+
+
+def claim_batch(batch_size: int, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> List[OutboxMessage]:
+    """
+    Claim up to ``batch_size`` of the due claimable rows for this caller, oldest first.
+
+    The claim is one conditional UPDATE stamped with a fresh token, so concurrent workers
+    never take the same row (SQLite has no ``SELECT ... FOR UPDATE SKIP LOCKED``).
+    """
+    now = timezone.now()
+    claimable = Q(status=OutboxMessage.PENDING, next_attempt_at__lte=now) | Q(
+        status=OutboxMessage.PROCESSING, claimed_at__lt=now - timedelta(seconds=lease_seconds)
+    )
+    oldest = OutboxMessage.objects.filter(claimable).order_by("next_attempt_at", "id").values("id")[:batch_size]
+    token = uuid.uuid4()
+    claimed = OutboxMessage.objects.filter(claimable, id__in=oldest).update(
+        status=OutboxMessage.PROCESSING, claim_token=token, claimed_at=now
+    )
+    if not claimed:
+        return []
+    return list(OutboxMessage.objects.filter(claim_token=token).order_by("id"))
+
+
+def dispatch(messages: List[OutboxMessage]) -> List[Optional[str]]:
+    """
+    Deliver a chunk of same-kind messages in one handler call; return one entry per message,
+    None on success or the error text on failure. If the chunk fails, its messages are retried
+    one by one to find the failing ones (delivery is at-least-once). Runs on a worker thread
+    and does not touch the database.
+    """
+    kind = messages[0].kind
+    handler = HANDLERS.get(kind)
+    if handler is None:
+        return [f"No handler for outbox message kind {kind!r}"] * len(messages)
+    try:
+        handler([message.payload for message in messages])
+    except Exception as exc:
+        if len(messages) > 1:
+            return [dispatch([message])[0] for message in messages]
+        logger.exception("Dispatching outbox message %s failed", messages[0].id)
+        return [repr(exc)]
+    return [None] * len(messages)
+
+
+def _chunks(messages: List[OutboxMessage], chunk_size: int) -> List[List[OutboxMessage]]:
+    by_kind: Dict[str, List[OutboxMessage]] = {}
+    for message in messages:
+        by_kind.setdefault(message.kind, []).append(message)
+    return [group[i : i + chunk_size] for group in by_kind.values() for i in range(0, len(group), chunk_size)]
+
+
+def mark_done(ids: List[int]) -> int:
+    if not ids:
+        return 0
+    return OutboxMessage.objects.filter(id__in=ids).update(
+        status=OutboxMessage.DONE, processed_at=timezone.now(), claim_token=None
+    )
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    Seconds to wait after the ``attempts``-th failure: exponential backoff capped at
+    ``CONFIRMATION_RETRY_MAX_DELAY``, with "equal jitter" so retries of a burst spread out.
+    """
+    base = getattr(settings, "CONFIRMATION_RETRY_BASE_DELAY", DEFAULT_RETRY_BASE_DELAY)
+    cap = getattr(settings, "CONFIRMATION_RETRY_MAX_DELAY", DEFAULT_RETRY_MAX_DELAY)
+    delay = min(cap, base * 2 ** (attempts - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def mark_failed(message: OutboxMessage, error: str, destination: str = "") -> bool:
+    """
+    Record a failed attempt: reschedule the message, or dead-letter it once it has used up
+    ``CONFIRMATION_MAX_ATTEMPTS``. Returns True if it was dead-lettered.
+    """
+    attempts = message.attempts + 1
+    if attempts < getattr(settings, "CONFIRMATION_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS):
+        OutboxMessage.objects.filter(id=message.id).update(
+            status=OutboxMessage.PENDING,
+            attempts=attempts,
+            last_error=error,
+            claim_token=None,
+            next_attempt_at=timezone.now() + timedelta(seconds=retry_delay(attempts)),
+        )
+        return False
+
+    with transaction.atomic():
+        DeadLetterMessage.objects.create(
+            kind=message.kind,
+            payload=message.payload,
+            destination=destination,
+            attempts=attempts,
+            last_error=error,
+            created_at=message.created_at,
+        )
+        OutboxMessage.objects.filter(id=message.id).delete()
+    logger.error("Outbox message %s dead-lettered after %d attempts: %s", message.id, attempts, error)
+    return True
+
+
+def defer(messages: List[OutboxMessage], seconds: float) -> int:
+    """
+    Hand claimed messages back without counting an attempt (e.g. while a circuit is open).
+    """
+    return OutboxMessage.objects.filter(id__in=[message.id for message in messages]).update(
+        status=OutboxMessage.PENDING, claim_token=None, next_attempt_at=timezone.now() + timedelta(seconds=seconds)
+    )
+
+
+def process_batch(
+    executor: Executor,
+    batch_size: int,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[int, int]:
+    """
+    Claim one batch, dispatch it in chunks on ``executor`` and record the outcomes.
+    Chunks bound for a destination whose circuit is open are deferred, not sent.
+    Returns ``(sent, failed)``; ``(0, 0)`` means nothing was attempted.
+    """
+    messages = claim_batch(batch_size, lease_seconds)
+    if not messages:
+        return 0, 0
+
+    to_send, destinations = [], {}
+    for chunk in _chunks(messages, chunk_size):
+        kind = chunk[0].kind
+        destination = destinations.setdefault(kind, destination_for(kind))
+        breaker = breakers.get(destination)
+        if breaker.allow():
+            to_send.append(chunk)
+        else:
+            defer(chunk, breaker.retry_after())
+
+    sent, failed = [], 0
+    for chunk, errors in zip(to_send, executor.map(dispatch, to_send)):
+        destination = destinations[chunk[0].kind]
+        breaker = breakers.get(destination)
+        for message, error in zip(chunk, errors):
+            if error is None:
+                sent.append(message.id)
+                breaker.record_success()
+            else:
+                mark_failed(message, error, destination)
+                breaker.record_failure()
+                failed += 1
+    mark_done(sent)
+    return len(sent), failed
+
+
+def replay_dead_letters(dead_letters: QuerySet) -> int:
+    """
+    Move ``dead_letters`` back into the outbox with a fresh attempt budget.
+    """
+    with transaction.atomic():
+        letters = list(dead_letters.select_for_update())
+        OutboxMessage.objects.bulk_create(
+            [
+                OutboxMessage(kind=letter.kind, payload=letter.payload, created_at=letter.created_at)
+                for letter in letters
+            ]
+        )
+        DeadLetterMessage.objects.filter(id__in=[letter.id for letter in letters]).delete()
+    return len(letters)
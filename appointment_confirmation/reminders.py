@@ -0,0 +1,339 @@
+"""
+T-24h / T-1h appointment reminders.
+
+``run_reminder_scheduler`` is a long-running process that loads the upcoming appointments
+once into a ``ReminderHeap`` (a min-heap keyed on when each reminder is due) and then keeps
+it current by tailing ``ReminderEvent`` rows, which booking and cancellation write in their
+own transactions. Each tick pops only the reminders that are due and queues them in the
+outbox, so the worker delivers them through the configured transport with the usual retries.
+
+Run a single scheduler: two would queue every reminder twice.
+"""
+
+import heapq
+import itertools
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from appointment_booking.infrastructure.models import AppointmentModel
+from doctor_availability.models import Doctor
+
+from . import outbox
+from .models import OutboxMessage, ReminderEvent
+
+logger = logging.getLogger(__name__)
+
+# Label -> how long before the appointment the reminder goes out
+REMINDER_OFFSETS: Dict[str, timedelta] = {
+    "24h": timedelta(hours=24),
+    "1h": timedelta(hours=1),
+}
+
+# Events read per query while catching up
+EVENT_BATCH_SIZE = 1000
+
+# Consumed events are kept this long for inspection, then pruned by the scheduler
+EVENT_RETENTION = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class Reminder:
+    appointment_id: str
+    patient_name: str
+    doctor_name: str
+    appointment_time: datetime
+    label: str
+
+
+class _Scheduled:
+    """
+    What the heap knows about one appointment. ``generation`` invalidates heap entries left
+    behind by a cancellation or a reschedule; ``pending`` counts its live entries.
+    """
+
+    __slots__ = ("generation", "pending", "patient_name", "doctor_name", "appointment_time")
+
+    def __init__(self, generation: int, patient_name: str, doctor_name: str, appointment_time: datetime):
+        self.generation = generation
+        self.pending = 0
+        self.patient_name = patient_name
+        self.doctor_name = doctor_name
+        self.appointment_time = appointment_time
+
+
+class ReminderHeap:
+    """
+    Pending reminders in a min-heap of ``(due timestamp, appointment id, generation, label)``.
+
+    Scheduling is O(log n) per reminder and a tick costs O(k log n) for the k reminders that
+    are due. Cancelling is O(1): entries are left in the heap and skipped when they surface,
+    and the heap is compacted once such stale entries make up half of it.
+    """
+
+    COMPACT_MIN_SIZE = 1024
+
+    def __init__(self, offsets: Optional[Dict[str, timedelta]] = None):
+        self.offsets = offsets if offsets is not None else REMINDER_OFFSETS
+        self._heap: List[Tuple[float, str, int, str]] = []
+        self._appointments: Dict[str, _Scheduled] = {}
+        self._generations = itertools.count()
+        self._stale = 0
+
+    def __len__(self) -> int:
+        """
+        Number of live (not cancelled) reminders.
+        """
+        return len(self._heap) - self._stale
+
+    def _entries(
+        self, appointment_id: str, scheduled: _Scheduled, now: datetime
+    ) -> Iterator[Tuple[float, str, int, str]]:
+        for label, offset in self.offsets.items():
+            due = scheduled.appointment_time - offset
+            if due > now:
+                scheduled.pending += 1
+                yield due.timestamp(), appointment_id, scheduled.generation, label
+
+    def _register(
+        self, appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
+    ) -> Tuple[str, _Scheduled]:
+        key = str(appointment_id)
+        self.cancel(key)
+        scheduled = _Scheduled(next(self._generations), patient_name, doctor_name, appointment_time)
+        self._appointments[key] = scheduled
+        return key, scheduled
+
+    def schedule(
+        self,
+        appointment_id: uuid.UUID,
+        patient_name: str,
+        doctor_name: str,
+        appointment_time: datetime,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        (Re)schedule the reminders of one appointment; those already due are skipped.
+        Returns how many were scheduled.
+        """
+        key, scheduled = self._register(appointment_id, patient_name, doctor_name, appointment_time)
+        for entry in self._entries(key, scheduled, now or timezone.now()):
+            heapq.heappush(self._heap, entry)
+        if not scheduled.pending:
+            del self._appointments[key]
+        return scheduled.pending
+
+    def load(self, appointments: Iterable[Tuple[uuid.UUID, str, str, datetime]], now: Optional[datetime] = None) -> int:
+        """
+        Bulk-schedule ``(appointment_id, patient_name, doctor_name, appointment_time)`` rows
+        with one O(n) heapify instead of n pushes. Returns how many reminders were scheduled.
+        """
+        now = now or timezone.now()
+        before = len(self._heap)
+        for appointment_id, patient_name, doctor_name, appointment_time in appointments:
+            key, scheduled = self._register(appointment_id, patient_name, doctor_name, appointment_time)
+            self._heap.extend(self._entries(key, scheduled, now))
+            if not scheduled.pending:
+                del self._appointments[key]
+        heapq.heapify(self._heap)
+        return len(self._heap) - before
+
+    def cancel(self, appointment_id) -> bool:
+        """
+        Drop every pending reminder of an appointment. Returns False if it had none.
+        """
+        scheduled = self._appointments.pop(str(appointment_id), None)
+        if scheduled is None:
+            return False
+        self._stale += scheduled.pending
+        self._maybe_compact()
+        return True
+
+    def _is_live(self, entry: Tuple[float, str, int, str]) -> bool:
+        scheduled = self._appointments.get(entry[1])
+        return scheduled is not None and scheduled.generation == entry[2]
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) >= self.COMPACT_MIN_SIZE and self._stale * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def tick(self, now: Optional[datetime] = None) -> List[Reminder]:
+        """
+        Pop and return every reminder due at ``now``.
+        """
+        now_ts = (now or timezone.now()).timestamp()
+        due = []
+        while self._heap and self._heap[0][0] <= now_ts:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                self._stale -= 1
+                continue
+            key, label = entry[1], entry[3]
+            scheduled = self._appointments[key]
+            scheduled.pending -= 1
+            if not scheduled.pending:
+                del self._appointments[key]
+            due.append(Reminder(key, scheduled.patient_name, scheduled.doctor_name, scheduled.appointment_time, label))
+        return due
+
+    def next_due(self) -> Optional[float]:
+        """
+        Timestamp of the earliest live reminder, or None when nothing is scheduled.
+        """
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+            self._stale -= 1
+        return self._heap[0][0] if self._heap else None
+
+
+def record_booked(appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime) -> None:
+    """
+    Tell the scheduler about a booking. Call it inside the booking transaction.
+    """
+    ReminderEvent.objects.create(
+        appointment_id=appointment_id,
+        action=ReminderEvent.BOOKED,
+        payload=outbox.confirmation_payload(appointment_id, patient_name, doctor_name, appointment_time),
+    )
+
+
+def record_booked_many(patient_name: str, appointments: Iterable[Tuple[uuid.UUID, str, datetime]]) -> None:
+    """
+    ``record_booked`` for several ``(appointment_id, doctor_name, appointment_time)`` of one
+    patient, with one INSERT.
+    """
+    ReminderEvent.objects.bulk_create(
+        [
+            ReminderEvent(
+                appointment_id=appointment_id,
+                action=ReminderEvent.BOOKED,
+                payload=outbox.confirmation_payload(appointment_id, patient_name, doctor_name, appointment_time),
+            )
+            for appointment_id, doctor_name, appointment_time in appointments
+        ]
+    )
+
+
+def record_canceled(appointment_id: uuid.UUID) -> None:
+    """
+    Tell the scheduler an appointment no longer needs reminders (canceled or completed).
+    """
+    ReminderEvent.objects.create(appointment_id=appointment_id, action=ReminderEvent.CANCELED)
+
+
+def record_canceled_many(appointment_ids: Iterable[uuid.UUID]) -> None:
+    """
+    ``record_canceled`` for several appointments, with one INSERT.
+    """
+    ReminderEvent.objects.bulk_create(
+        [
+            ReminderEvent(appointment_id=appointment_id, action=ReminderEvent.CANCELED)
+            for appointment_id in appointment_ids
+        ]
+    )
+
+
+def upcoming_appointments(now: datetime, chunk_size: int = 2000) -> Iterator[Tuple[uuid.UUID, str, str, datetime]]:
+    """
+    Stream the appointments that may still need a reminder, for the scheduler's initial load.
+    """
+    doctors = Doctor.objects.filter(id=OuterRef("doctor_id"))
+    rows = (
+        AppointmentModel.objects.filter(is_canceled=False, is_completed=False, slot_time__gt=now)
+        .annotate(doctor_name=Subquery(doctors.values("name")[:1]))
+        .values_list("id", "patient_name", "doctor_name", "slot_time")
+    )
+    return rows.iterator(chunk_size=chunk_size)
+
+
+def enqueue_reminders(reminders: List[Reminder]) -> None:
+    OutboxMessage.objects.bulk_create(
+        [
+            OutboxMessage(
+                kind=outbox.APPOINTMENT_REMINDER,
+                payload={
+                    **outbox.confirmation_payload(
+                        reminder.appointment_id,
+                        reminder.patient_name,
+                        reminder.doctor_name,
+                        reminder.appointment_time,
+                    ),
+                    "reminder": reminder.label,
+                },
+            )
+            for reminder in reminders
+        ]
+    )
+
+
+class ReminderScheduler:
+    """
+    Binds a ``ReminderHeap`` to the database: initial load, event tailing and delivery.
+    """
+
+    def __init__(self, heap: Optional[ReminderHeap] = None):
+        self.heap = heap or ReminderHeap()
+        self.last_event_id = 0
+
+    def start(self, now: Optional[datetime] = None) -> int:
+        """
+        Load the upcoming appointments. Events are tailed from before the load, so a change
+        racing with it is applied again afterwards (both actions are idempotent).
+        """
+        now = now or timezone.now()
+        self.last_event_id = ReminderEvent.objects.order_by("-id").values_list("id", flat=True).first() or 0
+        loaded = self.heap.load(upcoming_appointments(now), now)
+        logger.info("Reminder scheduler loaded %d reminder(s)", loaded)
+        return loaded
+
+    def apply_events(self, now: Optional[datetime] = None, limit: int = EVENT_BATCH_SIZE) -> int:
+        """
+        Apply new booking/cancellation events. SQLite commits writes one at a time, so ids
+        become visible in order and an id cursor cannot skip a late-committing row.
+        """
+        now = now or timezone.now()
+        events = list(ReminderEvent.objects.filter(id__gt=self.last_event_id).order_by("id")[:limit])
+        for event in events:
+            if event.action == ReminderEvent.BOOKED:
+                self.heap.schedule(
+                    event.appointment_id,
+                    event.payload["patient_name"],
+                    event.payload["doctor_name"],
+                    datetime.fromisoformat(event.payload["appointment_time"]),
+                    now,
+                )
+            else:
+                self.heap.cancel(event.appointment_id)
+        if events:
+            self.last_event_id = events[-1].id
+        return len(events)
+
+    def run_once(self, now: Optional[datetime] = None) -> int:
+        """
+        One tick: catch up on events, then queue every reminder that is due.
+        """
+        now = now or timezone.now()
+        while self.apply_events(now) == EVENT_BATCH_SIZE:
+            pass
+        due = self.heap.tick(now)
+        if due:
+            enqueue_reminders(due)
+        return len(due)
+
+    def prune_events(self, now: Optional[datetime] = None) -> int:
+        cutoff = (now or timezone.now()) - EVENT_RETENTION
+        deleted, _ = ReminderEvent.objects.filter(id__lte=self.last_event_id, created_at__lt=cutoff).delete()
+        return deleted
+
+    def seconds_until_next(self, now: Optional[datetime] = None) -> Optional[float]:
+        next_due = self.heap.next_due()
+        if next_due is None:
+            return None
+        return max(0.0, next_due - (now or timezone.now()).timestamp())
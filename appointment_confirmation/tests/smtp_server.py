@@ -0,0 +1,129 @@
+"""
+A minimal in-process SMTP server stand-in for tests and benchmarks.
+
+It speaks just enough SMTP for ``smtplib`` (EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT),
+accepts every message and records it, and counts the connections it was opened with.
+"""
+
+import socket
+import socketserver
+import threading
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class ReceivedMessage:
+    mail_from: str
+    rcpt_tos: List[str] = field(default_factory=list)
+    data: str = ""
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server: "LocalSMTPServer" = self.server.owner
+        server._connected(self.connection)
+        try:
+            self.reply("220 localhost ESMTP stand-in")
+            envelope = None
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                command, _, argument = line.decode().rstrip("\r\n").partition(" ")
+                command = command.upper()
+                if command in ("EHLO", "HELO"):
+                    self.reply("250 localhost")
+                elif command == "MAIL":
+                    envelope = ReceivedMessage(mail_from=argument.partition(":")[2].strip("<>"))
+                    self.reply("250 OK")
+                elif command == "RCPT" and envelope is not None:
+                    envelope.rcpt_tos.append(argument.partition(":")[2].strip("<>"))
+                    self.reply("250 OK")
+                elif command == "DATA" and envelope is not None:
+                    self.reply("354 End data with <CR><LF>.<CR><LF>")
+                    lines = []
+                    for data_line in iter(self.rfile.readline, b""):
+                        text = data_line.decode().rstrip("\r\n")
+                        if text == ".":
+                            break
+                        lines.append(text[1:] if text.startswith("..") else text)
+                    envelope.data = "\n".join(lines)
+                    server._received(envelope)
+                    envelope = None
+                    self.reply("250 OK: queued")
+                elif command in ("RSET", "NOOP"):
+                    envelope = None if command == "RSET" else envelope
+                    self.reply("250 OK")
+                elif command == "QUIT":
+                    self.reply("221 Bye")
+                    return
+                else:
+                    self.reply("500 Command not recognized")
+        except OSError:
+            # The client or ``disconnect_all`` closed the socket
+            pass
+        finally:
+            server._disconnected(self.connection)
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class LocalSMTPServer:
+    """
+    Run with ``with LocalSMTPServer() as server:``; ``server.port`` is picked by the OS.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = _ThreadingTCPServer((host, port), _SMTPHandler)
+        self._server.owner = self
+        self.host, self.port = self._server.server_address
+        self._lock = threading.Lock()
+        self._open_sockets = set()
+        self.messages: List[ReceivedMessage] = []
+        self.connections = 0
+
+    def _connected(self, sock) -> None:
+        with self._lock:
+            self.connections += 1
+            self._open_sockets.add(sock)
+
+    def _disconnected(self, sock) -> None:
+        with self._lock:
+            self._open_sockets.discard(sock)
+
+    def _received(self, message: ReceivedMessage) -> None:
+        with self._lock:
+            self.messages.append(message)
+
+    def disconnect_all(self) -> None:
+        """
+        Drop every open client connection, as a server does with idle ones.
+        """
+        with self._lock:
+            sockets = list(self._open_sockets)
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def start(self) -> "LocalSMTPServer":
+        threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "LocalSMTPServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
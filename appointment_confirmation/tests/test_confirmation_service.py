@@ -7,7 +7,7 @@ from appointment_confirmation.confirmation_service import send_appointment_confi
 
 class TestConfirmationService(unittest.TestCase):
 
-    @patch("appointment_confirmation.confirmation_service.logger")
+    @patch("appointment_confirmation.transports.logger")
     def test_send_appointment_confirmation(self, mock_logger):
         appointment_id = "1234"
         patient_name = "John Doe"
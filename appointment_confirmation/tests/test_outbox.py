@@ -0,0 +1,187 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils.timezone import now, timedelta
+
+from appointment_confirmation import outbox
+from appointment_confirmation.circuit_breaker import CircuitBreaker, breakers
+from appointment_confirmation.models import DeadLetterMessage, OutboxMessage
+from appointment_confirmation.transports import ConfirmationMessage, SeriesConfirmationMessage
+
+
+class OutboxTest(TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+        breakers.reset()
+        self.addCleanup(breakers.reset)
+
+    def enqueue(self, patient_name="John Doe"):
+        return outbox.enqueue_appointment_confirmation(
+            appointment_id=uuid.uuid4(),
+            patient_name=patient_name,
+            doctor_name="Dr. Smith",
+            appointment_time=datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc),
+        )
+
+    @patch("appointment_confirmation.outbox.send_appointment_confirmations")
+    def test_process_batch_sends_and_marks_done(self, mock_send):
+        message = self.enqueue()
+
+        self.assertEqual(outbox.process_batch(self.executor, batch_size=10), (1, 0))
+
+        mock_send.assert_called_once_with(
+            [
+                ConfirmationMessage(
+                    appointment_id=message.payload["appointment_id"],
+                    patient_name="John Doe",
+                    doctor_name="Dr. Smith",
+                    appointment_time=datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc),
+                )
+            ]
+        )
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxMessage.DONE)
+        self.assertIsNotNone(message.processed_at)
+        self.assertEqual(outbox.process_batch(self.executor, batch_size=10), (0, 0))
+
+    @patch("appointment_confirmation.outbox.send_appointment_confirmations")
+    def test_series_confirmation_is_sent_as_one_message(self, mock_send):
+        times = [datetime(2025, 1, day, 10, 0, tzinfo=timezone.utc) for day in (1, 8)]
+        ids = [uuid.uuid4(), uuid.uuid4()]
+        outbox.enqueue_series_confirmation(
+            "John Doe", [(ids[0], "Dr. Smith", times[0]), (ids[1], "Dr. Smith", times[1])]
+        )
+
+        self.assertEqual(outbox.process_batch(self.executor, batch_size=10), (1, 0))
+
+        (message,) = mock_send.call_args.args[0]
+        self.assertIsInstance(message, SeriesConfirmationMessage)
+        self.assertEqual([a.appointment_id for a in message.appointments], [str(i) for i in ids])
+        self.assertEqual([a.appointment_time for a in message.appointments], times)
+        self.assertIn("(2 appointments)", message.subject)
+
+    @patch("appointment_confirmation.outbox.send_appointment_confirmations", side_effect=ConnectionError("down"))
+    def test_failed_dispatch_is_rescheduled_with_backoff(self, mock_send):
+        message = self.enqueue()
+
+        self.assertEqual(outbox.process_batch(self.executor, batch_size=10), (0, 1))
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxMessage.PENDING)
+        self.assertEqual(message.attempts, 1)
+        self.assertIn("down", message.last_error)
+        # The first retry waits between half and all of the base delay, and is not due yet
+        self.assertGreater(message.next_attempt_at, now())
+        self.assertLessEqual(message.next_attempt_at, now() + timedelta(seconds=2))
+        self.assertEqual(outbox.process_batch(self.executor, batch_size=10), (0, 0))
+        self.assertEqual(mock_send.call_count, 1)
+
+    def test_retry_delay_grows_exponentially_with_jitter(self):
+        with self.settings(CONFIRMATION_RETRY_BASE_DELAY=2, CONFIRMATION_RETRY_MAX_DELAY=60):
+            for attempts, ceiling in [(1, 2), (2, 4), (3, 8), (6, 60), (20, 60)]:
+                delays = [outbox.retry_delay(attempts) for _ in range(50)]
+                self.assertTrue(all(ceiling / 2 <= delay <= ceiling for delay in delays), attempts)
+                self.assertGreater(len(set(delays)), 1)
+
+    @patch("appointment_confirmation.outbox.send_appointment_confirmations", side_effect=ConnectionError("down"))
+    def test_message_is_dead_lettered_after_max_attempts(self, mock_send):
+        message = self.enqueue()
+        OutboxMessage.objects.filter(id=message.id).update(attempts=2)
+
+        with self.settings(CONFIRMATION_MAX_ATTEMPTS=3):
+            self.assertEqual(outbox.process_batch(self.executor, batch_size=10), (0, 1))
+
+        self.assertFalse(OutboxMessage.objects.exists())
+        dead_letter = DeadLetterMessage.objects.get()
+        self.assertEqual(dead_letter.payload, message.payload)
+        self.assertEqual(dead_letter.attempts, 3)
+        self.assertEqual(dead_letter.destination, "log")
+        self.assertIn("down", dead_letter.last_error)
+
+    @patch("appointment_confirmation.outbox.send_appointment_confirmations", side_effect=ConnectionError("down"))
+    def test_open_circuit_defers_without_spending_attempts(self, mock_send):
+        for i in range(3):
+            self.enqueue(f"Patient {i}")
+
+        with self.settings(CONFIRMATION_BREAKER_FAILURE_THRESHOLD=2, CONFIRMATION_BREAKER_RESET_TIMEOUT=60):
+            # Two single-message chunks fail and open the circuit; the third is never sent
+            self.assertEqual(outbox.process_batch(self.executor, batch_size=2, chunk_size=1), (0, 2))
+            OutboxMessage.objects.update(next_attempt_at=now())
+            self.assertEqual(outbox.process_batch(self.executor, batch_size=10), (0, 0))
+
+        self.assertEqual(mock_send.call_count, 2)
+        self.assertEqual(breakers.get("log").state, CircuitBreaker.OPEN)
+        self.assertEqual(sorted(OutboxMessage.objects.values_list("attempts", flat=True)), [0, 1, 1])
+        self.assertFalse(OutboxMessage.objects.filter(next_attempt_at__lte=now()).exists())
+
+    def test_replay_dead_letters_command(self):
+        DeadLetterMessage.objects.create(
+            kind="appointment_confirmation", payload={"a": 1}, attempts=8, created_at=now()
+        )
+        kept = DeadLetterMessage.objects.create(kind="other", payload={"b": 2}, attempts=8, created_at=now())
+
+        with self.assertRaises(CommandError):
+            call_command("replay_dead_letters", stdout=StringIO())
+
+        out = StringIO()
+        call_command("replay_dead_letters", "--all", "--kind", "appointment_confirmation", stdout=out)
+
+        self.assertIn("Replayed 1 dead letter(s).", out.getvalue())
+        message = OutboxMessage.objects.get()
+        self.assertEqual((message.kind, message.payload, message.attempts), ("appointment_confirmation", {"a": 1}, 0))
+        self.assertEqual(list(DeadLetterMessage.objects.all()), [kept])
+
+    @patch("appointment_confirmation.outbox.send_appointment_confirmations")
+    def test_failing_message_does_not_fail_its_chunk(self, mock_send):
+        def send(messages):
+            if any(message.patient_name == "Bad" for message in messages):
+                raise ValueError("rejected")
+
+        mock_send.side_effect = send
+        good, bad, other = self.enqueue("A"), self.enqueue("Bad"), self.enqueue("C")
+
+        self.assertEqual(outbox.process_batch(self.executor, batch_size=10, chunk_size=10), (2, 1))
+
+        statuses = dict(OutboxMessage.objects.values_list("id", "status"))
+        self.assertEqual(statuses[good.id], OutboxMessage.DONE)
+        self.assertEqual(statuses[bad.id], OutboxMessage.PENDING)
+        self.assertEqual(statuses[other.id], OutboxMessage.DONE)
+
+    def test_claim_batch_takes_oldest_rows_once(self):
+        first, second, third = self.enqueue("A"), self.enqueue("B"), self.enqueue("C")
+
+        claimed = outbox.claim_batch(batch_size=2)
+        self.assertEqual([message.id for message in claimed], [first.id, second.id])
+        self.assertEqual(len({message.claim_token for message in claimed}), 1)
+
+        # A second worker only sees what is left
+        self.assertEqual([message.id for message in outbox.claim_batch(batch_size=2)], [third.id])
+        self.assertEqual(outbox.claim_batch(batch_size=2), [])
+
+    def test_abandoned_claim_is_reclaimed_after_lease(self):
+        message = self.enqueue()
+        OutboxMessage.objects.filter(id=message.id).update(
+            status=OutboxMessage.PROCESSING, claim_token=uuid.uuid4(), claimed_at=now() - timedelta(minutes=10)
+        )
+
+        self.assertEqual(outbox.claim_batch(batch_size=10, lease_seconds=3600), [])
+        self.assertEqual([m.id for m in outbox.claim_batch(batch_size=10, lease_seconds=60)], [message.id])
+
+    @patch("appointment_confirmation.outbox.send_appointment_confirmations")
+    def test_process_outbox_command_drains_queue(self, mock_send):
+        for i in range(5):
+            self.enqueue(f"Patient {i}")
+
+        out = StringIO()
+        call_command("process_outbox", "--once", "--batch-size", "4", "--chunk-size", "2", stdout=out)
+
+        # Batches of 4 and 1, sent in chunks of 2, 2 and 1
+        self.assertEqual([len(call.args[0]) for call in mock_send.call_args_list], [2, 2, 1])
+        self.assertFalse(OutboxMessage.objects.exclude(status=OutboxMessage.DONE).exists())
+        self.assertIn("Sent 5 confirmation(s), 0 failed.", out.getvalue())
@@ -0,0 +1,124 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from django.test import SimpleTestCase, TestCase
+
+from appointment_booking.infrastructure.models import AppointmentModel
+from appointment_confirmation import outbox, reminders
+from appointment_confirmation.models import OutboxMessage, ReminderEvent
+from appointment_confirmation.reminders import ReminderHeap, ReminderScheduler
+from doctor_availability.models import Doctor, Slot
+
+NOW = datetime(2030, 1, 1, 8, 0, tzinfo=timezone.utc)
+
+
+class ReminderHeapTest(SimpleTestCase):
+    def setUp(self):
+        self.heap = ReminderHeap()
+
+    def test_schedules_both_offsets_and_pops_them_in_order(self):
+        first, second = uuid.uuid4(), uuid.uuid4()
+        self.assertEqual(self.heap.schedule(first, "Alice", "Dr. A", NOW + timedelta(days=2), NOW), 2)
+        self.assertEqual(self.heap.schedule(second, "Bob", "Dr. B", NOW + timedelta(hours=30), NOW), 2)
+        self.assertEqual(len(self.heap), 4)
+
+        self.assertEqual(self.heap.tick(NOW + timedelta(hours=5)), [])
+        due = self.heap.tick(NOW + timedelta(hours=25))
+        self.assertEqual([(r.patient_name, r.label) for r in due], [("Bob", "24h"), ("Alice", "24h")])
+
+        due = self.heap.tick(NOW + timedelta(days=3))
+        self.assertEqual([(r.patient_name, r.label) for r in due], [("Bob", "1h"), ("Alice", "1h")])
+        self.assertEqual(len(self.heap), 0)
+        self.assertIsNone(self.heap.next_due())
+
+    def test_reminders_already_due_are_skipped(self):
+        appointment_id = uuid.uuid4()
+        self.assertEqual(self.heap.schedule(appointment_id, "Alice", "Dr. A", NOW + timedelta(hours=3), NOW), 1)
+        self.assertEqual([r.label for r in self.heap.tick(NOW + timedelta(hours=3))], ["1h"])
+        self.assertEqual(self.heap.schedule(uuid.uuid4(), "Bob", "Dr. B", NOW + timedelta(minutes=30), NOW), 0)
+
+    def test_cancel_and_reschedule_invalidate_old_entries(self):
+        canceled, moved = uuid.uuid4(), uuid.uuid4()
+        self.heap.schedule(canceled, "Alice", "Dr. A", NOW + timedelta(days=2), NOW)
+        self.heap.schedule(moved, "Bob", "Dr. B", NOW + timedelta(days=2), NOW)
+
+        self.assertTrue(self.heap.cancel(canceled))
+        self.assertFalse(self.heap.cancel(canceled))
+        self.heap.schedule(moved, "Bob", "Dr. B", NOW + timedelta(days=5), NOW)
+        self.assertEqual(len(self.heap), 2)
+
+        self.assertEqual(self.heap.tick(NOW + timedelta(days=3)), [])
+        self.assertEqual(self.heap.next_due(), (NOW + timedelta(days=4)).timestamp())
+        due = self.heap.tick(NOW + timedelta(days=5))
+        self.assertEqual([(r.appointment_id, r.label) for r in due], [(str(moved), "24h"), (str(moved), "1h")])
+
+    def test_load_heapifies_and_compaction_drops_cancelled_entries(self):
+        ids = [uuid.uuid4() for _ in range(1000)]
+        rows = [(appointment_id, "P", "D", NOW + timedelta(days=2, minutes=i)) for i, appointment_id in enumerate(ids)]
+        self.assertEqual(self.heap.load(rows, NOW), 2000)
+
+        for appointment_id in ids[:600]:
+            self.heap.cancel(appointment_id)
+
+        # The 501st cancellation made more than half of the entries stale and the heap was
+        # rebuilt without them; the 99 after it are stale entries again
+        self.assertEqual(len(self.heap._heap), 998)
+        self.assertEqual(len(self.heap), 800)
+        self.assertEqual(self.heap.next_due(), (NOW + timedelta(days=1, minutes=600)).timestamp())
+
+
+class ReminderSchedulerTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = Doctor.objects.create(name="Dr. Ahmed")
+
+    def book(self, patient_name, appointment_time):
+        slot = Slot.objects.create(doctor=self.doctor, time=appointment_time, cost=100, is_reserved=True)
+        return AppointmentModel.objects.create(
+            slot_id=slot.id,
+            patient_id=uuid.uuid4(),
+            patient_name=patient_name,
+            slot_time=slot.time,
+            doctor_id=self.doctor.id,
+        )
+
+    def test_start_loads_upcoming_appointments(self):
+        self.book("Alice", NOW + timedelta(days=2))
+        self.book("Past", NOW - timedelta(days=1))
+        canceled = self.book("Canceled", NOW + timedelta(days=2))
+        AppointmentModel.objects.filter(id=canceled.id).update(is_canceled=True)
+
+        scheduler = ReminderScheduler()
+        with self.assertNumQueries(2):
+            self.assertEqual(scheduler.start(NOW), 2)
+
+    def test_events_update_the_schedule_incrementally(self):
+        scheduler = ReminderScheduler()
+        scheduler.start(NOW)
+
+        kept, canceled = uuid.uuid4(), uuid.uuid4()
+        reminders.record_booked(kept, "Alice", "Dr. Ahmed", NOW + timedelta(days=2))
+        reminders.record_booked(canceled, "Bob", "Dr. Ahmed", NOW + timedelta(days=2))
+        reminders.record_canceled(canceled)
+
+        # One query for new events; nothing is due yet
+        with self.assertNumQueries(1):
+            self.assertEqual(scheduler.run_once(NOW), 0)
+        self.assertEqual(len(scheduler.heap), 2)
+
+        self.assertEqual(scheduler.run_once(NOW + timedelta(days=1)), 1)
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.kind, outbox.APPOINTMENT_REMINDER)
+        self.assertEqual(message.payload["appointment_id"], str(kept))
+        self.assertEqual(message.payload["reminder"], "24h")
+        self.assertEqual(scheduler.seconds_until_next(NOW + timedelta(days=1)), timedelta(hours=23).total_seconds())
+
+    def test_prune_events_keeps_unread_and_recent_events(self):
+        scheduler = ReminderScheduler()
+        reminders.record_canceled(uuid.uuid4())
+        scheduler.apply_events(NOW)
+        reminders.record_canceled(uuid.uuid4())
+        ReminderEvent.objects.update(created_at=NOW - timedelta(days=2))
+
+        self.assertEqual(scheduler.prune_events(NOW), 1)
+        self.assertEqual(ReminderEvent.objects.count(), 1)
@@ -0,0 +1,164 @@
+import http.client
+import json
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import SimpleTestCase, override_settings
+
+from appointment_confirmation.confirmation_service import send_appointment_confirmation
+from appointment_confirmation.tests.smtp_server import LocalSMTPServer
+from appointment_confirmation.transports import (
+    BaseTransport,
+    ConfirmationMessage,
+    LoggingTransport,
+    SMTPTransport,
+    WebhookTransport,
+    get_transport,
+)
+
+
+def make_messages(count):
+    return [
+        ConfirmationMessage(
+            appointment_id=str(i),
+            patient_name=f"Patient {i}",
+            doctor_name="Dr. Smith",
+            appointment_time=datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc),
+        )
+        for i in range(count)
+    ]
+
+
+class SMTPTransportTest(SimpleTestCase):
+    def setUp(self):
+        self.server = LocalSMTPServer().start()
+        self.addCleanup(self.server.stop)
+
+    def transport(self, **options):
+        transport = SMTPTransport(
+            recipients=["desk@clinic.test"],
+            from_email="noreply@clinic.test",
+            host=self.server.host,
+            port=self.server.port,
+            **options,
+        )
+        self.addCleanup(transport.close)
+        return transport
+
+    def test_batch_is_sent_over_one_connection(self):
+        self.assertEqual(self.transport().send_messages(make_messages(5)), 5)
+
+        self.assertEqual(len(self.server.messages), 5)
+        self.assertEqual(self.server.connections, 1)
+        message = self.server.messages[0]
+        self.assertEqual(message.mail_from, "noreply@clinic.test")
+        self.assertEqual(message.rcpt_tos, ["desk@clinic.test"])
+        self.assertIn("Patient Name: Patient 0", message.data)
+
+    def test_connection_is_reused_across_sends(self):
+        transport = self.transport()
+        for message in make_messages(3):
+            transport.send_messages([message])
+
+        self.assertEqual(len(self.server.messages), 3)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(transport.pool.opened, 1)
+
+    def test_without_reuse_each_send_opens_a_connection(self):
+        transport = self.transport(reuse_connections=False)
+        for message in make_messages(3):
+            transport.send_messages([message])
+
+        self.assertEqual(len(self.server.messages), 3)
+        self.assertEqual(self.server.connections, 3)
+
+    def test_dropped_pooled_connection_is_replaced(self):
+        transport = self.transport()
+        transport.send_messages(make_messages(1))
+        self.server.disconnect_all()
+
+        self.assertEqual(transport.send_messages(make_messages(2)), 2)
+        self.assertEqual(len(self.server.messages), 3)
+        self.assertEqual(transport.pool.opened, 2)
+
+    def test_send_appointment_confirmation_uses_configured_transport(self):
+        transport_setting = {
+            "BACKEND": "appointment_confirmation.transports.SMTPTransport",
+            "OPTIONS": {"recipients": ["desk@clinic.test"], "host": self.server.host, "port": self.server.port},
+        }
+        with override_settings(CONFIRMATION_TRANSPORT=transport_setting):
+            self.assertIsInstance(get_transport(), SMTPTransport)
+            send_appointment_confirmation(
+                appointment_id="1234",
+                patient_name="John Doe",
+                doctor_name="Dr. Smith",
+                appointment_time=datetime(2025, 1, 1, 10, 0),
+            )
+        self.assertIsInstance(get_transport(), LoggingTransport)
+
+        self.assertEqual(len(self.server.messages), 1)
+        self.assertIn("Appointment ID: 1234", self.server.messages[0].data)
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append(json.loads(body))
+        status = 500 if self.server.fail else 204
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _WebhookServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _WebhookHandler)
+        self.received = []
+        self.fail = False
+        self.connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+class WebhookTransportTest(SimpleTestCase):
+    def setUp(self):
+        self.server = _WebhookServer()
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.transport = WebhookTransport(url=f"http://127.0.0.1:{self.server.server_port}/hooks/confirmations")
+        self.addCleanup(self.transport.close)
+
+    def test_messages_are_posted_over_one_connection(self):
+        self.assertEqual(self.transport.send_messages(make_messages(3)), 3)
+        self.transport.send_messages(make_messages(1))
+
+        self.assertEqual(
+            [item["patient_name"] for item in self.server.received][:3], ["Patient 0", "Patient 1", "Patient 2"]
+        )
+        self.assertEqual(self.server.received[0]["appointment_time"], "2025-01-01T10:00:00+00:00")
+        self.assertEqual(self.server.connections, 1)
+
+    def test_error_status_raises(self):
+        self.server.fail = True
+        with self.assertRaises(http.client.HTTPException):
+            self.transport.send_messages(make_messages(1))
+
+
+class BaseTransportTest(SimpleTestCase):
+    def test_transport_without_send_messages_cannot_be_created(self):
+        class HalfTransport(BaseTransport):
+            destination = "half"
+
+        with self.assertRaises(TypeError):
+            HalfTransport()
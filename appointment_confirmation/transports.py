@@ -0,0 +1,345 @@
+"""
+Delivery transports for appointment confirmations.
+
+The transport is chosen by the ``CONFIRMATION_TRANSPORT`` setting (a ``BACKEND`` dotted path
+plus ``OPTIONS`` passed to its constructor), the same shape as ``CACHES`` entries:
+
+    CONFIRMATION_TRANSPORT = {
+        "BACKEND": "appointment_confirmation.transports.SMTPTransport",
+        "OPTIONS": {"host": "smtp.example.com", "recipients": ["front-desk@example.com"]},
+    }
+
+Network transports keep a small pool of open connections and send a whole batch over one
+connection, so a busy outbox worker does not pay a handshake per message.
+"""
+
+import http.client
+import json
+import logging
+import queue
+import smtplib
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Generic, Iterator, Optional, Sequence, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.signals import setting_changed
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+C = TypeVar("C")
+
+DEFAULT_TRANSPORT = {"BACKEND": "appointment_confirmation.transports.LoggingTransport", "OPTIONS": {}}
+DEFAULT_POOL_SIZE = 4
+
+
+@dataclass(frozen=True)
+class ConfirmationMessage:
+    """
+    A confirmation to deliver, independent of the transport. With ``reminder`` set
+    (e.g. "24h") it is a reminder sent that long before the appointment.
+    """
+
+    appointment_id: str
+    patient_name: str
+    doctor_name: str
+    appointment_time: datetime
+    reminder: str = ""
+
+    @property
+    def subject(self) -> str:
+        if self.reminder:
+            return f"Appointment reminder for {self.patient_name}"
+        return f"Appointment confirmation for {self.patient_name}"
+
+    @property
+    def body(self) -> str:
+        heading = f"Appointment Reminder ({self.reminder} before)" if self.reminder else "Appointment Confirmation"
+        return (
+            f"{heading}:\n"
+            f"Appointment ID: {self.appointment_id}\n"
+            f"Patient Name: {self.patient_name}\n"
+            f"Doctor Name: {self.doctor_name}\n"
+            f"Appointment Time: {self.appointment_time.isoformat()}\n"
+        )
+
+    def as_dict(self) -> dict:
+        data = {
+            "appointment_id": self.appointment_id,
+            "patient_name": self.patient_name,
+            "doctor_name": self.doctor_name,
+            "appointment_time": self.appointment_time.isoformat(),
+        }
+        if self.reminder:
+            data["reminder"] = self.reminder
+        return data
+
+
+@dataclass(frozen=True)
+class SeriesConfirmationMessage:
+    """
+    One confirmation for several appointments booked together (e.g. a course of treatment),
+    delivered like a ``ConfirmationMessage``.
+    """
+
+    patient_name: str
+    appointments: Tuple[ConfirmationMessage, ...]
+
+    @property
+    def subject(self) -> str:
+        return f"Appointment confirmation for {self.patient_name} ({len(self.appointments)} appointments)"
+
+    @property
+    def body(self) -> str:
+        lines = [f"Appointment Confirmation ({len(self.appointments)} appointments):"]
+        lines.append(f"Patient Name: {self.patient_name}")
+        for appointment in self.appointments:
+            lines.append(
+                f"- {appointment.appointment_time.isoformat()} with {appointment.doctor_name}"
+                f" (Appointment ID: {appointment.appointment_id})"
+            )
+        return "\n".join(lines) + "\n"
+
+    def as_dict(self) -> dict:
+        return {
+            "patient_name": self.patient_name,
+            "appointments": [appointment.as_dict() for appointment in self.appointments],
+        }
+
+
+class ConnectionPool(Generic[C]):
+    """
+    Thread-safe LIFO pool of open connections.
+
+    At most ``max_idle`` connections are kept between uses; ``max_idle=0`` disables reuse,
+    so every checkout opens (and every return closes) a connection.
+    """
+
+    def __init__(self, open_connection: Callable[[], C], close_connection: Callable[[C], None], max_idle: int):
+        self._open = open_connection
+        self._close = close_connection
+        self._idle: "queue.LifoQueue[C]" = queue.LifoQueue()
+        self._max_idle = max_idle
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[C]:
+        """
+        Check out a connection; it is discarded instead of returned if the block raises.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+            with self._lock:
+                self.opened += 1
+        try:
+            yield conn
+        except BaseException:
+            self._discard(conn)
+            raise
+        if self._idle.qsize() < self._max_idle:
+            self._idle.put(conn)
+        else:
+            self._discard(conn)
+
+    def _discard(self, conn: C) -> None:
+        try:
+            self._close(conn)
+        except Exception:
+            logger.debug("Closing a pooled connection failed", exc_info=True)
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+class BaseTransport(ABC):
+    """
+    Delivers confirmations; subclasses implement ``send_messages``.
+    ``destination`` names where messages go, keying the outbox worker's circuit breakers.
+    Messages may also be ``SeriesConfirmationMessage``s, which have the same ``subject``,
+    ``body`` and ``as_dict``.
+    """
+
+    destination = "default"
+
+    @abstractmethod
+    def send_messages(self, messages: Sequence[ConfirmationMessage]) -> int:
+        """
+        Deliver ``messages`` (over a single connection where that applies) and return how many
+        were sent. Raises on failure; messages before the failing one may already be delivered.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Release any open connections.
+        """
+
+
+class LoggingTransport(BaseTransport):
+    """
+    Logs each confirmation; the default, and what the module always did.
+    """
+
+    destination = "log"
+
+    def send_messages(self, messages: Sequence[ConfirmationMessage]) -> int:
+        for message in messages:
+            logger.info(message.body)
+        return len(messages)
+
+
+class SMTPTransport(BaseTransport):
+    """
+    Sends each confirmation as an email through Django's SMTP backend.
+
+    ``recipients`` is the fixed list of addresses to notify (appointments carry no email
+    address); the remaining options (host, port, username, password, use_tls, timeout, ...)
+    go to the backend and default to the ``EMAIL_*`` settings.
+    """
+
+    def __init__(
+        self,
+        recipients: Sequence[str] = (),
+        from_email: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        reuse_connections: bool = True,
+        **connection_options,
+    ):
+        self.recipients = list(recipients)
+        self.from_email = from_email
+        self.connection_options = connection_options
+        host = connection_options.get("host") or settings.EMAIL_HOST
+        port = connection_options.get("port") or settings.EMAIL_PORT
+        self.destination = f"smtp://{host}:{port}"
+        self.pool = ConnectionPool(self._open, self._close, pool_size if reuse_connections else 0)
+
+    def _open(self):
+        connection = get_connection(
+            "django.core.mail.backends.smtp.EmailBackend", fail_silently=False, **self.connection_options
+        )
+        connection.open()
+        return connection
+
+    @staticmethod
+    def _close(connection) -> None:
+        connection.close()
+
+    def send_messages(self, messages: Sequence[ConfirmationMessage]) -> int:
+        if not messages:
+            return 0
+        emails = [EmailMessage(m.subject, m.body, self.from_email, self.recipients) for m in messages]
+        try:
+            with self.pool.connection() as connection:
+                return connection.send_messages(emails)
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped an idle pooled connection; retry the batch once on a fresh one
+            with self.pool.connection() as connection:
+                return connection.send_messages(emails)
+
+    def close(self) -> None:
+        self.pool.close_all()
+
+
+class WebhookTransport(BaseTransport):
+    """
+    POSTs each confirmation as JSON to ``url`` over pooled keep-alive HTTP connections.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        timeout: float = 10,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        reuse_connections: bool = True,
+    ):
+        self.destination = url
+        parts = urlsplit(url)
+        self.scheme, self.netloc = parts.scheme, parts.netloc
+        self.path = parts.path or "/"
+        if parts.query:
+            self.path = f"{self.path}?{parts.query}"
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.timeout = timeout
+        self.pool = ConnectionPool(self._open, self._close, pool_size if reuse_connections else 0)
+
+    def _open(self) -> http.client.HTTPConnection:
+        connection_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return connection_class(self.netloc, timeout=self.timeout)
+
+    @staticmethod
+    def _close(connection: http.client.HTTPConnection) -> None:
+        connection.close()
+
+    def _post(self, connection: http.client.HTTPConnection, message: ConfirmationMessage) -> None:
+        connection.request("POST", self.path, body=json.dumps(message.as_dict()), headers=self.headers)
+        response = connection.getresponse()
+        response.read()  # Drain the body so the connection can be reused
+        if not 200 <= response.status < 300:
+            raise http.client.HTTPException(f"Webhook answered {response.status} {response.reason}")
+
+    def send_messages(self, messages: Sequence[ConfirmationMessage]) -> int:
+        sent = 0
+        try:
+            with self.pool.connection() as connection:
+                for message in messages:
+                    self._post(connection, message)
+                    sent += 1
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed an idle keep-alive connection; resume once on a fresh one
+            with self.pool.connection() as connection:
+                for message in messages[sent:]:
+                    self._post(connection, message)
+                    sent += 1
+        return sent
+
+    def close(self) -> None:
+        self.pool.close_all()
+
+
+_transport: Optional[BaseTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> BaseTransport:
+    """
+    Return the process-wide transport built from ``CONFIRMATION_TRANSPORT``.
+    """
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            config = getattr(settings, "CONFIRMATION_TRANSPORT", DEFAULT_TRANSPORT)
+            _transport = import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+        return _transport
+
+
+def reset_transport() -> None:
+    """
+    Close the current transport; the next ``get_transport`` call builds a new one.
+    """
+    global _transport
+    with _transport_lock:
+        transport, _transport = _transport, None
+    if transport is not None:
+        transport.close()
+
+
+def _settings_changed(setting, **kwargs):
+    if setting == "CONFIRMATION_TRANSPORT":
+        reset_transport()
+
+
+setting_changed.connect(_settings_changed)
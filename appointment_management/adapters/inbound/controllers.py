@@ -1,33 +1,208 @@
+from django.db import transaction
 from rest_framework import status
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
 
+from appointment_management.adapters.inbound.serializers import (
+    BulkAppointmentsSerializer,
+    DashboardQuerySerializer,
+    DoctorUpcomingQuerySerializer,
+    RescheduleAppointmentSerializer,
+    StatisticsQuerySerializer,
+)
 from appointment_management.adapters.outbound.appointment_repository_adapter import AppointmentRepositoryAdapter
-from appointment_management.domain.appointment_management_service import DoctorAppointmentManagementService
+from appointment_management.adapters.outbound.dashboard_projection_adapter import DashboardProjectionAdapter
+from appointment_management.adapters.outbound.notification_adapter import NotificationAdapter
+from appointment_management.adapters.outbound.reminder_adapter import ReminderAdapter
+from appointment_management.adapters.outbound.slot_inventory_adapter import SlotInventoryAdapter
+from appointment_management.adapters.outbound.statistics_adapter import StatisticsAdapter
+from appointment_management.domain.appointment_management_service import (
+    NOT_FOUND,
+    RESCHEDULED,
+    AppointmentsChanged,
+    DoctorAppointmentManagementService,
+)
+from doctor_appointment_app import conditional, versions
+from doctor_appointment_app.pagination import encode_cursor
+from doctor_appointment_app.streaming import (
+    STREAM_CHUNK_SIZE,
+    STREAMING_RENDERER_CLASSES,
+    streaming_json_response,
+    wants_streaming,
+)
+
+
+def _to_response_item(appt) -> dict:
+    return {
+        "id": str(appt.id),
+        "patient_name": appt.patient_name,
+        "reserved_at": appt.reserved_at.isoformat(),
+        "slot_time": appt.slot_time.isoformat(),
+        "doctor_id": str(appt.doctor_id) if appt.doctor_id else None,
+        "is_completed": appt.is_completed,
+        "is_canceled": appt.is_canceled,
+    }
+
+
+def _to_dashboard_day(day) -> dict:
+    return {
+        "day": day.day.isoformat(),
+        "slots_total": day.slots_total,
+        "slots_free": day.slots_free,
+        "appointments_open": day.appointments_open,
+        "appointments_completed": day.appointments_completed,
+        "appointments_canceled": day.appointments_canceled,
+    }
+
+
+def _to_statistics_item(row) -> dict:
+    return {
+        "doctor_id": str(row.doctor_id),
+        "period_start": row.period_start.isoformat(),
+        "slots_total": row.slots_total,
+        "slots_booked": row.slots_booked,
+        "slots_available": row.slots_available,
+        "appointments_canceled": row.appointments_canceled,
+        "cancellation_rate": round(row.cancellation_rate, 4),
+        "revenue": str(row.revenue),
+    }
+
+
+def _write_service() -> DoctorAppointmentManagementService:
+    """
+    The service wired with every outbound adapter a state change needs.
+    """
+    return DoctorAppointmentManagementService(
+        appointment_repository=AppointmentRepositoryAdapter(),
+        reminders=ReminderAdapter(),
+        slots=SlotInventoryAdapter(),
+        notifications=NotificationAdapter(),
+        dashboard=DashboardProjectionAdapter(),
+    )
 
 
 class UpcomingAppointmentsController(APIView):
     """
     Handles requests to view upcoming appointments for the doctor.
+    Supports streaming via ``?format=jsonstream`` or ``Accept: application/stream+json``,
+    and conditional GET: the ETag follows the appointments version and expires when the
+    earliest listed appointment stops being upcoming.
     """
 
+    renderer_classes = STREAMING_RENDERER_CLASSES
+
     def get(self, request):
         service = DoctorAppointmentManagementService(appointment_repository=AppointmentRepositoryAdapter())
+
+        if wants_streaming(request):
+            appointments = service.iter_upcoming_appointments(chunk_size=STREAM_CHUNK_SIZE)
+            return streaming_json_response(_to_response_item(appt) for appt in appointments)
+
+        version = versions.get_version(versions.APPOINTMENTS)
+        if conditional.is_not_modified(request, version, {}):
+            return conditional.not_modified_response(request)
+
         appointments = service.get_upcoming_appointments()
+        response_data = [_to_response_item(appt) for appt in appointments]
+        # Sorted by slot time, so the first one is the earliest to stop being upcoming
+        expires_at = appointments[0].slot_time if appointments else None
+        return Response(
+            response_data,
+            status=status.HTTP_200_OK,
+            headers={"ETag": conditional.make_etag(version, {}, expires_at)},
+        )
 
-        response_data = []
-        for appt in appointments:
-            response_data.append(
-                {
-                    "id": str(appt.id),
-                    "patient_name": appt.patient_name,
-                    "reserved_at": appt.reserved_at.isoformat(),
-                    "is_completed": appt.is_completed,
-                    "is_canceled": appt.is_canceled,
-                }
-            )
 
-        return Response(response_data, status=status.HTTP_200_OK)
+class DoctorUpcomingAppointmentsController(APIView):
+    """
+    Handles requests to view one doctor's upcoming appointments, a keyset-paginated page at a time,
+    ordered by appointment time and optionally limited to a ``from``/``to`` window.
+    Supports conditional GET like ``UpcomingAppointmentsController``.
+    """
+
+    def get(self, request, doctor_id):
+        query = DoctorUpcomingQuerySerializer(data=request.query_params.dict())
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        params = dict(query.validated_data)
+        page_size = params.pop("page_size")
+        after = params.pop("cursor", None)
+
+        page_params = {**params, "doctor_id": doctor_id, "after": after, "page_size": page_size}
+        version = versions.get_version(versions.APPOINTMENTS)
+        if conditional.is_not_modified(request, version, page_params):
+            return conditional.not_modified_response(request)
+
+        service = DoctorAppointmentManagementService(appointment_repository=AppointmentRepositoryAdapter())
+        # Fetch one extra row to know whether another page exists
+        appointments = service.get_upcoming_appointments_page(doctor_id, page_size + 1, after=after, **params)
+        next_url = None
+        if len(appointments) > page_size:
+            appointments = appointments[:page_size]
+            cursor = encode_cursor(appointments[-1].slot_time, appointments[-1].id)
+            next_url = replace_query_param(request.build_absolute_uri(), "cursor", cursor)
+
+        expires_at = appointments[0].slot_time if appointments else None
+        return Response(
+            {"next": next_url, "results": [_to_response_item(appt) for appt in appointments]},
+            status=status.HTTP_200_OK,
+            headers={"ETag": conditional.make_etag(version, page_params, expires_at)},
+        )
+
+
+class DoctorDashboardController(APIView):
+    """
+    Handles requests for a doctor's dashboard: per-day slot and appointment counts over a range
+    of days, read from the dashboard projection with one index range scan.
+    """
+
+    def get(self, request, doctor_id):
+        query = DashboardQuerySerializer(data=request.query_params.dict())
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        service = DoctorAppointmentManagementService(
+            appointment_repository=AppointmentRepositoryAdapter(), dashboard=DashboardProjectionAdapter()
+        )
+        days = service.get_dashboard(doctor_id, **query.validated_data)
+        return Response(
+            {
+                "doctor_id": str(doctor_id),
+                "from": query.validated_data["day_from"].isoformat(),
+                "to": query.validated_data["day_to"].isoformat(),
+                "days": [_to_dashboard_day(day) for day in days],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class AppointmentStatisticsController(APIView):
+    """
+    Handles requests for utilization and revenue statistics per doctor and day or week:
+    booked and available slots, cancellations and the revenue of the booked slots,
+    aggregated in the database.
+    """
+
+    def get(self, request):
+        query = StatisticsQuerySerializer(data=request.query_params.dict())
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        service = DoctorAppointmentManagementService(
+            appointment_repository=AppointmentRepositoryAdapter(), statistics=StatisticsAdapter()
+        )
+        rows = service.get_statistics(**query.validated_data)
+        return Response(
+            {
+                "period": query.validated_data["period"],
+                "from": query.validated_data["day_from"].isoformat(),
+                "to": query.validated_data["day_to"].isoformat(),
+                "results": [_to_statistics_item(row) for row in rows],
+            },
+            status=status.HTTP_200_OK,
+        )
 
 
 class MarkAppointmentCompletedController(APIView):
@@ -36,9 +211,11 @@ class MarkAppointmentCompletedController(APIView):
     """
 
     def post(self, request, appointment_id):
-        service = DoctorAppointmentManagementService(appointment_repository=AppointmentRepositoryAdapter())
+        service = _write_service()
 
-        success = service.mark_appointment_completed(appointment_id)
+        # The state change and the reminder cancellation commit together
+        with transaction.atomic():
+            success = service.mark_appointment_completed(appointment_id)
         if success:
             return Response({"detail": "Appointment marked as completed."}, status=status.HTTP_200_OK)
         return Response({"detail": "Unable to complete appointment."}, status=status.HTTP_400_BAD_REQUEST)
@@ -50,9 +227,92 @@ class CancelAppointmentController(APIView):
     """
 
     def post(self, request, appointment_id):
-        service = DoctorAppointmentManagementService(appointment_repository=AppointmentRepositoryAdapter())
+        service = _write_service()
 
-        success = service.cancel_appointment(appointment_id)
+        # The state change, the reminder cancellation and the slot release commit together
+        with transaction.atomic():
+            success = service.cancel_appointment(appointment_id)
         if success:
             return Response({"detail": "Appointment canceled."}, status=status.HTTP_200_OK)
         return Response({"detail": "Unable to cancel appointment."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class RescheduleAppointmentController(APIView):
+    """
+    Handles requests to move an appointment to another slot.
+    """
+
+    def post(self, request, appointment_id):
+        serializer = RescheduleAppointmentSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        service = _write_service()
+        # Reserving the new slot, moving the appointment and releasing the old slot commit together
+        try:
+            with transaction.atomic():
+                outcome, appointment = service.reschedule_appointment(
+                    appointment_id, serializer.validated_data["slot_id"]
+                )
+        except AppointmentsChanged:
+            return Response(
+                {"detail": "The appointment was changed by another request; try again."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        if outcome == RESCHEDULED:
+            return Response(
+                {**_to_response_item(appointment), "slot_id": str(appointment.slot_id)}, status=status.HTTP_200_OK
+            )
+        if outcome == NOT_FOUND:
+            return Response({"detail": "Appointment not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(
+            {"detail": "Unable to reschedule appointment.", "outcome": outcome}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+
+class BulkAppointmentsController(APIView):
+    """
+    Applies one state transition to a list of appointments in a single transaction and reports
+    the outcome per ID. Subclasses name the service method to call.
+    """
+
+    service_method = None
+
+    def post(self, request):
+        serializer = BulkAppointmentsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        service = _write_service()
+        try:
+            with transaction.atomic():
+                outcomes = getattr(service, self.service_method)(serializer.validated_data["appointment_ids"])
+        except AppointmentsChanged:
+            return Response(
+                {"detail": "Some appointments were changed by another request; try again."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(
+            {
+                "results": [
+                    {"id": str(appointment_id), "outcome": outcome} for appointment_id, outcome in outcomes.items()
+                ]
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class BulkMarkAppointmentsCompletedController(BulkAppointmentsController):
+    """
+    Handles requests to mark several appointments as completed.
+    """
+
+    service_method = "mark_appointments_completed"
+
+
+class BulkCancelAppointmentsController(BulkAppointmentsController):
+    """
+    Handles requests to cancel several appointments.
+    """
+
+    service_method = "cancel_appointments"
@@ -0,0 +1,43 @@
+"""
+Keeps the dashboard projection current with changes made by other modules.
+
+Connected in ``AppointmentManagementConfig.ready``. The signals are sent inside the transaction
+that made the change, so the projection commits or rolls back with it. Changes made by this
+module (completing, canceling, rescheduling) are counted by the domain service itself.
+"""
+
+import uuid
+from datetime import datetime
+from typing import List, Tuple
+
+from django.dispatch import receiver
+
+from appointment_booking.signals import appointments_booked
+from appointment_management.adapters.outbound.dashboard_projection_adapter import DashboardProjectionAdapter
+from appointment_management.ports.outbound.dashboard_port import APPOINTMENTS_OPEN, SLOTS_FREE, SLOTS_TOTAL
+from doctor_availability.signals import slots_created, slots_released, slots_reserved
+
+
+@receiver(slots_created, dispatch_uid="dashboard_count_created_slots")
+def count_created_slots(sender, doctor_id: uuid.UUID, slots: List[Tuple[uuid.UUID, datetime]], **kwargs):
+    changes = []
+    for _, slot_time in slots:
+        changes += [(doctor_id, slot_time, SLOTS_TOTAL, 1), (doctor_id, slot_time, SLOTS_FREE, 1)]
+    DashboardProjectionAdapter().apply_changes(changes)
+
+
+@receiver(slots_reserved, dispatch_uid="dashboard_count_reserved_slots")
+def count_reserved_slots(sender, doctor_id: uuid.UUID, slots: List[Tuple[uuid.UUID, datetime]], **kwargs):
+    DashboardProjectionAdapter().apply_changes((doctor_id, slot_time, SLOTS_FREE, -1) for _, slot_time in slots)
+
+
+@receiver(slots_released, dispatch_uid="dashboard_count_released_slots")
+def count_released_slots(sender, doctor_id: uuid.UUID, slots: List[Tuple[uuid.UUID, datetime]], **kwargs):
+    DashboardProjectionAdapter().apply_changes((doctor_id, slot_time, SLOTS_FREE, 1) for _, slot_time in slots)
+
+
+@receiver(appointments_booked, dispatch_uid="dashboard_count_booked_appointments")
+def count_booked_appointments(sender, appointments: List[Tuple[uuid.UUID, uuid.UUID, datetime]], **kwargs):
+    DashboardProjectionAdapter().apply_changes(
+        (doctor_id, slot_time, APPOINTMENTS_OPEN, 1) for _, doctor_id, slot_time in appointments
+    )
@@ -0,0 +1,115 @@
+from datetime import timedelta
+
+from django.utils.timezone import localdate
+from rest_framework import serializers
+
+from appointment_management.ports.outbound.statistics_port import DAY, PERIODS
+from doctor_appointment_app.pagination import decode_cursor
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_BULK_SIZE = 500
+DEFAULT_DASHBOARD_DAYS = 7
+MAX_DASHBOARD_DAYS = 92
+DEFAULT_STATISTICS_DAYS = 30
+MAX_STATISTICS_DAYS = 366
+
+
+class DoctorUpcomingQuerySerializer(serializers.Serializer):
+    """
+    Validates the query parameters of a doctor's upcoming appointments listing.
+    The ``from``/``to`` query parameters map to ``time_from``/``time_to``.
+    """
+
+    time_from = serializers.DateTimeField(required=False)
+    time_to = serializers.DateTimeField(required=False)
+    cursor = serializers.CharField(required=False)
+    page_size = serializers.IntegerField(min_value=1, max_value=MAX_PAGE_SIZE, default=DEFAULT_PAGE_SIZE)
+
+    def to_internal_value(self, data):
+        data = data.copy()
+        for param, field in (("from", "time_from"), ("to", "time_to")):
+            if param in data:
+                data[field] = data.pop(param)
+        return super().to_internal_value(data)
+
+    def validate_cursor(self, value):
+        """
+        Decode the cursor into a (slot_time, id) keyset position.
+        """
+        try:
+            return decode_cursor(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+    def validate(self, attrs):
+        if "time_from" in attrs and "time_to" in attrs and attrs["time_to"] <= attrs["time_from"]:
+            raise serializers.ValidationError({"time_to": "'to' must be after 'from'."})
+        return attrs
+
+
+class BulkAppointmentsSerializer(serializers.Serializer):
+    """
+    The appointments a bulk complete/cancel request applies to.
+    """
+
+    appointment_ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=MAX_BULK_SIZE)
+
+
+class RescheduleAppointmentSerializer(serializers.Serializer):
+    slot_id = serializers.UUIDField()
+
+
+class DashboardQuerySerializer(serializers.Serializer):
+    """
+    Validates the query parameters of a doctor's dashboard: an inclusive ``from``/``to`` range of
+    days (mapped to ``day_from``/``day_to``), by default the week starting today.
+    """
+
+    day_from = serializers.DateField(required=False)
+    day_to = serializers.DateField(required=False)
+
+    def to_internal_value(self, data):
+        data = data.copy()
+        for param, field in (("from", "day_from"), ("to", "day_to")):
+            if param in data:
+                data[field] = data.pop(param)
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        day_from = attrs.get("day_from") or localdate()
+        day_to = attrs.get("day_to") or day_from + timedelta(days=DEFAULT_DASHBOARD_DAYS - 1)
+        if day_to < day_from:
+            raise serializers.ValidationError({"day_to": "'to' must not be before 'from'."})
+        if (day_to - day_from).days >= MAX_DASHBOARD_DAYS:
+            raise serializers.ValidationError({"day_to": f"At most {MAX_DASHBOARD_DAYS} days at a time."})
+        return {"day_from": day_from, "day_to": day_to}
+
+
+class StatisticsQuerySerializer(serializers.Serializer):
+    """
+    Validates the query parameters of the statistics: the ``period`` to group by, an inclusive
+    ``from``/``to`` range of days (mapped to ``day_from``/``day_to``, by default the 30 days up to
+    today) and optionally one ``doctor_id``.
+    """
+
+    period = serializers.ChoiceField(choices=PERIODS, default=DAY)
+    day_from = serializers.DateField(required=False)
+    day_to = serializers.DateField(required=False)
+    doctor_id = serializers.UUIDField(required=False)
+
+    def to_internal_value(self, data):
+        data = data.copy()
+        for param, field in (("from", "day_from"), ("to", "day_to")):
+            if param in data:
+                data[field] = data.pop(param)
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        day_to = attrs.get("day_to") or localdate()
+        day_from = attrs.get("day_from") or day_to - timedelta(days=DEFAULT_STATISTICS_DAYS - 1)
+        if day_to < day_from:
+            raise serializers.ValidationError({"day_to": "'to' must not be before 'from'."})
+        if (day_to - day_from).days >= MAX_STATISTICS_DAYS:
+            raise serializers.ValidationError({"day_to": f"At most {MAX_STATISTICS_DAYS} days at a time."})
+        return {**attrs, "day_from": day_from, "day_to": day_to}
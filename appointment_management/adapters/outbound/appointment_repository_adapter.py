@@ -1,9 +1,24 @@
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from django.db.models import Q
 
 from appointment_booking.infrastructure.models import AppointmentModel
 from appointment_management.ports.outbound.appointment_repository_port import AppointmentRecord, IAppointmentRepository
+from doctor_appointment_app import versions
+
+RECORD_FIELDS = (
+    "id",
+    "slot_id",
+    "patient_id",
+    "patient_name",
+    "reserved_at",
+    "is_completed",
+    "is_canceled",
+    "slot_time",
+    "doctor_id",
+)
 
 
 class AppointmentRepositoryAdapter(IAppointmentRepository):
@@ -19,10 +34,71 @@ class AppointmentRepositoryAdapter(IAppointmentRepository):
         except AppointmentModel.DoesNotExist:
             return None
 
-    def find_upcoming(self, current_time: datetime) -> List[AppointmentRecord]:
-        qs = AppointmentModel.objects.filter(is_canceled=False, is_completed=False, reserved_at__gte=current_time)
+    def find_upcoming(self, current_time: datetime, doctor_id: Optional[uuid.UUID] = None) -> List[AppointmentRecord]:
+        qs = self._upcoming(current_time, doctor_id)
         return [self._to_record(am) for am in qs]  # am is short for AppointmentModel
 
+    def iter_upcoming(
+        self, current_time: datetime, chunk_size: int, doctor_id: Optional[uuid.UUID] = None
+    ) -> Iterator[AppointmentRecord]:
+        rows = self._upcoming(current_time, doctor_id).values(*RECORD_FIELDS).iterator(chunk_size=chunk_size)
+        return (AppointmentRecord(**row) for row in rows)
+
+    def find_upcoming_for_doctor(
+        self,
+        doctor_id: uuid.UUID,
+        current_time: datetime,
+        limit: int,
+        time_from: Optional[datetime] = None,
+        time_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[AppointmentRecord]:
+        qs = self._upcoming_for_doctor(doctor_id, current_time, time_from, time_to, after)
+        return [AppointmentRecord(**row) for row in qs.values(*RECORD_FIELDS)[:limit]]
+
+    @staticmethod
+    def _upcoming(current_time: datetime, doctor_id: Optional[uuid.UUID]):
+        # With a doctor this is a range scan of appointment_doctor_open_idx, already in (slot_time, id) order.
+        # ``__in=[False]`` compiles to ``IN (0)``, an equality SQLite can match against the index;
+        # ``=False`` compiles to ``NOT col``, which it cannot.
+        qs = AppointmentModel.objects.filter(
+            is_canceled__in=[False], is_completed__in=[False], slot_time__gte=current_time
+        )
+        if doctor_id is not None:
+            qs = qs.filter(doctor_id=doctor_id)
+        return qs.order_by("slot_time", "id")
+
+    @classmethod
+    def _upcoming_for_doctor(
+        cls,
+        doctor_id: uuid.UUID,
+        current_time: datetime,
+        time_from: Optional[datetime],
+        time_to: Optional[datetime],
+        after: Optional[Tuple[datetime, uuid.UUID]],
+    ):
+        qs = cls._upcoming(max(current_time, time_from) if time_from else current_time, doctor_id)
+        if time_to is not None:
+            qs = qs.filter(slot_time__lt=time_to)
+        if after is not None:
+            after_time, after_id = after
+            # slot_time >= t bounds the range scan; the OR only breaks ties within equal times
+            qs = qs.filter(Q(slot_time__gte=after_time) & (Q(slot_time__gt=after_time) | Q(id__gt=after_id)))
+        return qs
+
+    def find_many_for_update(self, appointment_ids: Sequence[uuid.UUID]) -> Dict[uuid.UUID, AppointmentRecord]:
+        rows = AppointmentModel.objects.select_for_update().filter(id__in=appointment_ids).values(*RECORD_FIELDS)
+        return {row["id"]: AppointmentRecord(**row) for row in rows}
+
+    def update_open(self, appointment_ids: Sequence[uuid.UUID], **fields) -> int:
+        # UPDATE ... WHERE id IN (...) AND is_canceled IN (0) AND is_completed IN (0)
+        updated = AppointmentModel.objects.filter(
+            id__in=appointment_ids, is_canceled__in=[False], is_completed__in=[False]
+        ).update(**fields)
+        if updated:
+            versions.bump_version_on_commit(versions.APPOINTMENTS)
+        return updated
+
     def save(self, appointment: AppointmentRecord) -> AppointmentRecord:
         app_model, _ = AppointmentModel.objects.update_or_create(
             id=appointment.id,
@@ -33,8 +109,11 @@ class AppointmentRepositoryAdapter(IAppointmentRepository):
                 "reserved_at": appointment.reserved_at,
                 "is_completed": appointment.is_completed,
                 "is_canceled": appointment.is_canceled,
+                "slot_time": appointment.slot_time,
+                "doctor_id": appointment.doctor_id,
             },
         )
+        versions.bump_version_on_commit(versions.APPOINTMENTS)
         return self._to_record(app_model)
 
     def _to_record(self, app_model: AppointmentModel) -> AppointmentRecord:
@@ -46,4 +125,6 @@ class AppointmentRepositoryAdapter(IAppointmentRepository):
             reserved_at=app_model.reserved_at,
             is_completed=getattr(app_model, "is_completed", False),
             is_canceled=getattr(app_model, "is_canceled", False),
+            slot_time=app_model.slot_time,
+            doctor_id=app_model.doctor_id,
         )
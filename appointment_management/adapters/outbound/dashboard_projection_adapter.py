@@ -0,0 +1,114 @@
+import uuid
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from appointment_booking.infrastructure.models import AppointmentModel
+from appointment_management.adapters.outbound.models import DoctorDayModel
+from appointment_management.ports.outbound.dashboard_port import (
+    APPOINTMENTS_CANCELED,
+    APPOINTMENTS_COMPLETED,
+    APPOINTMENTS_OPEN,
+    COUNTERS,
+    SLOTS_FREE,
+    SLOTS_TOTAL,
+    CounterChange,
+    DashboardDay,
+    IDashboardProjection,
+)
+from doctor_availability.models import Slot
+
+BULK_CREATE_BATCH_SIZE = 500
+
+
+class DashboardProjectionAdapter(IDashboardProjection):
+    """
+    Concrete implementation of IDashboardProjection using Django ORM.
+    """
+
+    def apply_changes(self, changes: Iterable[CounterChange]) -> None:
+        # One UPDATE per doctor and day touched, however many changes it got
+        by_day: Dict[Tuple[uuid.UUID, date], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for doctor_id, when, counter, delta in changes:
+            if doctor_id is None or when is None:
+                continue  # Appointments booked before slot times were copied onto them
+            by_day[(doctor_id, timezone.localdate(when))][counter] += delta
+
+        for (doctor_id, day), deltas in by_day.items():
+            deltas = {counter: delta for counter, delta in deltas.items() if delta}
+            if deltas:
+                self._add(doctor_id, day, deltas)
+
+    @staticmethod
+    def _add(doctor_id: uuid.UUID, day: date, deltas: Dict[str, int]) -> None:
+        increments = {counter: F(counter) + delta for counter, delta in deltas.items()}
+        if DoctorDayModel.objects.filter(doctor_id=doctor_id, day=day).update(**increments):
+            return
+        try:
+            # The savepoint keeps the caller's transaction usable if a concurrent write creates the row first
+            with transaction.atomic():
+                DoctorDayModel.objects.create(doctor_id=doctor_id, day=day, **deltas)
+        except IntegrityError:
+            DoctorDayModel.objects.filter(doctor_id=doctor_id, day=day).update(**increments)
+
+    def find_days(self, doctor_id: uuid.UUID, day_from: date, day_to: date) -> List[DashboardDay]:
+        rows = (
+            DoctorDayModel.objects.filter(doctor_id=doctor_id, day__gte=day_from, day__lte=day_to)
+            .order_by("day")
+            .values("day", *COUNTERS)
+        )
+        return [DashboardDay(**row) for row in rows]
+
+    def rebuild(self) -> int:
+        with transaction.atomic():
+            days = self._count_days()
+            DoctorDayModel.objects.all().delete()
+            DoctorDayModel.objects.bulk_create(
+                [
+                    DoctorDayModel(doctor_id=doctor_id, day=day, **counters)
+                    for (doctor_id, day), counters in days.items()
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE,
+            )
+        return len(days)
+
+    @staticmethod
+    def _count_days() -> Dict[Tuple[uuid.UUID, date], Dict[str, int]]:
+        """
+        Every counter recomputed with two grouped queries, one over slots and one over appointments.
+        """
+        days: Dict[Tuple[uuid.UUID, date], Dict[str, int]] = defaultdict(dict)
+        slots = (
+            Slot.objects.annotate(day=TruncDate("time"))
+            .values("doctor_id", "day")
+            .annotate(total=Count("id"), free=Count("id", filter=Q(is_reserved=False)))
+            .order_by()
+        )
+        for row in slots:
+            days[(row["doctor_id"], row["day"])].update({SLOTS_TOTAL: row["total"], SLOTS_FREE: row["free"]})
+
+        appointments = (
+            AppointmentModel.objects.filter(doctor_id__isnull=False, slot_time__isnull=False)
+            .annotate(day=TruncDate("slot_time"))
+            .values("doctor_id", "day")
+            .annotate(
+                open=Count("id", filter=Q(is_canceled=False, is_completed=False)),
+                completed=Count("id", filter=Q(is_completed=True)),
+                canceled=Count("id", filter=Q(is_canceled=True, is_completed=False)),
+            )
+            .order_by()
+        )
+        for row in appointments:
+            days[(row["doctor_id"], row["day"])].update(
+                {
+                    APPOINTMENTS_OPEN: row["open"],
+                    APPOINTMENTS_COMPLETED: row["completed"],
+                    APPOINTMENTS_CANCELED: row["canceled"],
+                }
+            )
+        return days
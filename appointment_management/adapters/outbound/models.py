@@ -0,0 +1,25 @@
+from django.db import models
+
+
+class DoctorDayModel(models.Model):
+    """
+    Dashboard projection: one row per doctor and day, updated in the same transaction as the
+    slots and appointments it counts, and rebuilt from them by ``rebuild_dashboard``.
+    """
+
+    doctor_id = models.UUIDField()
+    day = models.DateField()
+    slots_total = models.IntegerField(default=0)
+    slots_free = models.IntegerField(default=0)
+    appointments_open = models.IntegerField(default=0)
+    appointments_completed = models.IntegerField(default=0)
+    appointments_canceled = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # Also the index the dashboard reads a doctor's date range from
+            models.UniqueConstraint(fields=["doctor_id", "day"], name="dashboard_doctor_day_uniq"),
+        ]
+
+    def __str__(self):
+        return f"DoctorDay({self.doctor_id}, {self.day})"
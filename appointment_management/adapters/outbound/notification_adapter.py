@@ -0,0 +1,22 @@
+import uuid
+from datetime import datetime
+
+from appointment_confirmation.outbox import enqueue_appointment_confirmation
+from appointment_management.ports.outbound.notification_port import IAppointmentNotifications
+
+
+class NotificationAdapter(IAppointmentNotifications):
+    """
+    Concrete implementation of IAppointmentNotifications that queues the confirmation
+    in the appointment_confirmation outbox.
+    """
+
+    def send_rescheduled_confirmation(
+        self, appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
+    ) -> None:
+        enqueue_appointment_confirmation(
+            appointment_id=appointment_id,
+            patient_name=patient_name,
+            doctor_name=doctor_name,
+            appointment_time=appointment_time,
+        )
@@ -0,0 +1,25 @@
+import uuid
+from datetime import datetime
+from typing import Sequence
+
+from appointment_confirmation import reminders
+from appointment_management.ports.outbound.reminder_port import IAppointmentReminders
+
+
+class ReminderAdapter(IAppointmentReminders):
+    """
+    Concrete implementation of IAppointmentReminders backed by the
+    appointment_confirmation reminder scheduler.
+    """
+
+    def cancel_reminders(self, appointment_id: uuid.UUID) -> None:
+        reminders.record_canceled(appointment_id)
+
+    def cancel_reminders_bulk(self, appointment_ids: Sequence[uuid.UUID]) -> None:
+        reminders.record_canceled_many(appointment_ids)
+
+    def reschedule_reminders(
+        self, appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
+    ) -> None:
+        # A booking event for a known appointment replaces its scheduled reminders
+        reminders.record_booked(appointment_id, patient_name, doctor_name, appointment_time)
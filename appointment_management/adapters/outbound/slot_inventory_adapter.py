@@ -0,0 +1,20 @@
+import uuid
+from typing import Optional, Sequence
+
+from appointment_management.ports.outbound.slot_inventory_port import ISlotInventory, ReservedSlot
+from doctor_availability.services import SlotService
+
+
+class SlotInventoryAdapter(ISlotInventory):
+    """
+    Concrete implementation of ISlotInventory backed by the doctor_availability SlotService.
+    """
+
+    def reserve_slot(self, slot_id: uuid.UUID) -> Optional[ReservedSlot]:
+        slot = SlotService.reserve_slot(slot_id)
+        if slot is None:
+            return None
+        return ReservedSlot(id=slot.id, time=slot.time, doctor_id=slot.doctor_id, doctor_name=slot.doctor.name)
+
+    def release_slots(self, slot_ids: Sequence[uuid.UUID]) -> int:
+        return SlotService.release_slots(slot_ids)
@@ -0,0 +1,140 @@
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count, DateField, Exists, IntegerField, OuterRef, Q, QuerySet, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDate, TruncWeek
+from django.utils import timezone
+
+from appointment_booking.infrastructure.models import AppointmentModel
+from appointment_management.ports.outbound.statistics_port import (
+    DAY,
+    IStatisticsRepository,
+    PeriodStatistics,
+    period_length,
+    period_start,
+)
+from doctor_availability.models import Slot
+
+DEFAULT_CACHE_ALIAS = "default"
+DEFAULT_CACHE_TTL = 24 * 60 * 60  # seconds
+CENTS = Decimal("0.01")
+
+
+def _midnight(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+class StatisticsAdapter(IStatisticsRepository):
+    """
+    Concrete implementation of IStatisticsRepository using Django ORM: the grouping, counting
+    and summing run in one aggregate query over the slots.
+
+    Closed periods (those that ended before today) no longer change, so with
+    ``STATISTICS_CACHE_CLOSED_PERIODS`` on their rows are cached and only the periods from the
+    first uncached one onwards (normally just the current one) are queried again. A change made
+    to a closed period afterwards shows once its entry expires (``STATISTICS_CACHE_TTL``).
+    """
+
+    def __init__(self, cache_closed_periods: Optional[bool] = None):
+        if cache_closed_periods is None:
+            cache_closed_periods = getattr(settings, "STATISTICS_CACHE_CLOSED_PERIODS", True)
+        self.cache_closed_periods = cache_closed_periods
+
+    def find_statistics(
+        self, period: str, day_from: date, day_to: date, doctor_id: Optional[uuid.UUID] = None
+    ) -> List[PeriodStatistics]:
+        length = period_length(period)
+        starts = []
+        start = period_start(day_from, period)
+        while start <= day_to:
+            starts.append(start)
+            start += length
+        end = start
+
+        today = timezone.localdate()
+        closed = [start for start in starts if start + length <= today]
+        by_period: Dict[date, List[PeriodStatistics]] = {}
+        if self.cache_closed_periods and closed:
+            keys = {self._key(period, doctor_id, start): start for start in closed}
+            by_period = {keys[key]: rows for key, rows in self._cache().get_many(list(keys)).items()}
+
+        missing = [start for start in starts if start not in by_period]
+        if missing:
+            computed = self._compute(period, missing[0], end, doctor_id)
+            recomputed = [start for start in starts if start >= missing[0]]
+            for start in recomputed:
+                by_period[start] = computed.get(start, [])
+            if self.cache_closed_periods:
+                self._cache().set_many(
+                    {self._key(period, doctor_id, start): by_period[start] for start in recomputed if start in closed},
+                    timeout=getattr(settings, "STATISTICS_CACHE_TTL", DEFAULT_CACHE_TTL),
+                )
+
+        return [row for start in starts for row in by_period[start]]
+
+    @staticmethod
+    def _aggregate(period: str, start: date, end: date, doctor_id: Optional[uuid.UUID]) -> QuerySet:
+        """
+        One row per doctor and period in ``[start, end)``. Each slot's appointments are looked up
+        through the (slot_id, is_canceled) index.
+        """
+        appointments = AppointmentModel.objects.filter(slot_id=OuterRef("id"))
+        canceled = (
+            appointments.filter(is_canceled__in=[True])
+            .order_by()
+            .values("slot_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        truncate = TruncDate("time") if period == DAY else TruncWeek("time", output_field=DateField())
+
+        slots = Slot.objects.filter(time__gte=_midnight(start), time__lt=_midnight(end))
+        if doctor_id is not None:
+            slots = slots.filter(doctor_id=doctor_id)
+        return (
+            slots.annotate(
+                period_start=truncate,
+                is_booked=Exists(appointments.filter(is_canceled__in=[False])),
+                canceled=Coalesce(Subquery(canceled, output_field=IntegerField()), 0),
+            )
+            .values("doctor_id", "period_start")
+            .annotate(
+                slots_total=Count("id"),
+                slots_booked=Count("id", filter=Q(is_booked=True)),
+                appointments_canceled=Sum("canceled"),
+                revenue=Sum("cost", filter=Q(is_booked=True)),
+            )
+            .order_by("period_start", "doctor_id")
+        )
+
+    def _compute(
+        self, period: str, start: date, end: date, doctor_id: Optional[uuid.UUID]
+    ) -> Dict[date, List[PeriodStatistics]]:
+        by_period: Dict[date, List[PeriodStatistics]] = defaultdict(list)
+        for row in self._aggregate(period, start, end, doctor_id):
+            by_period[row["period_start"]].append(
+                PeriodStatistics(
+                    doctor_id=row["doctor_id"],
+                    period_start=row["period_start"],
+                    slots_total=row["slots_total"],
+                    slots_booked=row["slots_booked"],
+                    appointments_canceled=row["appointments_canceled"],
+                    # SQLite sums decimals as floats
+                    revenue=(row["revenue"] or Decimal("0")).quantize(CENTS),
+                )
+            )
+        return by_period
+
+    @staticmethod
+    def _cache():
+        return caches[getattr(settings, "STATISTICS_CACHE_ALIAS", DEFAULT_CACHE_ALIAS)]
+
+    @staticmethod
+    def _key(period: str, doctor_id: Optional[uuid.UUID], start: date) -> str:
+        scope = str(doctor_id) if doctor_id is not None else "all"
+        return f"appointments:statistics:{period}:{scope}:{start.isoformat()}"
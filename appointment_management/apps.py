@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AppointmentManagementConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "appointment_management"
+
+    def ready(self):
+        # Connect the dashboard projection to slot and booking changes
+        from appointment_management.adapters.inbound import dashboard_receivers  # noqa: F401
@@ -1,8 +1,38 @@
 import uuid
-from datetime import datetime
-from typing import List
+from datetime import date, datetime, timezone
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
-from appointment_management.ports.outbound.appointment_repository_port import IAppointmentRepository
+from appointment_management.ports.outbound.appointment_repository_port import AppointmentRecord, IAppointmentRepository
+from appointment_management.ports.outbound.dashboard_port import (
+    APPOINTMENTS_CANCELED,
+    APPOINTMENTS_COMPLETED,
+    APPOINTMENTS_OPEN,
+    CounterChange,
+    DashboardDay,
+    IDashboardProjection,
+)
+from appointment_management.ports.outbound.notification_port import IAppointmentNotifications
+from appointment_management.ports.outbound.reminder_port import IAppointmentReminders
+from appointment_management.ports.outbound.slot_inventory_port import ISlotInventory
+from appointment_management.ports.outbound.statistics_port import IStatisticsRepository, PeriodStatistics
+
+# Per-appointment outcomes of the bulk operations
+COMPLETED = "completed"
+CANCELED = "canceled"
+ALREADY_COMPLETED = "already_completed"
+ALREADY_CANCELED = "already_canceled"
+NOT_FOUND = "not_found"
+
+# Outcomes of a reschedule (besides NOT_FOUND and the ALREADY_* ones)
+RESCHEDULED = "rescheduled"
+SLOT_UNAVAILABLE = "slot_unavailable"
+
+
+class AppointmentsChanged(Exception):
+    """
+    Some of the appointments being closed were closed by another request in the meantime.
+    Nothing was applied; the caller's transaction should be rolled back.
+    """
 
 
 class DoctorAppointmentManagementService:
@@ -10,38 +40,206 @@ class DoctorAppointmentManagementService:
     Core domain service for managing the doctor's appointments.
     """
 
-    def __init__(self, appointment_repository: IAppointmentRepository):
+    def __init__(
+        self,
+        appointment_repository: IAppointmentRepository,
+        reminders: Optional[IAppointmentReminders] = None,
+        slots: Optional[ISlotInventory] = None,
+        notifications: Optional[IAppointmentNotifications] = None,
+        dashboard: Optional[IDashboardProjection] = None,
+        statistics: Optional[IStatisticsRepository] = None,
+    ):
         self.appointment_repository = appointment_repository
+        self.reminders = reminders
+        self.slots = slots
+        self.notifications = notifications
+        self.dashboard = dashboard
+        self.statistics = statistics
+
+    def get_upcoming_appointments(self, doctor_id: Optional[uuid.UUID] = None) -> List:
+        """
+        Retrieve all upcoming appointments (not canceled, not completed, and time is in the future),
+        optionally only those of one doctor, ordered by appointment time.
+        """
+        now = datetime.now(timezone.utc)
+        return self.appointment_repository.find_upcoming(now, doctor_id)
+
+    def iter_upcoming_appointments(self, chunk_size: int, doctor_id: Optional[uuid.UUID] = None) -> Iterator:
+        """
+        Lazily yield the upcoming appointments, for streaming large result sets.
+        """
+        now = datetime.now(timezone.utc)
+        return self.appointment_repository.iter_upcoming(now, chunk_size, doctor_id)
+
+    def get_upcoming_appointments_page(
+        self,
+        doctor_id: uuid.UUID,
+        limit: int,
+        time_from: Optional[datetime] = None,
+        time_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List:
+        """
+        Retrieve one page of a doctor's upcoming appointments, ordered by appointment time.
+        ``after`` is the (slot_time, id) of the last appointment on the previous page.
+        """
+        now = datetime.now(timezone.utc)
+        return self.appointment_repository.find_upcoming_for_doctor(
+            doctor_id, now, limit, time_from=time_from, time_to=time_to, after=after
+        )
 
-    def get_upcoming_appointments(self) -> List:
+    def get_dashboard(self, doctor_id: uuid.UUID, day_from: date, day_to: date) -> List[DashboardDay]:
         """
-        Retrieve all upcoming appointments (not canceled, not completed, and time is in the future).
+        Read the doctor's per-day counters for ``[day_from, day_to]`` from the dashboard projection.
         """
-        now = datetime.now()
-        return self.appointment_repository.find_upcoming(now)
+        return self.dashboard.find_days(doctor_id, day_from, day_to)
+
+    def get_statistics(
+        self, period: str, day_from: date, day_to: date, doctor_id: Optional[uuid.UUID] = None
+    ) -> List[PeriodStatistics]:
+        """
+        Utilization, cancellations and revenue per doctor (or of one doctor) and day or week,
+        for every period overlapping ``[day_from, day_to]``.
+        """
+        return self.statistics.find_statistics(period, day_from, day_to, doctor_id)
 
     def mark_appointment_completed(self, appointment_id: uuid.UUID) -> bool:
         """
         Mark an appointment as completed if it's valid and not already canceled or completed.
-        Returns True if successful, False otherwise.
+        Run it inside a transaction. Returns True if this call completed it, False otherwise.
         """
-        appointment = self.appointment_repository.find_by_id(appointment_id)
-        if not appointment or appointment.is_canceled or appointment.is_completed:
+        try:
+            return self.mark_appointments_completed([appointment_id])[appointment_id] == COMPLETED
+        except AppointmentsChanged:
             return False
 
-        appointment.is_completed = True
-        self.appointment_repository.save(appointment)
-        return True
-
     def cancel_appointment(self, appointment_id: uuid.UUID) -> bool:
         """
-        Cancel an appointment if it's valid and not already canceled or completed.
-        Returns True if successful, False otherwise.
+        Cancel an appointment if it's valid and not already canceled or completed,
+        and release its slot for booking again.
+        Run it inside a transaction. Returns True if this call canceled it, False otherwise.
         """
-        appointment = self.appointment_repository.find_by_id(appointment_id)
-        if not appointment or appointment.is_canceled or appointment.is_completed:
+        try:
+            return self.cancel_appointments([appointment_id])[appointment_id] == CANCELED
+        except AppointmentsChanged:
             return False
 
-        appointment.is_canceled = True
-        self.appointment_repository.save(appointment)
-        return True
+    def reschedule_appointment(
+        self, appointment_id: uuid.UUID, new_slot_id: uuid.UUID
+    ) -> Tuple[str, Optional[AppointmentRecord]]:
+        """
+        Move an open appointment to another slot: reserve the new slot with a conditional update,
+        point the appointment row at it, release the old slot and send one confirmation of the
+        new time. Needs the slot inventory; run it inside a transaction so the move applies as
+        a whole. Returns the outcome and, when rescheduled, the updated record; raises
+        AppointmentsChanged if the appointment was closed after it was read.
+        """
+        appointment = self.appointment_repository.find_many_for_update([appointment_id]).get(appointment_id)
+        if appointment is None:
+            return NOT_FOUND, None
+        if appointment.is_completed:
+            return ALREADY_COMPLETED, None
+        if appointment.is_canceled:
+            return ALREADY_CANCELED, None
+        if appointment.slot_id == new_slot_id:
+            return SLOT_UNAVAILABLE, None
+
+        slot = self.slots.reserve_slot(new_slot_id)
+        if slot is None:
+            return SLOT_UNAVAILABLE, None
+
+        old_slot_id, old_doctor_id, old_slot_time = appointment.slot_id, appointment.doctor_id, appointment.slot_time
+        appointment.slot_id, appointment.slot_time, appointment.doctor_id = slot.id, slot.time, slot.doctor_id
+        if not self.appointment_repository.update_open(
+            [appointment.id], slot_id=slot.id, slot_time=slot.time, doctor_id=slot.doctor_id
+        ):
+            # Closed by another request after it was read (storage without row locks); raising
+            # rolls back the new slot's reservation with the rest of the transaction
+            raise AppointmentsChanged()
+        self._release_slots([old_slot_id])
+        self._count(
+            [
+                (old_doctor_id, old_slot_time, APPOINTMENTS_OPEN, -1),
+                (slot.doctor_id, slot.time, APPOINTMENTS_OPEN, 1),
+            ]
+        )
+
+        if self.reminders is not None:
+            self.reminders.reschedule_reminders(appointment.id, appointment.patient_name, slot.doctor_name, slot.time)
+        if self.notifications is not None:
+            self.notifications.send_rescheduled_confirmation(
+                appointment.id, appointment.patient_name, slot.doctor_name, slot.time
+            )
+        return RESCHEDULED, appointment
+
+    def mark_appointments_completed(self, appointment_ids: Sequence[uuid.UUID]) -> Dict[uuid.UUID, str]:
+        """
+        Mark every open appointment among ``appointment_ids`` as completed.
+        Returns the outcome for each ID; run it inside a transaction so the batch applies as a whole.
+        """
+        outcomes, completed = self._close_appointments(appointment_ids, COMPLETED, is_completed=True)
+        self._count_closed(completed, APPOINTMENTS_COMPLETED)
+        return outcomes
+
+    def cancel_appointments(self, appointment_ids: Sequence[uuid.UUID]) -> Dict[uuid.UUID, str]:
+        """
+        Cancel every open appointment among ``appointment_ids`` and release their slots.
+        Returns the outcome for each ID; run it inside a transaction so the batch applies as a whole.
+        """
+        outcomes, canceled = self._close_appointments(appointment_ids, CANCELED, is_canceled=True)
+        self._release_slots([appointment.slot_id for appointment in canceled])
+        self._count_closed(canceled, APPOINTMENTS_CANCELED)
+        return outcomes
+
+    def _close_appointments(
+        self, appointment_ids: Sequence[uuid.UUID], outcome: str, **fields
+    ) -> Tuple[Dict[uuid.UUID, str], List[AppointmentRecord]]:
+        """
+        Apply ``fields`` to the open appointments among ``appointment_ids``, locking them first.
+        Returns the outcome per ID and the records of the appointments that changed; raises
+        AppointmentsChanged if the conditional update did not change all of them.
+        """
+        appointment_ids = list(dict.fromkeys(appointment_ids))
+        appointments = self.appointment_repository.find_many_for_update(appointment_ids)
+
+        outcomes = {}
+        closed = []
+        for appointment_id in appointment_ids:
+            appointment = appointments.get(appointment_id)
+            if appointment is None:
+                outcomes[appointment_id] = NOT_FOUND
+            elif appointment.is_completed:
+                outcomes[appointment_id] = ALREADY_COMPLETED
+            elif appointment.is_canceled:
+                outcomes[appointment_id] = ALREADY_CANCELED
+            else:
+                outcomes[appointment_id] = outcome
+                closed.append(appointment)
+
+        if closed:
+            closed_ids = [appointment.id for appointment in closed]
+            if self.appointment_repository.update_open(closed_ids, **fields) != len(closed):
+                # Storage without row locks let another request close some of them after the
+                # read. Which ones is unknown, so nothing is reported closed and no slot released.
+                raise AppointmentsChanged()
+            if self.reminders is not None:
+                self.reminders.cancel_reminders_bulk(closed_ids)
+        return outcomes, closed
+
+    def _release_slots(self, slot_ids: List[uuid.UUID]) -> None:
+        if self.slots is not None and slot_ids:
+            self.slots.release_slots(slot_ids)
+
+    def _count_closed(self, appointments: List[AppointmentRecord], counter: str) -> None:
+        """
+        Move closed appointments from the open counter of their day to ``counter``.
+        """
+        changes = []
+        for appointment in appointments:
+            changes.append((appointment.doctor_id, appointment.slot_time, APPOINTMENTS_OPEN, -1))
+            changes.append((appointment.doctor_id, appointment.slot_time, counter, 1))
+        self._count(changes)
+
+    def _count(self, changes: List[CounterChange]) -> None:
+        if self.dashboard is not None and changes:
+            self.dashboard.apply_changes(changes)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from appointment_management.adapters.outbound.dashboard_projection_adapter import DashboardProjectionAdapter
+
+
+class Command(BaseCommand):
+    help = "Recompute the doctor dashboard projection from the appointments and slots."
+
+    def handle(self, *args, **options):
+        days = DashboardProjectionAdapter().rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the dashboard for {days} doctor day(s)."))
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="DoctorDayModel",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("doctor_id", models.UUIDField()),
+                ("day", models.DateField()),
+                ("slots_total", models.IntegerField(default=0)),
+                ("slots_free", models.IntegerField(default=0)),
+                ("appointments_open", models.IntegerField(default=0)),
+                ("appointments_completed", models.IntegerField(default=0)),
+                ("appointments_canceled", models.IntegerField(default=0)),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("doctor_id", "day"), name="dashboard_doctor_day_uniq")],
+            },
+        ),
+    ]
@@ -1,3 +1,2 @@
-from django.db import models
-
-# Create your models here.
+# Django detects models in this module; the projection's model lives with its adapter.
+from .adapters.outbound.models import DoctorDayModel  # noqa
@@ -1,7 +1,7 @@
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 
 class AppointmentRecord:
@@ -19,6 +19,8 @@ class AppointmentRecord:
         reserved_at: datetime,
         is_completed: bool = False,
         is_canceled: bool = False,
+        slot_time: Optional[datetime] = None,
+        doctor_id: Optional[uuid.UUID] = None,
     ):
         self.id = id
         self.slot_id = slot_id
@@ -27,6 +29,8 @@ class AppointmentRecord:
         self.reserved_at = reserved_at
         self.is_completed = is_completed
         self.is_canceled = is_canceled
+        self.slot_time = slot_time
+        self.doctor_id = doctor_id
 
 
 class IAppointmentRepository(ABC):
@@ -39,12 +43,55 @@ class IAppointmentRepository(ABC):
         pass
 
     @abstractmethod
-    def find_upcoming(self, current_time: datetime) -> List[AppointmentRecord]:
+    def find_upcoming(self, current_time: datetime, doctor_id: Optional[uuid.UUID] = None) -> List[AppointmentRecord]:
         """
-        Retrieve all appointments that:
+        Retrieve all appointments (of ``doctor_id``, when given), ordered by slot time, that:
         - are not canceled
         - are not completed
-        - have a reserved_at time >= current_time
+        - have a slot_time >= current_time
+        """
+        pass
+
+    @abstractmethod
+    def iter_upcoming(
+        self, current_time: datetime, chunk_size: int, doctor_id: Optional[uuid.UUID] = None
+    ) -> Iterator[AppointmentRecord]:
+        """
+        Lazily yield the same appointments as ``find_upcoming``,
+        fetching ``chunk_size`` rows from storage at a time.
+        """
+        pass
+
+    @abstractmethod
+    def find_upcoming_for_doctor(
+        self,
+        doctor_id: uuid.UUID,
+        current_time: datetime,
+        limit: int,
+        time_from: Optional[datetime] = None,
+        time_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[AppointmentRecord]:
+        """
+        Retrieve at most ``limit`` upcoming appointments of one doctor, ordered by (slot_time, id),
+        with a slot_time in ``[time_from, time_to)`` when given. ``after`` is a keyset position:
+        only appointments strictly after that (slot_time, id) pair are returned.
+        """
+        pass
+
+    @abstractmethod
+    def find_many_for_update(self, appointment_ids: Sequence[uuid.UUID]) -> Dict[uuid.UUID, AppointmentRecord]:
+        """
+        Return the records of those of ``appointment_ids`` that exist, keyed by id, locking the
+        rows until the end of the current transaction where storage supports it.
+        """
+        pass
+
+    @abstractmethod
+    def update_open(self, appointment_ids: Sequence[uuid.UUID], **fields) -> int:
+        """
+        Apply ``fields`` to those of ``appointment_ids`` that are neither canceled nor completed,
+        with one conditional update. Returns how many appointments were changed.
         """
         pass
 
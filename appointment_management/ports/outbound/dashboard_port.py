@@ -0,0 +1,65 @@
+import uuid
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Iterable, List, Tuple
+
+# Counters of the dashboard projection, kept per doctor and day
+SLOTS_TOTAL = "slots_total"
+SLOTS_FREE = "slots_free"
+APPOINTMENTS_OPEN = "appointments_open"
+APPOINTMENTS_COMPLETED = "appointments_completed"
+APPOINTMENTS_CANCELED = "appointments_canceled"
+COUNTERS = (SLOTS_TOTAL, SLOTS_FREE, APPOINTMENTS_OPEN, APPOINTMENTS_COMPLETED, APPOINTMENTS_CANCELED)
+
+# A change to apply: (doctor_id, a time on the day, counter, delta)
+CounterChange = Tuple[uuid.UUID, datetime, str, int]
+
+
+class DashboardDay:
+    """
+    One doctor's day as the dashboard sees it.
+    """
+
+    def __init__(
+        self,
+        day: date,
+        slots_total: int = 0,
+        slots_free: int = 0,
+        appointments_open: int = 0,
+        appointments_completed: int = 0,
+        appointments_canceled: int = 0,
+    ):
+        self.day = day
+        self.slots_total = slots_total
+        self.slots_free = slots_free
+        self.appointments_open = appointments_open
+        self.appointments_completed = appointments_completed
+        self.appointments_canceled = appointments_canceled
+
+
+class IDashboardProjection(ABC):
+    """
+    Outbound port for the doctor dashboard's read model: per-doctor, per-day counters kept up
+    to date by the write paths instead of being computed from appointments and slots on read.
+    """
+
+    @abstractmethod
+    def apply_changes(self, changes: Iterable[CounterChange]) -> None:
+        """
+        Add each delta to its counter, as part of the current transaction.
+        """
+        pass
+
+    @abstractmethod
+    def find_days(self, doctor_id: uuid.UUID, day_from: date, day_to: date) -> List[DashboardDay]:
+        """
+        Return the doctor's days in ``[day_from, day_to]`` that have any slots or appointments, in order.
+        """
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """
+        Recompute every counter from the appointments and slots. Returns how many days were written.
+        """
+        pass
@@ -0,0 +1,18 @@
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class IAppointmentNotifications(ABC):
+    """
+    Outbound port for notifying patients about changes to their appointments.
+    """
+
+    @abstractmethod
+    def send_rescheduled_confirmation(
+        self, appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
+    ) -> None:
+        """
+        Confirm the appointment's new time. Called inside the transaction that moved it.
+        """
+        pass
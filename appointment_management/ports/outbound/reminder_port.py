@@ -0,0 +1,33 @@
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Sequence
+
+
+class IAppointmentReminders(ABC):
+    """
+    Outbound port for the reminders scheduled ahead of an appointment.
+    """
+
+    @abstractmethod
+    def cancel_reminders(self, appointment_id: uuid.UUID) -> None:
+        """
+        Stop any reminders still pending for the appointment.
+        """
+        pass
+
+    @abstractmethod
+    def cancel_reminders_bulk(self, appointment_ids: Sequence[uuid.UUID]) -> None:
+        """
+        Stop any reminders still pending for several appointments at once.
+        """
+        pass
+
+    @abstractmethod
+    def reschedule_reminders(
+        self, appointment_id: uuid.UUID, patient_name: str, doctor_name: str, appointment_time: datetime
+    ) -> None:
+        """
+        Replace the appointment's pending reminders with ones ahead of its new time.
+        """
+        pass
@@ -0,0 +1,38 @@
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, Sequence
+
+
+class ReservedSlot:
+    """
+    What appointment management needs to know about a slot it reserved.
+    """
+
+    def __init__(self, id: uuid.UUID, time: datetime, doctor_id: uuid.UUID, doctor_name: str):
+        self.id = id
+        self.time = time
+        self.doctor_id = doctor_id
+        self.doctor_name = doctor_name
+
+
+class ISlotInventory(ABC):
+    """
+    Outbound port for the doctor's slot inventory.
+    """
+
+    @abstractmethod
+    def reserve_slot(self, slot_id: uuid.UUID) -> Optional[ReservedSlot]:
+        """
+        Reserve a free slot with a conditional update, as part of the current transaction.
+        Returns None if the slot does not exist or is not free.
+        """
+        pass
+
+    @abstractmethod
+    def release_slots(self, slot_ids: Sequence[uuid.UUID]) -> int:
+        """
+        Make the slots of canceled appointments available for booking again,
+        as part of the current transaction. Returns how many were released.
+        """
+        pass
@@ -0,0 +1,73 @@
+import uuid
+from abc import ABC, abstractmethod
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import List, Optional
+
+# Periods the statistics are grouped by
+DAY = "day"
+WEEK = "week"  # ISO weeks, starting on Monday
+PERIODS = (DAY, WEEK)
+
+
+def period_start(day: date, period: str) -> date:
+    """
+    First day of the period that contains ``day``.
+    """
+    return day - timedelta(days=day.weekday()) if period == WEEK else day
+
+
+def period_length(period: str) -> timedelta:
+    return timedelta(days=7 if period == WEEK else 1)
+
+
+class PeriodStatistics:
+    """
+    One doctor's utilization and revenue over one period. A slot counts as booked while it has
+    an appointment that is not canceled; revenue is the cost of the booked slots.
+    """
+
+    def __init__(
+        self,
+        doctor_id: uuid.UUID,
+        period_start: date,
+        slots_total: int = 0,
+        slots_booked: int = 0,
+        appointments_canceled: int = 0,
+        revenue: Decimal = Decimal("0"),
+    ):
+        self.doctor_id = doctor_id
+        self.period_start = period_start
+        self.slots_total = slots_total
+        self.slots_booked = slots_booked
+        self.appointments_canceled = appointments_canceled
+        self.revenue = revenue
+
+    @property
+    def slots_available(self) -> int:
+        return self.slots_total - self.slots_booked
+
+    @property
+    def cancellation_rate(self) -> float:
+        """
+        Share of the period's appointments that were canceled (0 when it had none).
+        """
+        appointments = self.slots_booked + self.appointments_canceled
+        return self.appointments_canceled / appointments if appointments else 0.0
+
+
+class IStatisticsRepository(ABC):
+    """
+    Outbound port for utilization and revenue statistics, grouped per doctor and period.
+    """
+
+    @abstractmethod
+    def find_statistics(
+        self, period: str, day_from: date, day_to: date, doctor_id: Optional[uuid.UUID] = None
+    ) -> List[PeriodStatistics]:
+        """
+        Return the statistics of every period overlapping ``[day_from, day_to]`` (whole periods,
+        so a week starting before ``day_from`` is counted in full), ordered by period and doctor.
+        Doctors without slots in a period are left out of it.
+        """
+        pass
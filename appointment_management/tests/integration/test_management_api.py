@@ -1,30 +1,49 @@
+import json
 import uuid
+from datetime import datetime, time
+from io import StringIO
+from unittest.mock import patch
 
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
-from django.utils.timezone import now, timedelta
+from django.utils.timezone import localdate, make_aware, now, timedelta
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from appointment_booking.infrastructure.models import AppointmentModel
+from appointment_confirmation.models import OutboxMessage, ReminderEvent
+from appointment_management.adapters.outbound.appointment_repository_adapter import AppointmentRepositoryAdapter
+from appointment_management.adapters.outbound.models import DoctorDayModel
+from appointment_management.adapters.outbound.statistics_adapter import StatisticsAdapter
+from appointment_management.ports.outbound.statistics_port import WEEK, period_start
+from doctor_availability import cache as listing_cache
+from doctor_availability.models import Doctor, Slot
+from doctor_availability.services import SlotService
 
 
 class AppointmentManagementAPITest(TestCase):
     def setUp(self):
         self.client = APIClient()
+        self.doctor_id = uuid.uuid4()
 
-        # Create some sample appointments
+        # Create some sample appointments; both were booked in the past
         self.app1 = AppointmentModel.objects.create(
             slot_id=uuid.uuid4(),
             patient_id=uuid.uuid4(),
             patient_name="Alice",
-            reserved_at=now() + timedelta(days=1),
+            reserved_at=now() - timedelta(days=2),
+            slot_time=now() + timedelta(days=1),
+            doctor_id=self.doctor_id,
         )
         self.app2 = AppointmentModel.objects.create(
             slot_id=uuid.uuid4(),
             patient_id=uuid.uuid4(),
             patient_name="Bob",
-            reserved_at=now() - timedelta(days=1),  # Past appointment
+            reserved_at=now() - timedelta(days=2),
+            slot_time=now() - timedelta(days=1),  # Past appointment
+            doctor_id=self.doctor_id,
         )
 
     def test_get_upcoming_appointments(self):
@@ -35,6 +54,41 @@ class AppointmentManagementAPITest(TestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["patient_name"], "Alice")
 
+    def test_get_upcoming_appointments_streaming(self):
+        url = reverse("upcoming-appointments")
+        response = self.client.get(url, {"format": "jsonstream"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["patient_name"], "Alice")
+        self.assertEqual(data[0]["id"], str(self.app1.id))
+
+    def test_get_upcoming_appointments_conditional_get(self):
+        url = reverse("upcoming-appointments")
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("cancel-appointment", args=[str(self.app1.id)]))
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+    def test_get_upcoming_appointments_etag_expires(self):
+        # The ETag stops matching once the earliest listed appointment is in the past
+        url = reverse("upcoming-appointments")
+        AppointmentModel.objects.filter(id=self.app1.id).update(slot_time=now() + timedelta(seconds=1))
+        etag = self.client.get(url)["ETag"]
+
+        with patch("doctor_appointment_app.conditional.timezone.now", return_value=now() + timedelta(seconds=2)):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_mark_appointment_completed(self):
         url = reverse("mark-appointment-completed", args=[str(self.app1.id)])
         response = self.client.post(url)
@@ -48,3 +102,476 @@ class AppointmentManagementAPITest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.app1.refresh_from_db()
         self.assertTrue(self.app1.is_canceled)
+        self.assertTrue(
+            ReminderEvent.objects.filter(appointment_id=self.app1.id, action=ReminderEvent.CANCELED).exists()
+        )
+
+    def test_cancel_appointment_releases_the_slot(self):
+        doctor = Doctor.objects.create(name="Dr. Ahmed")
+        slot = Slot.objects.create(doctor=doctor, time=now() + timedelta(days=1), cost=100, is_reserved=True)
+        appointment = AppointmentModel.objects.create(
+            slot_id=slot.id, patient_id=uuid.uuid4(), patient_name="Carol", slot_time=slot.time, doctor_id=doctor.id
+        )
+        version = listing_cache.current_version(doctor.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("cancel-appointment", args=[str(appointment.id)]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        slot.refresh_from_db()
+        self.assertFalse(slot.is_reserved)
+        self.assertNotEqual(listing_cache.current_version(doctor.id), version)
+
+        # The released slot can be booked again
+        response = self.client.post(
+            reverse("book-appointment"),
+            {"slot_id": str(slot.id), "patient_id": str(uuid.uuid4()), "patient_name": "Dave"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_completing_an_appointment_keeps_the_slot_reserved(self):
+        doctor = Doctor.objects.create(name="Dr. Ahmed")
+        slot = Slot.objects.create(doctor=doctor, time=now() + timedelta(days=1), cost=100, is_reserved=True)
+        appointment = AppointmentModel.objects.create(
+            slot_id=slot.id, patient_id=uuid.uuid4(), patient_name="Carol", slot_time=slot.time, doctor_id=doctor.id
+        )
+
+        self.client.post(reverse("mark-appointment-completed", args=[str(appointment.id)]))
+        slot.refresh_from_db()
+        self.assertTrue(slot.is_reserved)
+
+
+class BulkAppointmentsAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.doctor = Doctor.objects.create(name="Dr. Ahmed")
+
+    def create(self, **fields):
+        slot = Slot.objects.create(doctor=self.doctor, time=now() + timedelta(hours=1), cost=100, is_reserved=True)
+        return AppointmentModel.objects.create(
+            slot_id=slot.id,
+            patient_id=uuid.uuid4(),
+            patient_name="Patient",
+            slot_time=slot.time,
+            doctor_id=self.doctor.id,
+            **fields,
+        )
+
+    def test_bulk_complete_reports_each_outcome(self):
+        open_ids = [self.create().id for _ in range(3)]
+        completed = self.create(is_completed=True)
+        canceled = self.create(is_canceled=True)
+        missing = uuid.uuid4()
+        ids = open_ids + [completed.id, canceled.id, missing, open_ids[0]]
+
+        response = self.client.post(
+            reverse("bulk-complete-appointments"), {"appointment_ids": [str(i) for i in ids]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            [{"id": str(i), "outcome": "completed"} for i in open_ids]
+            + [
+                {"id": str(completed.id), "outcome": "already_completed"},
+                {"id": str(canceled.id), "outcome": "already_canceled"},
+                {"id": str(missing), "outcome": "not_found"},
+            ],
+        )
+        self.assertEqual(AppointmentModel.objects.filter(id__in=open_ids, is_completed=True).count(), 3)
+        self.assertEqual(ReminderEvent.objects.filter(action=ReminderEvent.CANCELED).count(), 3)
+
+    def test_bulk_cancel_query_count_does_not_grow_with_the_batch(self):
+        ids = [str(self.create().id) for _ in range(50)]
+        # Savepoint, select and conditional update of the appointments, reminder events insert,
+        # select and conditional update of the slots, waitlist lookup, the dashboard counters of
+        # the released slots and of the canceled appointments (one day each), release savepoint
+        call_command("rebuild_dashboard", stdout=StringIO())
+        with self.assertNumQueries(10):
+            response = self.client.post(reverse("bulk-cancel-appointments"), {"appointment_ids": ids}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(AppointmentModel.objects.filter(is_canceled=True).count(), 50)
+        self.assertFalse(Slot.objects.filter(is_reserved=True).exists())
+
+    def test_bulk_rejects_invalid_ids(self):
+        response = self.client.post(
+            reverse("bulk-cancel-appointments"), {"appointment_ids": ["not-a-uuid"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(reverse("bulk-cancel-appointments"), {"appointment_ids": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class RescheduleAppointmentAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.doctor = Doctor.objects.create(name="Dr. Ahmed")
+        self.old_slot = Slot.objects.create(
+            doctor=self.doctor, time=now() + timedelta(days=1), cost=100, is_reserved=True
+        )
+        self.new_slot = Slot.objects.create(doctor=self.doctor, time=now() + timedelta(days=3), cost=100)
+        self.appointment = AppointmentModel.objects.create(
+            slot_id=self.old_slot.id,
+            patient_id=uuid.uuid4(),
+            patient_name="Alice",
+            slot_time=self.old_slot.time,
+            doctor_id=self.doctor.id,
+        )
+        self.url = reverse("reschedule-appointment", args=[self.appointment.id])
+
+    def test_moves_the_appointment_and_swaps_the_slots(self):
+        response = self.client.post(self.url, {"slot_id": str(self.new_slot.id)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["slot_id"], str(self.new_slot.id))
+        self.assertEqual(response.data["slot_time"], self.new_slot.time.isoformat())
+
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.slot_id, self.new_slot.id)
+        self.assertEqual(self.appointment.slot_time, self.new_slot.time)
+        self.assertFalse(self.appointment.is_canceled)
+        self.assertFalse(Slot.objects.get(id=self.old_slot.id).is_reserved)
+        self.assertTrue(Slot.objects.get(id=self.new_slot.id).is_reserved)
+
+        # One confirmation of the new time; the reminders follow the appointment
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.payload["appointment_id"], str(self.appointment.id))
+        self.assertEqual(message.payload["appointment_time"], self.new_slot.time.isoformat())
+        event = ReminderEvent.objects.get()
+        self.assertEqual(event.action, ReminderEvent.BOOKED)
+
+    def test_taken_slot_leaves_everything_as_it_was(self):
+        Slot.objects.filter(id=self.new_slot.id).update(is_reserved=True)
+
+        response = self.client.post(self.url, {"slot_id": str(self.new_slot.id)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["outcome"], "slot_unavailable")
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.slot_id, self.old_slot.id)
+        self.assertTrue(Slot.objects.get(id=self.old_slot.id).is_reserved)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_appointment_closed_after_the_read_rolls_the_move_back(self):
+        # Replays a reschedule that read the appointment as open (no row locks on SQLite) while
+        # another request canceled it: the conditional update misses, so nothing may change
+        stale = AppointmentRepositoryAdapter().find_many_for_update([self.appointment.id])
+        AppointmentModel.objects.filter(id=self.appointment.id).update(is_canceled=True)
+
+        with patch.object(AppointmentRepositoryAdapter, "find_many_for_update", return_value=stale):
+            response = self.client.post(self.url, {"slot_id": str(self.new_slot.id)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.slot_id, self.old_slot.id)
+        self.assertFalse(Slot.objects.get(id=self.new_slot.id).is_reserved)
+        self.assertTrue(Slot.objects.get(id=self.old_slot.id).is_reserved)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_closed_or_unknown_appointments_are_not_moved(self):
+        AppointmentModel.objects.filter(id=self.appointment.id).update(is_canceled=True)
+        response = self.client.post(self.url, {"slot_id": str(self.new_slot.id)}, format="json")
+        self.assertEqual(response.data["outcome"], "already_canceled")
+        self.assertFalse(Slot.objects.get(id=self.new_slot.id).is_reserved)
+
+        url = reverse("reschedule-appointment", args=[uuid.uuid4()])
+        response = self.client.post(url, {"slot_id": str(self.new_slot.id)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class DoctorUpcomingAppointmentsAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.doctor_id = uuid.uuid4()
+        self.url = reverse("doctor-upcoming-appointments", args=[str(self.doctor_id)])
+        self.start = now().replace(microsecond=0) + timedelta(days=1)
+        # Five appointments an hour apart; the last two share a time to exercise the id tie-break
+        for i, hours in enumerate([0, 1, 2, 3, 3]):
+            self.create(f"Patient {i}", self.start + timedelta(hours=hours))
+        self.create("Past", now() - timedelta(hours=1))
+        self.create("Other doctor", self.start, doctor_id=uuid.uuid4())
+        self.create("Canceled", self.start, is_canceled=True)
+
+    def create(self, patient_name, slot_time, doctor_id=None, **fields):
+        return AppointmentModel.objects.create(
+            slot_id=uuid.uuid4(),
+            patient_id=uuid.uuid4(),
+            patient_name=patient_name,
+            slot_time=slot_time,
+            doctor_id=doctor_id or self.doctor_id,
+            **fields,
+        )
+
+    def test_pages_through_the_doctors_appointments_in_time_order(self):
+        seen = []
+        url = self.url + "?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            seen.extend(response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len({item["id"] for item in seen}), 5)
+        self.assertEqual([item["slot_time"] for item in seen], sorted(item["slot_time"] for item in seen))
+        self.assertTrue(all(item["doctor_id"] == str(self.doctor_id) for item in seen))
+
+    def test_time_window(self):
+        response = self.client.get(
+            self.url,
+            {
+                "from": (self.start + timedelta(minutes=30)).isoformat(),
+                "to": (self.start + timedelta(hours=3)).isoformat(),
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["patient_name"] for item in response.data["results"]], ["Patient 1", "Patient 2"])
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_parameters(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cursor", response.data)
+
+        response = self.client.get(self.url, {"from": self.start.isoformat(), "to": self.start.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("time_to", response.data)
+
+    def test_conditional_get(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(self.url, {"page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class AppointmentRepositoryAdapterTest(TestCase):
+    def setUp(self):
+        self.repository = AppointmentRepositoryAdapter()
+        self.doctor_id = uuid.uuid4()
+
+    def create(self, patient_name, slot_time, doctor_id=None, **fields):
+        return AppointmentModel.objects.create(
+            slot_id=uuid.uuid4(),
+            patient_id=uuid.uuid4(),
+            patient_name=patient_name,
+            slot_time=slot_time,
+            doctor_id=doctor_id or self.doctor_id,
+            **fields,
+        )
+
+    def test_find_upcoming_filters_on_slot_time_in_order(self):
+        self.create("Later", now() + timedelta(days=2))
+        self.create("Sooner", now() + timedelta(hours=2))
+        self.create("Past", now() - timedelta(hours=2))
+        self.create("Canceled", now() + timedelta(days=1), is_canceled=True)
+        self.create("Other doctor", now() + timedelta(days=1), doctor_id=uuid.uuid4())
+
+        upcoming = self.repository.find_upcoming(now(), self.doctor_id)
+        self.assertEqual([record.patient_name for record in upcoming], ["Sooner", "Later"])
+        self.assertEqual(len(self.repository.find_upcoming(now())), 3)
+
+    def test_find_upcoming_for_doctor_is_an_index_range_scan(self):
+        """
+        Test that a doctor's upcoming list uses the composite index and needs no sort step.
+        """
+        plan = self.repository._upcoming(now(), self.doctor_id).explain()
+        self.assertIn("appointment_doctor_open_idx", plan)
+        self.assertIn("slot_time>?", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_keyset_page_for_doctor_is_an_index_range_scan(self):
+        """
+        Test that a page after a cursor is still a single range scan of the composite index.
+        """
+        qs = self.repository._upcoming_for_doctor(
+            self.doctor_id, now(), None, now() + timedelta(days=7), (now() + timedelta(hours=1), uuid.uuid4())
+        )
+        plan = qs.explain()
+        self.assertIn("appointment_doctor_open_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+
+class DoctorDashboardAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.doctor = Doctor.objects.create(name="Dr. Ahmed")
+        self.day = (now() + timedelta(days=2)).date()
+        self.slots = [SlotService.create_slot(self.doctor.id, self.at(self.day, hour), 100) for hour in (9, 10, 11, 12)]
+        self.next_day_slot = SlotService.create_slot(self.doctor.id, self.at(self.day + timedelta(days=1), 9), 100)
+        self.url = reverse("doctor-dashboard", args=[self.doctor.id])
+
+    @staticmethod
+    def at(day, hour):
+        return make_aware(datetime.combine(day, time(hour)))
+
+    def book(self, slot):
+        response = self.client.post(
+            reverse("book-appointment"),
+            {"slot_id": str(slot.id), "patient_id": str(uuid.uuid4()), "patient_name": "Alice"},
+            format="json",
+        )
+        return response.data["id"]
+
+    def dashboard(self):
+        response = self.client.get(self.url, {"from": self.day.isoformat(), "to": str(self.day + timedelta(days=1))})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["days"]
+
+    def test_projection_follows_every_write_path_and_matches_a_rebuild(self):
+        completed, canceled, moved, bulk_canceled = (self.book(slot) for slot in self.slots)
+        self.client.post(reverse("mark-appointment-completed", args=[completed]))
+        self.client.post(reverse("cancel-appointment", args=[canceled]))
+        self.client.post(reverse("bulk-cancel-appointments"), {"appointment_ids": [bulk_canceled]}, format="json")
+        self.client.post(
+            reverse("reschedule-appointment", args=[moved]), {"slot_id": str(self.next_day_slot.id)}, format="json"
+        )
+
+        days = self.dashboard()
+        self.assertEqual(
+            days,
+            [
+                {
+                    "day": self.day.isoformat(),
+                    "slots_total": 4,
+                    "slots_free": 3,
+                    "appointments_open": 0,
+                    "appointments_completed": 1,
+                    "appointments_canceled": 2,
+                },
+                {
+                    "day": (self.day + timedelta(days=1)).isoformat(),
+                    "slots_total": 1,
+                    "slots_free": 0,
+                    "appointments_open": 1,
+                    "appointments_completed": 0,
+                    "appointments_canceled": 0,
+                },
+            ],
+        )
+
+        call_command("rebuild_dashboard", stdout=StringIO())
+        self.assertEqual(self.dashboard(), days)
+
+    def test_dashboard_is_one_index_range_scan(self):
+        with self.assertNumQueries(1):
+            self.dashboard()
+
+        qs = DoctorDayModel.objects.filter(
+            doctor_id=self.doctor.id, day__gte=self.day, day__lte=self.day + timedelta(days=6)
+        ).order_by("day")
+        plan = qs.explain()
+        # SQLite backs the (doctor_id, day) unique constraint with an automatic index
+        self.assertIn("USING INDEX", plan)
+        self.assertIn("doctor_id=? AND day>? AND day<?", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_invalid_range(self):
+        response = self.client.get(self.url, {"from": "2030-01-10", "to": "2030-01-09"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {"from": "2030-01-01", "to": "2030-12-31"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AppointmentStatisticsAPITest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("appointment-statistics")
+        self.ahmed = Doctor.objects.create(name="Dr. Ahmed")
+        self.sara = Doctor.objects.create(name="Dr. Sara")
+        # A Monday two weeks back, so its week is closed
+        self.monday = period_start(localdate() - timedelta(days=14), WEEK)
+
+        booked, rebooked, canceled, _free = (
+            self.slot(self.ahmed, self.monday, hour, cost) for hour, cost in ((9, 100), (10, 150), (11, 200), (12, 80))
+        )
+        self.slot(self.ahmed, self.monday + timedelta(days=1), 9, 50)
+        self.appointment(booked, is_completed=True)
+        self.appointment(rebooked, is_canceled=True)
+        self.appointment(rebooked)
+        self.appointment(canceled, is_canceled=True)
+        self.appointment(self.slot(self.sara, self.monday, 9, 80))
+
+    @staticmethod
+    def slot(doctor, day, hour, cost):
+        return Slot.objects.create(doctor=doctor, time=make_aware(datetime.combine(day, time(hour))), cost=cost)
+
+    @staticmethod
+    def appointment(slot, **flags):
+        return AppointmentModel.objects.create(
+            slot_id=slot.id,
+            patient_id=uuid.uuid4(),
+            patient_name="Alice",
+            slot_time=slot.time,
+            doctor_id=slot.doctor_id,
+            **flags,
+        )
+
+    def statistics(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [
+            (row["doctor_id"], row["period_start"], row["slots_booked"], row["slots_available"], row["revenue"])
+            for row in response.data["results"]
+        ]
+
+    def test_daily_statistics(self):
+        response = self.client.get(
+            self.url, {"from": self.monday.isoformat(), "to": str(self.monday + timedelta(days=1))}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["period"], "day")
+        rows = {(row["doctor_id"], row["period_start"]): row for row in response.data["results"]}
+        self.assertEqual(
+            rows[(str(self.ahmed.id), self.monday.isoformat())],
+            {
+                "doctor_id": str(self.ahmed.id),
+                "period_start": self.monday.isoformat(),
+                "slots_total": 4,
+                "slots_booked": 2,
+                "slots_available": 2,
+                "appointments_canceled": 2,
+                "cancellation_rate": 0.5,
+                "revenue": "250.00",
+            },
+        )
+        self.assertEqual(rows[(str(self.sara.id), self.monday.isoformat())]["revenue"], "80.00")
+        tuesday = rows[(str(self.ahmed.id), str(self.monday + timedelta(days=1)))]
+        self.assertEqual((tuesday["slots_booked"], tuesday["cancellation_rate"], tuesday["revenue"]), (0, 0.0, "0.00"))
+        self.assertEqual(len(rows), 3)
+
+    def test_weekly_statistics_for_one_doctor(self):
+        # A range starting mid-week still covers the whole week
+        rows = self.statistics(
+            period="week",
+            doctor_id=str(self.ahmed.id),
+            **{"from": str(self.monday + timedelta(days=3)), "to": str(self.monday + timedelta(days=6))},
+        )
+        self.assertEqual(rows, [(str(self.ahmed.id), self.monday.isoformat(), 2, 3, "250.00")])
+
+    def test_closed_periods_are_served_from_the_cache(self):
+        params = {"period": "week", "from": self.monday.isoformat(), "to": localdate().isoformat()}
+        with self.assertNumQueries(1):
+            before = self.statistics(**params)
+
+        # Only the current week is recomputed: a late slot in the closed week does not show yet
+        self.slot(self.sara, self.monday, 10, 60)
+        self.appointment(self.slot(self.sara, localdate(), 23, 70))
+        with self.assertNumQueries(1):
+            after = self.statistics(**params)
+        self.assertEqual(after[: len(before)], before)
+        self.assertEqual(after[-1], (str(self.sara.id), period_start(localdate(), WEEK).isoformat(), 1, 0, "70.00"))
+
+        with self.settings(STATISTICS_CACHE_CLOSED_PERIODS=False):
+            self.assertIn((str(self.sara.id), self.monday.isoformat(), 1, 1, "80.00"), self.statistics(**params))
+
+    def test_appointments_are_joined_through_the_slot_index(self):
+        plan = StatisticsAdapter._aggregate(WEEK, self.monday, localdate(), None).explain()
+        self.assertIn("appointment_slot_idx", plan)
+
+    def test_invalid_parameters(self):
+        response = self.client.get(self.url, {"period": "month"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {"from": "2030-01-01", "to": "2031-06-30"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
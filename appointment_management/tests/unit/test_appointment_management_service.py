@@ -3,14 +3,23 @@ import uuid
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
-from appointment_management.domain.appointment_management_service import DoctorAppointmentManagementService
+from appointment_management.domain.appointment_management_service import (
+    AppointmentsChanged,
+    DoctorAppointmentManagementService,
+)
 from appointment_management.ports.outbound.appointment_repository_port import AppointmentRecord
 
 
 class TestAppointmentManagementService(unittest.TestCase):
     def setUp(self):
         self.mock_repo = MagicMock()
-        self.service = DoctorAppointmentManagementService(appointment_repository=self.mock_repo)
+        self.mock_reminders = MagicMock()
+        self.mock_slots = MagicMock()
+        self.service = DoctorAppointmentManagementService(
+            appointment_repository=self.mock_repo, reminders=self.mock_reminders, slots=self.mock_slots
+        )
+        # The conditional update changes every appointment passed to it unless a test says otherwise
+        self.mock_repo.update_open.side_effect = lambda appointment_ids, **fields: len(appointment_ids)
 
     def test_get_upcoming_appointments(self):
         # Setup
@@ -33,32 +42,142 @@ class TestAppointmentManagementService(unittest.TestCase):
         self.assertEqual(results[0].patient_name, "John")
         self.mock_repo.find_upcoming.assert_called_once()
 
+    def test_get_upcoming_appointments_page_pushes_filters_to_repository(self):
+        doctor_id = uuid.uuid4()
+        time_to = datetime.now() + timedelta(days=7)
+        after = (datetime.now() + timedelta(days=1), uuid.uuid4())
+        self.mock_repo.find_upcoming_for_doctor.return_value = []
+
+        self.assertEqual(self.service.get_upcoming_appointments_page(doctor_id, 20, time_to=time_to, after=after), [])
+        args, kwargs = self.mock_repo.find_upcoming_for_doctor.call_args
+        self.assertEqual((args[0], args[2]), (doctor_id, 20))
+        self.assertEqual(kwargs, {"time_from": None, "time_to": time_to, "after": after})
+
     def test_mark_appointment_completed(self):
-        appointment_id = uuid.uuid4()
-        mock_record = AppointmentRecord(
-            id=appointment_id,
-            slot_id=uuid.uuid4(),
-            patient_id=uuid.uuid4(),
-            patient_name="John",
-            reserved_at=datetime.now(),
-        )
-        self.mock_repo.find_by_id.return_value = mock_record
+        record = self._record()
+        self.mock_repo.find_many_for_update.return_value = {record.id: record}
 
-        success = self.service.mark_appointment_completed(appointment_id)
-        self.assertTrue(success)
-        self.assertTrue(mock_record.is_completed)
+        self.assertTrue(self.service.mark_appointment_completed(record.id))
+        self.mock_repo.update_open.assert_called_once_with([record.id], is_completed=True)
+        self.mock_reminders.cancel_reminders_bulk.assert_called_once_with([record.id])
+        self.mock_slots.release_slots.assert_not_called()
 
     def test_cancel_appointment_already_completed(self):
-        appointment_id = uuid.uuid4()
-        mock_record = AppointmentRecord(
-            id=appointment_id,
+        record = self._record()
+        record.is_completed = True
+        self.mock_repo.find_many_for_update.return_value = {record.id: record}
+
+        self.assertFalse(self.service.cancel_appointment(record.id))
+        self.mock_repo.update_open.assert_not_called()
+        self.mock_reminders.cancel_reminders_bulk.assert_not_called()
+        self.mock_slots.release_slots.assert_not_called()
+
+    def test_cancel_appointment_cancels_reminders_and_releases_the_slot(self):
+        record = self._record()
+        self.mock_repo.find_many_for_update.return_value = {record.id: record}
+
+        self.assertTrue(self.service.cancel_appointment(record.id))
+        self.mock_repo.update_open.assert_called_once_with([record.id], is_canceled=True)
+        self.mock_reminders.cancel_reminders_bulk.assert_called_once_with([record.id])
+        self.mock_slots.release_slots.assert_called_once_with([record.slot_id])
+
+    def test_cancel_appointment_closed_by_another_request_keeps_the_slot(self):
+        # Read as open, but a concurrent cancel got to the row first: the conditional update
+        # changes nothing, so this call must not release the slot (it may be rebooked already)
+        record = self._record()
+        self.mock_repo.find_many_for_update.return_value = {record.id: record}
+        self.mock_repo.update_open.side_effect = None
+        self.mock_repo.update_open.return_value = 0
+
+        self.assertFalse(self.service.cancel_appointment(record.id))
+        self.mock_reminders.cancel_reminders_bulk.assert_not_called()
+        self.mock_slots.release_slots.assert_not_called()
+
+    def test_cancel_appointments_raises_when_the_update_misses_some(self):
+        records = [self._record(), self._record()]
+        self.mock_repo.find_many_for_update.return_value = {r.id: r for r in records}
+        self.mock_repo.update_open.side_effect = None
+        self.mock_repo.update_open.return_value = 1
+
+        with self.assertRaises(AppointmentsChanged):
+            self.service.cancel_appointments([r.id for r in records])
+        self.mock_slots.release_slots.assert_not_called()
+
+    def test_cancel_appointments_reports_outcomes_and_updates_open_ones_once(self):
+        open_record, completed, canceled = (self._record() for _ in range(3))
+        completed.is_completed = True
+        canceled.is_canceled = True
+        missing_id = uuid.uuid4()
+        self.mock_repo.find_many_for_update.return_value = {r.id: r for r in (open_record, completed, canceled)}
+
+        outcomes = self.service.cancel_appointments(
+            [open_record.id, completed.id, canceled.id, missing_id, open_record.id]
+        )
+        self.assertEqual(
+            outcomes,
+            {
+                open_record.id: "canceled",
+                completed.id: "already_completed",
+                canceled.id: "already_canceled",
+                missing_id: "not_found",
+            },
+        )
+        self.mock_repo.update_open.assert_called_once_with([open_record.id], is_canceled=True)
+        self.mock_reminders.cancel_reminders_bulk.assert_called_once_with([open_record.id])
+        self.mock_slots.release_slots.assert_called_once_with([open_record.slot_id])
+
+    def test_completing_appointments_keeps_their_slots_reserved(self):
+        record = self._record()
+        self.mock_repo.find_many_for_update.return_value = {record.id: record}
+
+        self.assertEqual(self.service.mark_appointments_completed([record.id]), {record.id: "completed"})
+        self.mock_slots.release_slots.assert_not_called()
+
+    def test_reschedule_does_not_touch_the_appointment_when_the_slot_is_taken(self):
+        record = self._record()
+        self.mock_repo.find_many_for_update.return_value = {record.id: record}
+        self.mock_slots.reserve_slot.return_value = None
+
+        self.assertEqual(self.service.reschedule_appointment(record.id, uuid.uuid4()), ("slot_unavailable", None))
+        self.mock_repo.update_open.assert_not_called()
+        self.mock_slots.release_slots.assert_not_called()
+
+    def test_reschedule_moves_the_appointment_and_releases_the_old_slot(self):
+        record = self._record()
+        old_slot_id = record.slot_id
+        self.mock_repo.find_many_for_update.return_value = {record.id: record}
+        new_slot = MagicMock(id=uuid.uuid4(), time=datetime.now() + timedelta(days=2), doctor_id=uuid.uuid4())
+        self.mock_slots.reserve_slot.return_value = new_slot
+
+        outcome, moved = self.service.reschedule_appointment(record.id, new_slot.id)
+        self.assertEqual(outcome, "rescheduled")
+        self.assertEqual(moved.slot_id, new_slot.id)
+        self.mock_repo.update_open.assert_called_once_with(
+            [record.id], slot_id=new_slot.id, slot_time=new_slot.time, doctor_id=new_slot.doctor_id
+        )
+        self.mock_slots.release_slots.assert_called_once_with([old_slot_id])
+        self.mock_reminders.reschedule_reminders.assert_called_once()
+
+    def test_reschedule_raises_when_the_appointment_was_closed_meanwhile(self):
+        # Read as open, but closed by another request before the move: the conditional update
+        # changes nothing and the old slot must stay as it is
+        record = self._record()
+        self.mock_repo.find_many_for_update.return_value = {record.id: record}
+        self.mock_repo.update_open.side_effect = None
+        self.mock_repo.update_open.return_value = 0
+        self.mock_slots.reserve_slot.return_value = MagicMock(id=uuid.uuid4(), time=datetime.now())
+
+        with self.assertRaises(AppointmentsChanged):
+            self.service.reschedule_appointment(record.id, uuid.uuid4())
+        self.mock_slots.release_slots.assert_not_called()
+        self.mock_reminders.reschedule_reminders.assert_not_called()
+
+    @staticmethod
+    def _record():
+        return AppointmentRecord(
+            id=uuid.uuid4(),
             slot_id=uuid.uuid4(),
             patient_id=uuid.uuid4(),
             patient_name="John",
             reserved_at=datetime.now(),
-            is_completed=True,
         )
-        self.mock_repo.find_by_id.return_value = mock_record
-
-        success = self.service.cancel_appointment(appointment_id)
-        self.assertFalse(success)
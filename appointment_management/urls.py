@@ -1,17 +1,37 @@
 from django.urls import path
 
 from appointment_management.adapters.inbound.controllers import (
+    AppointmentStatisticsController,
+    BulkCancelAppointmentsController,
+    BulkMarkAppointmentsCompletedController,
     CancelAppointmentController,
+    DoctorDashboardController,
+    DoctorUpcomingAppointmentsController,
     MarkAppointmentCompletedController,
+    RescheduleAppointmentController,
     UpcomingAppointmentsController,
 )
 
 urlpatterns = [
     path("upcoming/", UpcomingAppointmentsController.as_view(), name="upcoming-appointments"),
+    path(
+        "doctors/<uuid:doctor_id>/upcoming/",
+        DoctorUpcomingAppointmentsController.as_view(),
+        name="doctor-upcoming-appointments",
+    ),
+    path("doctors/<uuid:doctor_id>/dashboard/", DoctorDashboardController.as_view(), name="doctor-dashboard"),
+    path("statistics/", AppointmentStatisticsController.as_view(), name="appointment-statistics"),
     path(
         "<uuid:appointment_id>/complete/",
         MarkAppointmentCompletedController.as_view(),
         name="mark-appointment-completed",
     ),
     path("<uuid:appointment_id>/cancel/", CancelAppointmentController.as_view(), name="cancel-appointment"),
+    path(
+        "<uuid:appointment_id>/reschedule/",
+        RescheduleAppointmentController.as_view(),
+        name="reschedule-appointment",
+    ),
+    path("bulk/complete/", BulkMarkAppointmentsCompletedController.as_view(), name="bulk-complete-appointments"),
+    path("bulk/cancel/", BulkCancelAppointmentsController.as_view(), name="bulk-cancel-appointments"),
 ]
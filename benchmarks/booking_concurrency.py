@@ -0,0 +1,90 @@
+"""
+Booking throughput: sync view on the WSGI handler vs async view on the ASGI handler.
+
+Both run in-process against an on-disk SQLite file. The sync endpoint is driven by a pool of
+threads (one per worker thread a WSGI server would run); the async endpoint by concurrent
+requests on a single event loop. Confirmations only go into the outbox on either path, so the
+provider's latency no longer affects booking throughput.
+
+    python -m benchmarks.booking_concurrency
+"""
+
+import asyncio
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.utils import print_table, setup_django, timer
+
+BOOKINGS = 400
+THREADS = 8
+IN_FLIGHT = 64
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(database_file=Path(tmp) / "bench.sqlite3")
+        run()
+
+
+def run():
+    from django.db import connections
+    from django.test import AsyncClient, Client
+    from django.urls import reverse
+    from django.utils import timezone
+
+    from doctor_availability.models import Doctor, Slot
+
+    doctor = Doctor.objects.create(name="Dr. Bench")
+    start = timezone.now() + timezone.timedelta(days=1)
+
+    def make_slots():
+        slots = [
+            Slot(doctor=doctor, time=start + timezone.timedelta(minutes=20 * i), cost=100) for i in range(BOOKINGS)
+        ]
+        Slot.objects.bulk_create(slots)
+        return [str(slot.id) for slot in slots]
+
+    def payload(slot_id):
+        return {"slot_id": slot_id, "patient_id": str(uuid.uuid4()), "patient_name": "Bench"}
+
+    def book_sync(slot_id):
+        try:
+            return Client().post(reverse("book-appointment"), payload(slot_id), content_type="application/json")
+        finally:
+            connections.close_all()
+
+    async def book_async(slot_ids):
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(IN_FLIGHT)
+
+        async def book(slot_id):
+            async with semaphore:
+                return await client.post(
+                    reverse("book-appointment-async"), payload(slot_id), content_type="application/json"
+                )
+
+        with timer() as elapsed:
+            responses = await asyncio.gather(*(book(slot_id) for slot_id in slot_ids))
+        return responses, elapsed["seconds"]
+
+    slot_ids = make_slots()
+    with timer() as elapsed, ThreadPoolExecutor(THREADS) as pool:
+        responses = list(pool.map(book_sync, slot_ids))
+    rows = [("sync/WSGI", THREADS, f"{BOOKINGS / elapsed['seconds']:.0f}", ok_count(responses))]
+
+    slot_ids = make_slots()
+    responses, seconds = asyncio.run(book_async(slot_ids))
+    rows.append(("async/ASGI", IN_FLIGHT, f"{BOOKINGS / seconds:.0f}", ok_count(responses)))
+
+    print(f"{BOOKINGS} bookings per run")
+    print_table(("handler", "concurrency", "bookings/s", "201s"), rows)
+
+
+def ok_count(responses):
+    return sum(response.status_code == 201 for response in responses)
+
+
+if __name__ == "__main__":
+    main()
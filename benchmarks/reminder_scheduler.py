@@ -0,0 +1,96 @@
+"""
+Reminder scheduler at scale: a million reminders (T-24h and T-1h for 500k appointments).
+
+Measures the memory held by the heap, the cost of the initial bulk load, of incremental
+schedule/cancel operations, and of one-minute ticks over a simulated day, next to the cost
+of the alternative: rescanning every appointment on each tick.
+
+    python -m benchmarks.reminder_scheduler
+"""
+
+import random
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.utils import print_table, setup_django, timer
+
+APPOINTMENTS = 500_000
+HORIZON = timedelta(days=30)
+TICK = timedelta(minutes=1)
+TICKS = 24 * 60
+INCREMENTAL_OPS = 10_000
+
+
+def main():
+    setup_django()
+    run()
+
+
+def run():
+    from appointment_confirmation.reminders import ReminderHeap
+
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    random.seed(1)
+    horizon_seconds = int(HORIZON.total_seconds())
+    rows = [
+        (
+            uuid.uuid4(),
+            f"Patient {i}",
+            "Dr. Bench",
+            now + timedelta(hours=25, seconds=random.randrange(horizon_seconds)),
+        )
+        for i in range(APPOINTMENTS)
+    ]
+
+    tracemalloc.start()
+    ReminderHeap().load(rows, now)
+    _, memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    heap = ReminderHeap()
+    with timer() as load:
+        scheduled = heap.load(rows, now)
+
+    with timer() as incremental:
+        for i in range(INCREMENTAL_OPS):
+            appointment_id, patient_name, doctor_name, appointment_time = rows[i]
+            heap.cancel(appointment_id)
+            heap.schedule(appointment_id, patient_name, doctor_name, appointment_time + timedelta(days=1), now)
+
+    due, tick_times = 0, []
+    clock = now
+    for _ in range(TICKS):
+        clock += TICK
+        with timer() as tick:
+            due += len(heap.tick(clock))
+        tick_times.append(tick["seconds"])
+
+    # The alternative: look at every appointment each minute to find the due reminders
+    with timer() as rescan:
+        window_end = now + TICK
+        sum(
+            1
+            for _, _, _, t in rows
+            for offset in (timedelta(hours=24), timedelta(hours=1))
+            if now < t - offset <= window_end
+        )
+
+    tick_times.sort()
+    print(f"{scheduled:,} reminders for {APPOINTMENTS:,} appointments over {HORIZON.days} days")
+    print_table(
+        ("measure", "value"),
+        [
+            ("peak memory of the load", f"{memory / 2**20:.0f} MiB"),
+            ("bulk load", f"{load['seconds']:.2f} s"),
+            ("reschedule (cancel + schedule)", f"{incremental['seconds'] / INCREMENTAL_OPS * 1e6:.1f} us/op"),
+            (f"reminders due over {TICKS} ticks", f"{due:,}"),
+            ("tick, median", f"{tick_times[len(tick_times) // 2] * 1e6:.0f} us"),
+            ("tick, p99", f"{tick_times[int(len(tick_times) * 0.99)] * 1e6:.0f} us"),
+            ("tick by full rescan", f"{rescan['seconds'] * 1e3:.0f} ms"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+SMTP confirmation throughput with and without connection reuse.
+
+Sends the same messages to an in-process SMTP stand-in three ways: a fresh connection per
+message, one pooled connection reused across single-message sends, and pooled connections
+carrying batches. Several threads send at once, as the outbox worker does.
+
+    python -m benchmarks.smtp_throughput
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from benchmarks.utils import print_table, setup_django, timer
+
+MESSAGES = 2000
+THREADS = 8
+BATCH_SIZE = 50
+
+
+def main():
+    setup_django()
+    run()
+
+
+def run():
+    from appointment_confirmation.tests.smtp_server import LocalSMTPServer
+    from appointment_confirmation.transports import ConfirmationMessage, SMTPTransport
+
+    messages = [
+        ConfirmationMessage(
+            appointment_id=str(i),
+            patient_name=f"Patient {i}",
+            doctor_name="Dr. Bench",
+            appointment_time=datetime(2030, 1, 1, 9, 0, tzinfo=timezone.utc),
+        )
+        for i in range(MESSAGES)
+    ]
+    scenarios = [
+        ("connection per message", {"reuse_connections": False}, 1),
+        ("pooled, 1 message per send", {"pool_size": THREADS}, 1),
+        (f"pooled, {BATCH_SIZE} messages per send", {"pool_size": THREADS}, BATCH_SIZE),
+    ]
+
+    rows = []
+    for label, options, batch_size in scenarios:
+        batches = [messages[i : i + batch_size] for i in range(0, MESSAGES, batch_size)]
+        with LocalSMTPServer() as server:
+            transport = SMTPTransport(recipients=["desk@clinic.test"], host=server.host, port=server.port, **options)
+            with timer() as elapsed, ThreadPoolExecutor(THREADS) as pool:
+                sent = sum(pool.map(transport.send_messages, batches))
+            transport.close()
+            rows.append((label, sent, server.connections, f"{sent / elapsed['seconds']:.0f}"))
+
+    print(f"{MESSAGES} messages, {THREADS} sending threads")
+    print_table(("transport", "sent", "connections", "messages/s"), rows)
+
+
+if __name__ == "__main__":
+    main()
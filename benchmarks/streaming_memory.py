@@ -0,0 +1,72 @@
+"""
+Peak memory of the buffered slot listing vs the streamed one, for growing result sizes.
+
+The buffered path serializes the whole queryset with ``SlotSerializer`` and renders it in one go
+(what ``SlotListCreateView.get`` did before pagination); the streamed path is what
+``?format=jsonstream`` does. Streaming peak memory should stay flat as the row count grows.
+
+    python -m benchmarks.streaming_memory
+"""
+
+import tracemalloc
+
+from benchmarks.utils import print_table, setup_django, timer
+
+SIZES = (1_000, 10_000, 50_000)
+
+
+def measure(func):
+    tracemalloc.start()
+    with timer() as elapsed:
+        func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024, elapsed["seconds"]
+
+
+def main():
+    setup_django()
+
+    from django.utils import timezone
+    from rest_framework.renderers import JSONRenderer
+
+    from doctor_appointment_app.streaming import STREAM_CHUNK_SIZE, iter_json_array
+    from doctor_availability.models import Doctor, Slot
+    from doctor_availability.serializers import SlotSerializer
+    from doctor_availability.services import SlotService
+
+    doctor = Doctor.objects.create(name="Dr. Bench")
+    start = timezone.now() + timezone.timedelta(days=1)
+
+    def buffered():
+        data = SlotSerializer(SlotService.list_available_slots(), many=True).data
+        JSONRenderer().render(data)
+
+    def streamed():
+        for _ in iter_json_array(SlotService.iter_available_slot_rows(chunk_size=STREAM_CHUNK_SIZE)):
+            pass
+
+    rows = []
+    for size in SIZES:
+        Slot.objects.all().delete()
+        Slot.objects.bulk_create(
+            [Slot(doctor=doctor, time=start + timezone.timedelta(minutes=20 * i), cost=100) for i in range(size)],
+            batch_size=1000,
+        )
+        buffered_peak, buffered_seconds = measure(buffered)
+        streamed_peak, streamed_seconds = measure(streamed)
+        rows.append(
+            (
+                size,
+                f"{buffered_peak:,.0f}",
+                f"{streamed_peak:,.0f}",
+                f"{buffered_seconds:.2f}",
+                f"{streamed_seconds:.2f}",
+            )
+        )
+
+    print_table(("rows", "buffered KiB", "streamed KiB", "buffered s", "streamed s"), rows)
+
+
+if __name__ == "__main__":
+    main()
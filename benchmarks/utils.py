@@ -0,0 +1,58 @@
+"""
+Helpers shared by the benchmark scripts.
+
+Benchmarks run against a throwaway test database (in-memory SQLite by default),
+so they never touch ``db.sqlite3``. Run them from the project root, e.g.::
+
+    python -m benchmarks.streaming_memory
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+
+def setup_django(database_file=None):
+    """
+    Configure Django and create a migrated test database for the benchmark.
+    Pass ``database_file`` to use an on-disk SQLite file instead of shared memory,
+    e.g. when several threads write concurrently.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "doctor_appointment_app.settings")
+
+    import django
+
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    if database_file is not None:
+        connection.settings_dict["TEST"]["NAME"] = str(database_file)
+        # Take the write lock up front instead of failing lock upgrades under concurrency
+        connection.settings_dict["OPTIONS"]["transaction_mode"] = "IMMEDIATE"
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+
+
+@contextmanager
+def timer():
+    """
+    Measure wall-clock time; the yielded dict holds ``seconds`` once the block exits.
+    """
+    result = {}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["seconds"] = time.perf_counter() - start
+
+
+def print_table(headers, rows):
+    """
+    Print rows as a fixed-width text table.
+    """
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
+    for row in (headers, *rows):
+        print("  ".join(str(value).rjust(width) for value, width in zip(row, widths)))
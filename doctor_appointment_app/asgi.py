@@ -2,6 +2,7 @@
 ASGI config for doctor_appointment_app project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Long-lived endpoints such as the slot server-sent events feed need this entry point.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
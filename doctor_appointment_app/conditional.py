@@ -0,0 +1,59 @@
+"""
+Conditional GET support for polled endpoints.
+
+ETags are derived from a change-version counter (see ``versions``) and the request's
+parameters, so a view can answer ``If-None-Match`` with 304 before running its query.
+For results that go stale on their own as time passes (e.g. "upcoming" lists), the ETag
+also carries the moment it expires.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from django.http import HttpResponseNotModified
+from django.utils import timezone
+from django.utils.http import parse_etags, quote_etag
+
+
+def _digest(version: int, params: dict) -> str:
+    return hashlib.md5(repr((version, sorted(params.items()))).encode()).hexdigest()
+
+
+def make_etag(version: int, params: dict, expires_at: Optional[datetime] = None) -> str:
+    """
+    Build the quoted ETag for a response computed at ``version`` for ``params``.
+    ``expires_at`` bounds how long the ETag may be honoured regardless of the version.
+    """
+    tag = _digest(version, params)
+    if expires_at is not None:
+        tag = f"{tag}.{int(expires_at.timestamp())}"
+    return quote_etag(tag)
+
+
+def is_not_modified(request, version: int, params: dict) -> bool:
+    """
+    Return True if the request's ``If-None-Match`` names an ETag that is still current.
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+
+    digest = _digest(version, params)
+    now = timezone.now().timestamp()
+    for etag in parse_etags(header):
+        tag, _, expires = etag.strip('"').partition(".")
+        if tag != digest:
+            continue
+        if not expires or (expires.isdigit() and now < int(expires)):
+            return True
+    return False
+
+
+def not_modified_response(request) -> HttpResponseNotModified:
+    """
+    An empty 304 that echoes the ETag the client already holds (usable from DRF and plain views).
+    """
+    response = HttpResponseNotModified()
+    response["ETag"] = request.headers["If-None-Match"]
+    return response
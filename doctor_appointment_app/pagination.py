@@ -0,0 +1,57 @@
+"""
+Opaque keyset-pagination cursors shared by the modules' listings.
+
+A cursor encodes the sort key of the last row on a page, so the next page starts right after it
+with an index range scan instead of an OFFSET.
+"""
+
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(slot_time: datetime, slot_id: uuid.UUID) -> str:
+    """
+    Encode the (time, id) position of the last row on a page (a slot or an appointment) into an opaque cursor.
+    """
+    raw = f"{slot_time.isoformat()}|{slot_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        slot_time, slot_id = raw.split("|")
+        return datetime.fromisoformat(slot_time), uuid.UUID(slot_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor.")
+
+
+def encode_doctor_cursor(name: str, doctor_id: uuid.UUID) -> str:
+    """
+    Encode the (name, id) position of the last doctor on a directory page into an opaque cursor.
+    """
+    raw = f"{name}|{doctor_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_doctor_cursor(cursor: str) -> Tuple[str, uuid.UUID]:
+    """
+    Decode a cursor produced by ``encode_doctor_cursor``.
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        # Names may contain "|"; the id after the last one cannot
+        name, separator, doctor_id = raw.rpartition("|")
+        if not separator:
+            raise ValueError
+        return name, uuid.UUID(doctor_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor.")
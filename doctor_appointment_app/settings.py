@@ -86,6 +86,58 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Change-version counters behind listing cache keys and ETags. They must live in a cache shared
+# by every worker process: with the per-process locmem default, a write only invalidates the
+# worker that made it, so this setup is only correct for a single process (e.g. runserver).
+# Point the alias at Redis or Memcached when running several workers; ``check --deploy`` warns.
+CHANGE_VERSION_CACHE_ALIAS = "default"
+
+# Slot listing pages are cached per doctor and filter set; writes bump a version counter.
+# Shared by every worker for the same reason as the counters above.
+SLOT_LISTING_CACHE_ALIAS = "default"
+SLOT_LISTING_CACHE_TTL = 30  # seconds
+
+# Server-sent slot events: per-listener queue bound (overflow drops to a resync) and keep-alive period
+SLOT_EVENTS_QUEUE_SIZE = 100
+SLOT_EVENTS_HEARTBEAT = 15  # seconds
+
+# How long a slot hold (two-phase booking) lasts before the release_expired_holds sweeper frees it
+SLOT_HOLD_TTL = 300  # seconds
+
+# How long a booking response is kept for replay to retries with the same Idempotency-Key
+IDEMPOTENCY_KEY_TTL = 24 * 60 * 60  # seconds
+
+# Statistics of closed (past) periods are cached so only the current period is recomputed;
+# a late change to a closed period shows once its entry expires
+STATISTICS_CACHE_CLOSED_PERIODS = True
+STATISTICS_CACHE_ALIAS = "default"
+STATISTICS_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# How appointment confirmations are delivered: LoggingTransport, SMTPTransport or WebhookTransport
+# (see appointment_confirmation.transports); OPTIONS go to the transport's constructor.
+CONFIRMATION_TRANSPORT = {
+    "BACKEND": "appointment_confirmation.transports.LoggingTransport",
+    "OPTIONS": {},
+}
+
+# Failed confirmations are retried with jittered exponential backoff, then dead-lettered
+CONFIRMATION_MAX_ATTEMPTS = 8
+CONFIRMATION_RETRY_BASE_DELAY = 2  # seconds
+CONFIRMATION_RETRY_MAX_DELAY = 3600  # seconds
+# A destination's circuit opens after this many consecutive failures and is retried after the timeout
+CONFIRMATION_BREAKER_FAILURE_THRESHOLD = 5
+CONFIRMATION_BREAKER_RESET_TIMEOUT = 30  # seconds
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,73 @@
+"""
+Streaming JSON support shared by the listing endpoints.
+
+A view opts in by adding ``StreamingJSONRenderer`` to its renderer classes. Clients select it
+with ``?format=jsonstream`` or ``Accept: application/stream+json`` and the view answers with
+``streaming_json_response`` instead of a regular ``Response``, so rows are encoded as they are
+read from the database instead of being collected into one list first.
+"""
+
+from typing import Iterable, Iterator
+
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+# Rows fetched from the database cursor per round trip
+STREAM_CHUNK_SIZE = 2000
+# Rows encoded into each chunk handed to the server
+ROWS_PER_WRITE = 500
+
+
+class StreamingJSONRenderer(BaseRenderer):
+    """
+    Content-negotiation target for streamed JSON arrays.
+
+    Views check ``request.accepted_renderer`` and return ``streaming_json_response``; anything
+    else they return (e.g. validation errors) is rendered as plain JSON.
+    """
+
+    media_type = "application/stream+json"
+    format = "jsonstream"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return JSONRenderer().render(data, renderer_context=renderer_context)
+
+
+# Default renderers plus the streaming one, for views that support streaming
+STREAMING_RENDERER_CLASSES = [*api_settings.DEFAULT_RENDERER_CLASSES, StreamingJSONRenderer]
+
+
+def wants_streaming(request) -> bool:
+    """
+    Return True if the request negotiated the streaming renderer.
+    """
+    return isinstance(getattr(request, "accepted_renderer", None), StreamingJSONRenderer)
+
+
+def iter_json_array(rows: Iterable[dict], rows_per_write: int = ROWS_PER_WRITE) -> Iterator[bytes]:
+    """
+    Encode rows as one JSON array, yielding it in pieces of ``rows_per_write`` rows.
+    Memory use is bounded by the piece size, not by the number of rows.
+    """
+    encoder = JSONEncoder()
+    separator = "["
+    buffer = []
+    for row in rows:
+        buffer.append(separator)
+        buffer.append(encoder.encode(row))
+        separator = ","
+        if len(buffer) >= rows_per_write * 2:
+            yield "".join(buffer).encode()
+            buffer = []
+    buffer.append("[]" if separator == "[" else "]")
+    yield "".join(buffer).encode()
+
+
+def streaming_json_response(rows: Iterable[dict]) -> StreamingHttpResponse:
+    """
+    Build a streamed ``application/json`` response holding the rows as one JSON array.
+    """
+    return StreamingHttpResponse(iter_json_array(rows), content_type="application/json")
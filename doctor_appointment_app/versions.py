@@ -0,0 +1,109 @@
+"""
+Change-version counters shared by the modules.
+
+A counter is bumped whenever the data behind a read changes. Readers fold the current value
+into cache keys and ETags, so a bump invalidates both without deleting anything.
+Counters live in the Django cache alias named by ``CHANGE_VERSION_CACHE_ALIAS``.
+
+That cache must be shared by every worker process. With a per-process cache (the locmem
+default) a write only bumps its own process's counters, and other workers keep serving stale
+pages and ETags until their entries expire. ``check --deploy`` warns about that setup.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.checks import Tags
+from django.core.checks import Warning as CheckWarning
+from django.core.checks import register
+from django.db import transaction
+
+DEFAULT_ALIAS = "default"
+
+# Backends whose entries are not shared between processes
+PER_PROCESS_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+# Bumped whenever an appointment is booked or changes state
+APPOINTMENTS = "appointments"
+
+
+def _cache():
+    return caches[getattr(settings, "CHANGE_VERSION_CACHE_ALIAS", DEFAULT_ALIAS)]
+
+
+def _key(name: str) -> str:
+    return f"version:{name}"
+
+
+def get_version(name: str) -> int:
+    """
+    Return the current value of the counter ``name``, creating it if needed.
+    """
+    cache = _cache()
+    version = cache.get(_key(name))
+    if version is None:
+        # Seed with the clock, not 1, so an evicted counter can never fall back onto old values
+        cache.add(_key(name), time.time_ns(), timeout=None)
+        version = cache.get(_key(name))
+    return version
+
+
+async def aget_version(name: str) -> int:
+    """
+    Async variant of ``get_version``, through the cache's async API.
+    """
+    cache = _cache()
+    version = await cache.aget(_key(name))
+    if version is None:
+        await cache.aadd(_key(name), time.time_ns(), timeout=None)
+        version = await cache.aget(_key(name))
+    return version
+
+
+def bump_version(*names: str) -> None:
+    """
+    Increment each counter in ``names``.
+    """
+    cache = _cache()
+    for name in names:
+        try:
+            cache.incr(_key(name))
+        except ValueError:
+            # No counter yet, so nobody has read under it; seeding it is enough
+            get_version(name)
+
+
+def bump_version_on_commit(*names: str) -> None:
+    """
+    Increment the counters once the current transaction commits (immediately in autocommit),
+    so no reader can pair the new version with pre-commit data.
+    """
+    transaction.on_commit(lambda: bump_version(*names))
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs=None, **kwargs):
+    """
+    Warn when the version counters or the slot listing pages live in a per-process cache.
+    """
+    warnings = []
+    for setting in ("CHANGE_VERSION_CACHE_ALIAS", "SLOT_LISTING_CACHE_ALIAS"):
+        alias = getattr(settings, setting, DEFAULT_ALIAS)
+        backend = settings.CACHES.get(alias, {}).get("BACKEND")
+        if backend in PER_PROCESS_BACKENDS:
+            warnings.append(
+                CheckWarning(
+                    f"{setting} points at the per-process cache {alias!r} ({backend}).",
+                    hint=(
+                        "With more than one worker process, writes only invalidate the worker that made "
+                        "them and the others serve stale pages and ETags. Point it at a shared cache "
+                        "(e.g. Redis or Memcached) or run a single process."
+                    ),
+                    id="doctor_appointment_app.W001",
+                )
+            )
+    return warnings
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class DoctorAvailabilityConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "doctor_availability"
+
+    def ready(self):
+        # Registers the deploy check on the shared change-version cache
+        from doctor_appointment_app import versions  # noqa: F401
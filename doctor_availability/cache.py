@@ -0,0 +1,118 @@
+"""
+Versioned read-through cache for the slot listing.
+
+Entries are keyed by doctor (or "all" doctors), a version counter and the filter set.
+Writes never delete entries: they bump the doctor's version counter (and the all-doctors
+counter), so every key built afterwards misses and stale pages simply age out via the TTL.
+"""
+
+import hashlib
+import threading
+import uuid
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from django.conf import settings
+from django.core.cache import caches
+
+from doctor_appointment_app import versions
+
+T = TypeVar("T")
+
+ALL_DOCTORS = "all"
+DEFAULT_ALIAS = "default"
+DEFAULT_TTL = 30
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _cache():
+    return caches[getattr(settings, "SLOT_LISTING_CACHE_ALIAS", DEFAULT_ALIAS)]
+
+
+def _scope(doctor_id: Optional[uuid.UUID]) -> str:
+    return str(doctor_id) if doctor_id is not None else ALL_DOCTORS
+
+
+def current_version(doctor_id: Optional[uuid.UUID]) -> int:
+    """
+    Return the listing version for ``doctor_id`` (or for all doctors when None).
+    """
+    return versions.get_version(f"slots:{_scope(doctor_id)}")
+
+
+async def acurrent_version(doctor_id: Optional[uuid.UUID]) -> int:
+    """
+    Async variant of ``current_version``.
+    """
+    return await versions.aget_version(f"slots:{_scope(doctor_id)}")
+
+
+def _record(outcome: str) -> None:
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def _key(doctor_id: Optional[uuid.UUID], params: dict) -> str:
+    digest = hashlib.md5(repr(sorted(params.items())).encode()).hexdigest()
+    return f"slots:list:{_scope(doctor_id)}:{current_version(doctor_id)}:{digest}"
+
+
+def _ttl() -> int:
+    return getattr(settings, "SLOT_LISTING_CACHE_TTL", DEFAULT_TTL)
+
+
+def get_or_set(doctor_id: Optional[uuid.UUID], params: dict, loader: Callable[[], T]) -> T:
+    """
+    Return the cached listing for ``doctor_id`` and ``params``, calling ``loader`` on a miss.
+    ``params`` must have a stable ``repr`` (plain values, UUIDs, datetimes, decimals, tuples).
+    """
+    key = _key(doctor_id, params)
+    cache = _cache()
+    value = cache.get(key)
+    if value is not None:
+        _record("hits")
+        return value
+
+    _record("misses")
+    value = loader()
+    cache.set(key, value, timeout=_ttl())
+    return value
+
+
+async def aget_or_set(doctor_id: Optional[uuid.UUID], params: dict, aloader: Callable[[], Awaitable[T]]) -> T:
+    """
+    Async variant of ``get_or_set``. Keys are shared, so sync and async views reuse each other's pages.
+    """
+    key = _key(doctor_id, params)
+    cache = _cache()
+    value = await cache.aget(key)
+    if value is not None:
+        _record("hits")
+        return value
+
+    _record("misses")
+    value = await aloader()
+    await cache.aset(key, value, timeout=_ttl())
+    return value
+
+
+def bump_version(doctor_id: uuid.UUID) -> None:
+    """
+    Invalidate every cached listing that can contain slots of ``doctor_id``.
+    Call it only once the change is committed.
+    """
+    versions.bump_version(f"slots:{doctor_id}", f"slots:{ALL_DOCTORS}")
+
+
+def stats() -> dict:
+    """
+    Return this process's hit/miss counters.
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.update(hits=0, misses=0)
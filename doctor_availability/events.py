@@ -0,0 +1,100 @@
+"""
+In-process fan-out of slot availability changes to server-sent-event subscribers.
+
+``SlotService`` publishes from whatever thread the write ran in; each subscriber owns a bounded
+asyncio queue on its own event loop. A subscriber that falls behind is not allowed to grow
+without bound: its backlog is dropped and replaced by a single ``resync`` event, telling the
+client to re-fetch the slot listing before consuming further deltas.
+"""
+
+import asyncio
+import threading
+import uuid
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+from django.conf import settings
+
+DEFAULT_QUEUE_SIZE = 100
+
+SLOT_CREATED = "slot.created"
+SLOT_RESERVED = "slot.reserved"
+SLOT_RELEASED = "slot.released"
+RESYNC = "resync"
+
+
+class Subscription:
+    """
+    One listener's bounded queue of events for a single doctor.
+    """
+
+    def __init__(self, doctor_id: str, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.doctor_id = doctor_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, event: dict) -> None:
+        """
+        Enqueue an event; must run on the subscriber's loop.
+        On overflow the backlog is replaced by a single resync event.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait({"type": RESYNC, "doctor_id": self.doctor_id})
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+
+class SlotEventHub:
+    """
+    Thread-safe registry of subscriptions keyed by doctor.
+    """
+
+    def __init__(self, queue_size: Optional[int] = None):
+        self._queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, doctor_id: uuid.UUID) -> Subscription:
+        """
+        Register a listener for ``doctor_id``; must be called from the listener's event loop.
+        """
+        queue_size = self._queue_size or getattr(settings, "SLOT_EVENTS_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)
+        subscription = Subscription(str(doctor_id), asyncio.get_running_loop(), queue_size)
+        with self._lock:
+            self._subscriptions[subscription.doctor_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            listeners = self._subscriptions.get(subscription.doctor_id)
+            if listeners is not None:
+                listeners.discard(subscription)
+                if not listeners:
+                    del self._subscriptions[subscription.doctor_id]
+
+    def publish(self, doctor_id: uuid.UUID, event: dict) -> None:
+        """
+        Deliver ``event`` to every listener of ``doctor_id``. Safe to call from any thread.
+        """
+        with self._lock:
+            listeners = list(self._subscriptions.get(str(doctor_id), ()))
+        for subscription in listeners:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # The listener's loop is already closed; it is unsubscribing
+                pass
+
+    def subscriber_count(self, doctor_id: uuid.UUID) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(str(doctor_id), ()))
+
+
+hub = SlotEventHub()
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from doctor_availability.services import HOLD_SWEEP_BATCH_SIZE, SlotService
+
+
+class Command(BaseCommand):
+    help = "Free slots whose checkout holds expired without being confirmed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=HOLD_SWEEP_BATCH_SIZE, help="Holds freed per UPDATE.")
+        parser.add_argument("--poll-interval", type=float, default=5.0, help="Seconds to sleep when idle.")
+        parser.add_argument("--once", action="store_true", help="Exit once no expired hold is left.")
+
+    def handle(self, *args, **options):
+        total = 0
+        try:
+            while True:
+                released = SlotService.release_expired_holds(options["batch_size"])
+                total += released
+                if released:
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f"Released {total} expired hold(s)."))
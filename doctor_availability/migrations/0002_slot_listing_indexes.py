@@ -0,0 +1,27 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctor_availability", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="slot",
+            index=models.Index(
+                condition=models.Q(("is_reserved", False)), fields=["time", "id"], name="slot_free_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="slot",
+            index=models.Index(
+                condition=models.Q(("is_reserved", False)),
+                fields=["doctor", "time", "id"],
+                name="slot_doctor_free_time_idx",
+            ),
+        ),
+    ]
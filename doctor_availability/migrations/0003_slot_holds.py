@@ -0,0 +1,29 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctor_availability", "0002_slot_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="slot",
+            name="held_until",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="slot",
+            name="hold_token",
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="slot",
+            index=models.Index(
+                condition=models.Q(("held_until__isnull", False)), fields=["held_until"], name="slot_hold_expiry_idx"
+            ),
+        ),
+    ]
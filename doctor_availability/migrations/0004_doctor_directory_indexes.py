@@ -0,0 +1,21 @@
+# Generated by Django 5.1.5 on 2026-10-18 13:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctor_availability", "0003_slot_holds"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="doctor",
+            index=models.Index(fields=["name", "id"], name="doctor_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="doctor",
+            index=models.Index(fields=["specialization", "name", "id"], name="doctor_specialization_name_idx"),
+        ),
+    ]
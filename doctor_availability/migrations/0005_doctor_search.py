@@ -0,0 +1,68 @@
+from django.db import migrations
+
+FTS_TABLE = "doctor_availability_doctor_fts"
+DOCTOR_TABLE = "doctor_availability_doctor"
+
+# Doctor ids are UUIDs, so the FTS rows cannot share the doctor table's rowid (it is not stable
+# across VACUUM); the id is stored as a token and the triggers find a doctor's row by matching it
+DELETE_OLD = f"""DELETE FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH 'doctor_id:"' || old.id || '"'"""
+INSERT_NEW = (
+    f"INSERT INTO {FTS_TABLE}(doctor_id, name, specialization) "
+    f"VALUES (new.id, new.name, coalesce(new.specialization, ''))"
+)
+
+CREATE_STATEMENTS = (
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(doctor_id, name, specialization)",
+    f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOCTOR_TABLE} BEGIN {INSERT_NEW}; END",
+    f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOCTOR_TABLE} BEGIN {DELETE_OLD}; END",
+    f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF id, name, specialization ON {DOCTOR_TABLE} "
+    f"BEGIN {DELETE_OLD}; {INSERT_NEW}; END",
+    f"INSERT INTO {FTS_TABLE}(doctor_id, name, specialization) "
+    f"SELECT id, name, coalesce(specialization, '') FROM {DOCTOR_TABLE}",
+)
+
+DROP_STATEMENTS = (
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+)
+
+
+def fts5_supported(connection) -> bool:
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Create the FTS5 doctor search table, the triggers that keep it in sync and its initial rows.
+    Databases without FTS5 are left as they are; search falls back to scanning doctors there.
+    """
+    if not fts5_supported(schema_editor.connection):
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for statement in CREATE_STATEMENTS:
+            cursor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for statement in DROP_STATEMENTS:
+            cursor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctor_availability", "0004_doctor_directory_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
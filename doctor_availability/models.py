@@ -9,6 +9,13 @@ class Doctor(models.Model):
     email = models.EmailField(blank=True, null=True)
     phone_number = models.CharField(max_length=15, blank=True, null=True)
 
+    class Meta:
+        # The directory pages through doctors by (name, id), optionally within one specialization
+        indexes = [
+            models.Index(fields=["name", "id"], name="doctor_name_idx"),
+            models.Index(fields=["specialization", "name", "id"], name="doctor_specialization_name_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -19,6 +26,24 @@ class Slot(models.Model):
     doctor = models.ForeignKey(Doctor, on_delete=models.CASCADE, related_name="slots")
     is_reserved = models.BooleanField(default=False)
     cost = models.DecimalField(max_digits=10, decimal_places=2)
+    # A hold reserves the slot (so listings skip it) until ``held_until`` unless it is confirmed
+    # with ``hold_token``; the sweeper frees holds that expire
+    held_until = models.DateTimeField(null=True, blank=True)
+    hold_token = models.UUIDField(null=True, blank=True)
+
+    class Meta:
+        # Keyset pagination walks free slots by (time, id); these partial indexes make every
+        # listing page an index range scan and only hold slots that can still be booked.
+        indexes = [
+            models.Index(fields=["time", "id"], condition=models.Q(is_reserved=False), name="slot_free_time_idx"),
+            models.Index(
+                fields=["doctor", "time", "id"], condition=models.Q(is_reserved=False), name="slot_doctor_free_time_idx"
+            ),
+            # Only slots under a hold, oldest expiry first, for the sweeper
+            models.Index(
+                fields=["held_until"], condition=models.Q(held_until__isnull=False), name="slot_hold_expiry_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.doctor.name} - {self.time}"
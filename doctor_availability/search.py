@@ -0,0 +1,84 @@
+"""
+Full-text doctor search by name and specialization.
+
+On SQLite builds with FTS5, migration 0005 creates ``doctor_availability_doctor_fts``, an FTS5
+table mirroring each doctor's name and specialization, and triggers that keep it in step with
+every insert, update and delete of a doctor (bulk writes and cascades included). A search
+matches every word of the query as a prefix and ranks by bm25, name hits above specialization
+ones.
+
+Where FTS5 is unavailable (another database, or SQLite built without it) search falls back to
+``icontains`` filters ordered by name: same matches for whole words and prefixes, but a scan.
+"""
+
+import re
+import threading
+from typing import List
+
+from django.db import connection
+from django.db.models import Q
+
+from .models import Doctor
+
+FTS_TABLE = "doctor_availability_doctor_fts"
+DOCTOR_TABLE = Doctor._meta.db_table
+
+# bm25 column weights: doctor_id (never searched), name, specialization
+NAME_WEIGHT = 10.0
+SPECIALIZATION_WEIGHT = 5.0
+
+# Words of a query beyond this are ignored
+MAX_TERMS = 8
+
+# Rank and cut inside the FTS table first, so only the returned rows are joined to doctors.
+# FTS5 needs the table's own name (not an alias) for MATCH and bm25.
+_SEARCH_SQL = (
+    f"SELECT d.* FROM ("
+    f"SELECT doctor_id, bm25({FTS_TABLE}, 0.0, {NAME_WEIGHT}, {SPECIALIZATION_WEIGHT}) AS score "
+    f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s ORDER BY score LIMIT %s"
+    f") matches JOIN {DOCTOR_TABLE} d ON d.id = matches.doctor_id ORDER BY matches.score, d.name, d.id"
+)
+
+_availability_lock = threading.Lock()
+_availability = {}
+
+
+def fts_available() -> bool:
+    """
+    Whether the default database has the search table; looked up once per database.
+    """
+    key = (connection.alias, connection.settings_dict["NAME"])
+    with _availability_lock:
+        if key not in _availability:
+            _availability[key] = FTS_TABLE in connection.introspection.table_names()
+        return _availability[key]
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    The words of ``query``, lowercased, at most ``MAX_TERMS`` of them. FTS syntax is dropped.
+    """
+    return re.findall(r"\w+", query.lower())[:MAX_TERMS]
+
+
+def match_expression(terms: List[str]) -> str:
+    """
+    An FTS5 query matching doctors whose name or specialization has a word starting with each term.
+    """
+    return "{name specialization} : (" + " ".join(f'"{term}"*' for term in terms) + ")"
+
+
+def search_doctors(query: str, limit: int) -> List[Doctor]:
+    """
+    Return up to ``limit`` doctors matching every word of ``query`` as a prefix, best first.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+    if fts_available():
+        return list(Doctor.objects.raw(_SEARCH_SQL, [match_expression(terms), limit]))
+
+    doctors = Doctor.objects.all()
+    for term in terms:
+        doctors = doctors.filter(Q(name__icontains=term) | Q(specialization__icontains=term))
+    return list(doctors.order_by("name", "id")[:limit])
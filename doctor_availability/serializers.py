@@ -1,5 +1,14 @@
 from rest_framework import serializers
 
+from doctor_appointment_app.pagination import decode_cursor, decode_doctor_cursor
+
+from .search import search_terms
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
 
 class SlotSerializer(serializers.Serializer):
     id = serializers.UUIDField(read_only=True)
@@ -26,3 +35,131 @@ class SlotSerializer(serializers.Serializer):
         if value <= 0:
             raise serializers.ValidationError("Cost must be a positive number.")
         return value
+
+
+class SlotListQuerySerializer(serializers.Serializer):
+    """
+    Validates the query parameters of the slot listing.
+    The ``from``/``to`` query parameters map to ``time_from``/``time_to``.
+    """
+
+    doctor_id = serializers.UUIDField(required=False)
+    time_from = serializers.DateTimeField(required=False)
+    time_to = serializers.DateTimeField(required=False)
+    min_cost = serializers.DecimalField(max_digits=10, decimal_places=2, required=False)
+    max_cost = serializers.DecimalField(max_digits=10, decimal_places=2, required=False)
+    cursor = serializers.CharField(required=False)
+    page_size = serializers.IntegerField(min_value=1, max_value=MAX_PAGE_SIZE, default=DEFAULT_PAGE_SIZE)
+
+    def to_internal_value(self, data):
+        data = data.copy()
+        for param, field in (("from", "time_from"), ("to", "time_to")):
+            if param in data:
+                data[field] = data.pop(param)
+        return super().to_internal_value(data)
+
+    def validate_cursor(self, value):
+        """
+        Decode the cursor into a (time, id) keyset position.
+        """
+        try:
+            return decode_cursor(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+
+class RecurringSlotScheduleSerializer(serializers.Serializer):
+    """
+    A weekly schedule to expand into slots, e.g. Mon-Fri 09:00-17:00, 20-minute slots, for 12 weeks.
+    Weekdays use Monday=0 ... Sunday=6.
+    """
+
+    doctor_id = serializers.UUIDField()
+    start_date = serializers.DateField()
+    weeks = serializers.IntegerField(min_value=1, max_value=52)
+    weekdays = serializers.ListField(child=serializers.IntegerField(min_value=0, max_value=6), allow_empty=False)
+    start_time = serializers.TimeField()
+    end_time = serializers.TimeField()
+    slot_minutes = serializers.IntegerField(min_value=5, max_value=480)
+    cost = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+    def validate_start_date(self, value):
+        """
+        Ensure the schedule does not start in the past.
+        """
+        from django.utils.timezone import localdate
+
+        if value < localdate():
+            raise serializers.ValidationError("Schedule must not start in the past.")
+        return value
+
+    def validate_cost(self, value):
+        """
+        Ensure the cost is a positive number.
+        """
+        if value <= 0:
+            raise serializers.ValidationError("Cost must be a positive number.")
+        return value
+
+    def validate(self, attrs):
+        if attrs["end_time"] <= attrs["start_time"]:
+            raise serializers.ValidationError({"end_time": "End time must be after start time."})
+        return attrs
+
+
+class RecurringSlotSummarySerializer(serializers.Serializer):
+    doctor_id = serializers.UUIDField()
+    created = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+    first_slot = serializers.DateTimeField(allow_null=True)
+    last_slot = serializers.DateTimeField(allow_null=True)
+
+
+class DoctorDirectorySerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    specialization = serializers.CharField(read_only=True, allow_null=True)
+    next_free_slot = serializers.DateTimeField(read_only=True, allow_null=True)
+    free_slots_next_7_days = serializers.IntegerField(read_only=True)
+
+
+class DoctorDirectoryQuerySerializer(serializers.Serializer):
+    """
+    Validates the query parameters of the doctor directory.
+    """
+
+    specialization = serializers.CharField(required=False)
+    cursor = serializers.CharField(required=False)
+    page_size = serializers.IntegerField(min_value=1, max_value=MAX_PAGE_SIZE, default=DEFAULT_PAGE_SIZE)
+
+    def validate_cursor(self, value):
+        """
+        Decode the cursor into a (name, id) keyset position.
+        """
+        try:
+            return decode_doctor_cursor(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+
+class DoctorSerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    specialization = serializers.CharField(read_only=True, allow_null=True)
+
+
+class DoctorSearchQuerySerializer(serializers.Serializer):
+    """
+    Validates the query parameters of the doctor search.
+    """
+
+    q = serializers.CharField(max_length=200)
+    limit = serializers.IntegerField(min_value=1, max_value=MAX_SEARCH_LIMIT, default=DEFAULT_SEARCH_LIMIT)
+
+    def validate_q(self, value):
+        """
+        Ensure the query has at least one word to search for.
+        """
+        if not search_terms(value):
+            raise serializers.ValidationError("Search for at least one word.")
+        return value
@@ -1,10 +1,33 @@
 import uuid
-from typing import Optional
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
+from . import cache as listing_cache
+from . import events as slot_events
+from . import search, signals
 from .models import Doctor, Slot
 
+BULK_CREATE_BATCH_SIZE = 500
+DEFAULT_HOLD_TTL = 300  # seconds
+HOLD_SWEEP_BATCH_SIZE = 500
+DIRECTORY_AVAILABILITY_DAYS = 7
+
+
+class SlotsChanged(Exception):
+    """
+    Some of the slots being reserved were taken by another request after they were read as free.
+    Nothing is reported reserved; the caller's transaction should be rolled back.
+    """
+
 
 class SlotService:
     """
@@ -21,20 +44,157 @@ class SlotService:
         except ObjectDoesNotExist:
             raise ValueError("Doctor with the provided ID does not exist.")
 
-        slot = Slot.objects.create(
-            doctor=doctor,
-            time=time,
-            cost=cost,
-            is_reserved=False,
-        )
+        with transaction.atomic():
+            slot = Slot.objects.create(
+                doctor=doctor,
+                time=time,
+                cost=cost,
+                is_reserved=False,
+            )
+            SlotService._slots_changed(
+                doctor.id,
+                {"type": slot_events.SLOT_CREATED, "slot": {"id": slot.id, "time": slot.time, "cost": str(slot.cost)}},
+            )
+            signals.slots_created.send(sender=SlotService, doctor_id=doctor.id, slots=[(slot.id, slot.time)])
         return slot
 
     @staticmethod
-    def list_available_slots():
+    def create_recurring_slots(
+        doctor_id: uuid.UUID,
+        start_date: date,
+        weeks: int,
+        weekdays: Iterable[int],
+        start_time: time,
+        end_time: time,
+        slot_minutes: int,
+        cost,
+    ) -> dict:
+        """
+        Expand a weekly schedule (e.g. Mon-Fri 09:00-17:00, 20-minute slots, for 12 weeks)
+        and create all of its slots in one transaction.
+
+        Generated slots that would overlap an existing slot of the doctor are skipped.
+        Returns a compact summary instead of the created slots.
+        """
+        if not Doctor.objects.filter(id=doctor_id).exists():
+            raise ValueError("Doctor with the provided ID does not exist.")
+
+        duration = timedelta(minutes=slot_minutes)
+        current_time = timezone.now()
+        times = [
+            slot_time
+            for slot_time in SlotService._expand_schedule(start_date, weeks, weekdays, start_time, end_time, duration)
+            if slot_time > current_time
+        ]
+        if not times:
+            return {"doctor_id": doctor_id, "created": 0, "skipped": 0, "first_slot": None, "last_slot": None}
+
+        with transaction.atomic():
+            # One range query for every existing slot the schedule could collide with
+            overlapping = Slot.objects.filter(doctor_id=doctor_id, time__gte=times[0], time__lt=times[-1] + duration)
+            existing = sorted(overlapping.values_list("time", flat=True))
+
+            new_slots = []
+            for slot_time in times:
+                # An existing slot overlaps if it starts inside [slot_time, slot_time + duration)
+                index = bisect_left(existing, slot_time)
+                if index < len(existing) and existing[index] < slot_time + duration:
+                    continue
+                new_slots.append(Slot(doctor_id=doctor_id, time=slot_time, cost=cost, is_reserved=False))
+
+            Slot.objects.bulk_create(new_slots, batch_size=BULK_CREATE_BATCH_SIZE)
+            # Too many deltas to be useful; listeners re-fetch the listing instead
+            SlotService._slots_changed(doctor_id, {"type": slot_events.RESYNC, "doctor_id": doctor_id})
+            if new_slots:
+                signals.slots_created.send(
+                    sender=SlotService, doctor_id=doctor_id, slots=[(slot.id, slot.time) for slot in new_slots]
+                )
+
+        return {
+            "doctor_id": doctor_id,
+            "created": len(new_slots),
+            "skipped": len(times) - len(new_slots),
+            "first_slot": new_slots[0].time if new_slots else None,
+            "last_slot": new_slots[-1].time if new_slots else None,
+        }
+
+    @staticmethod
+    def _expand_schedule(
+        start_date: date, weeks: int, weekdays: Iterable[int], start_time: time, end_time: time, duration: timedelta
+    ) -> List[datetime]:
+        """
+        Return the sorted, timezone-aware start times described by a weekly schedule.
+        Weekdays follow ``date.weekday()`` (Monday is 0).
+        """
+        weekdays = set(weekdays)
+        tz = timezone.get_current_timezone()
+        times = []
+        for offset in range(weeks * 7):
+            day = start_date + timedelta(days=offset)
+            if day.weekday() not in weekdays:
+                continue
+            current = timezone.make_aware(datetime.combine(day, start_time), tz)
+            day_end = timezone.make_aware(datetime.combine(day, end_time), tz)
+            while current + duration <= day_end:
+                times.append(current)
+                current += duration
+        return times
+
+    @staticmethod
+    def list_available_slots(
+        doctor_id: Optional[uuid.UUID] = None,
+        time_from: Optional[datetime] = None,
+        time_to: Optional[datetime] = None,
+        min_cost=None,
+        max_cost=None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ):
+        """
+        Retrieve available (not reserved) slots ordered by (time, id).
+
+        All filters are optional. ``after`` is a keyset position: only slots strictly
+        after that (time, id) pair are returned, so each page is an index range scan.
+        """
+        slots = Slot.objects.filter(is_reserved=False)
+        if doctor_id is not None:
+            slots = slots.filter(doctor_id=doctor_id)
+        if time_from is not None:
+            slots = slots.filter(time__gte=time_from)
+        if time_to is not None:
+            slots = slots.filter(time__lt=time_to)
+        if min_cost is not None:
+            slots = slots.filter(cost__gte=min_cost)
+        if max_cost is not None:
+            slots = slots.filter(cost__lte=max_cost)
+        if after is not None:
+            after_time, after_id = after
+            # time >= t bounds the range scan; the OR only breaks ties within equal times
+            slots = slots.filter(Q(time__gte=after_time) & (Q(time__gt=after_time) | Q(id__gt=after_id)))
+        return slots.select_related("doctor").order_by("time", "id")
+
+    @staticmethod
+    def iter_available_slot_rows(chunk_size: int, **filters) -> Iterator[dict]:
         """
-        Retrieve all available (not reserved) slots.
+        Stream available slots as plain dicts (same shape as ``SlotSerializer``),
+        reading ``values()`` rows from the database ``chunk_size`` at a time.
+        Accepts the same filters as ``list_available_slots``.
         """
-        return Slot.objects.filter(is_reserved=False).select_related("doctor")
+        rows = SlotService.list_available_slots(**filters).values(
+            "id", "time", "doctor_id", "doctor__name", "is_reserved", "cost"
+        )
+        for row in rows.iterator(chunk_size=chunk_size):
+            yield {
+                "id": row["id"],
+                "time": row["time"],
+                "doctor_id": row["doctor_id"],
+                "doctor_name": row["doctor__name"],
+                "is_reserved": row["is_reserved"],
+                "cost": str(row["cost"]),
+            }
+
+    @staticmethod
+    def doctor_exists(doctor_id: uuid.UUID) -> bool:
+        return Doctor.objects.filter(id=doctor_id).exists()
 
     @staticmethod
     def get_slot_by_id(slot_id: uuid.UUID) -> Optional[Slot]:
@@ -43,20 +203,231 @@ class SlotService:
         Return None if it does not exist.
         """
         try:
-            return Slot.objects.get(id=slot_id)
+            return Slot.objects.select_related("doctor").get(id=slot_id)
         except Slot.DoesNotExist:
             return None
 
     @staticmethod
-    def reserve_slot(slot_id: uuid.UUID) -> bool:
+    def reserve_slot(slot_id: uuid.UUID) -> Optional[Slot]:
+        """
+        Mark a slot as reserved, returning the reserved slot (with its doctor) if successful.
+        Return None if the slot does not exist or is already reserved.
+
+        The reservation is a single compare-and-set UPDATE (``WHERE id = ? AND is_reserved = false``)
+        decided by the affected-row count, so concurrent callers can never both win the same slot.
+        """
+        updated = Slot.objects.filter(id=slot_id, is_reserved=False).update(is_reserved=True)
+        if updated != 1:
+            return None
+
+        slot = SlotService.get_slot_by_id(slot_id)
+        SlotService._slots_changed(slot.doctor_id, {"type": slot_events.SLOT_RESERVED, "slot_id": slot.id})
+        signals.slots_reserved.send(sender=SlotService, doctor_id=slot.doctor_id, slots=[(slot.id, slot.time)])
+        return slot
+
+    @staticmethod
+    def reserve_slots(
+        slot_ids: Sequence[uuid.UUID], all_or_nothing: bool = False
+    ) -> Tuple[List[Slot], List[uuid.UUID]]:
+        """
+        Reserve the free slots among ``slot_ids`` with one conditional UPDATE. Returns the reserved
+        slots (with their doctors) in time order and the requested ids that were not free. With
+        ``all_or_nothing``, nothing is reserved unless every requested slot is free.
+
+        Call it inside a transaction: the free rows are read first and locked (where the database
+        supports it), so the UPDATE takes exactly those rows. Where it does not lock, a concurrent
+        booker can take one of them in between; the UPDATE then changes fewer rows and
+        SlotsChanged is raised so the transaction rolls back.
+        """
+        requested = list(dict.fromkeys(slot_ids))
+        free = list(
+            Slot.objects.select_for_update(of=("self",))
+            .select_related("doctor")
+            .filter(id__in=requested, is_reserved=False)
+            .order_by("time", "id")
+        )
+        free_ids = {slot.id for slot in free}
+        unavailable = [slot_id for slot_id in requested if slot_id not in free_ids]
+        if not free or (all_or_nothing and unavailable):
+            return [], unavailable
+
+        updated = Slot.objects.filter(id__in=free_ids, is_reserved=False).update(is_reserved=True)
+        if updated != len(free_ids):
+            raise SlotsChanged()
+        by_doctor = defaultdict(list)
+        for slot in free:
+            slot.is_reserved = True
+            SlotService._slots_changed(slot.doctor_id, {"type": slot_events.SLOT_RESERVED, "slot_id": slot.id})
+            by_doctor[slot.doctor_id].append((slot.id, slot.time))
+        for doctor_id, slots in by_doctor.items():
+            signals.slots_reserved.send(sender=SlotService, doctor_id=doctor_id, slots=slots)
+        return free, unavailable
+
+    @staticmethod
+    def release_slot(slot_id: uuid.UUID) -> bool:
+        """
+        Return a reserved slot to the available inventory, e.g. when its appointment is canceled.
+        Returns True if the slot was reserved and is now free again.
+        """
+        return SlotService.release_slots([slot_id]) == 1
+
+    @staticmethod
+    def release_slots(slot_ids: Sequence[uuid.UUID]) -> int:
+        """
+        Free every reserved slot among ``slot_ids`` with one conditional UPDATE and return how many
+        were released. Call it inside a transaction: the released rows are read first and locked
+        (where the database supports it), ``slots_released`` is sent once per doctor before the
+        update returns, and the listing caches and event streams hear about them on commit.
+        """
+        released = list(
+            Slot.objects.select_for_update()
+            .filter(id__in=slot_ids, is_reserved=True)
+            .values_list("id", "doctor_id", "time")
+        )
+        if not released:
+            return 0
+
+        Slot.objects.filter(id__in=[slot_id for slot_id, _, _ in released], is_reserved=True).update(
+            is_reserved=False, held_until=None, hold_token=None
+        )
+        SlotService._announce_released(released)
+        return len(released)
+
+    @staticmethod
+    def hold_slot(slot_id: uuid.UUID, ttl: Optional[int] = None) -> Optional[Tuple[Slot, uuid.UUID]]:
         """
-        Mark a slot as reserved, returning True if successful.
-        Return False if the slot does not exist or is already reserved.
+        Reserve a free slot for ``ttl`` seconds (``SLOT_HOLD_TTL`` by default) while the patient
+        completes checkout. Returns the slot and the token that confirms the hold, or None if the
+        slot does not exist or is not free. Held slots are reserved, so listings skip them as is.
         """
+        ttl = ttl if ttl is not None else getattr(settings, "SLOT_HOLD_TTL", DEFAULT_HOLD_TTL)
+        token = uuid.uuid4()
+        updated = Slot.objects.filter(id=slot_id, is_reserved=False).update(
+            is_reserved=True, held_until=timezone.now() + timedelta(seconds=ttl), hold_token=token
+        )
+        if updated != 1:
+            return None
+
         slot = SlotService.get_slot_by_id(slot_id)
-        if slot is None or slot.is_reserved:
-            return False
+        SlotService._slots_changed(slot.doctor_id, {"type": slot_events.SLOT_RESERVED, "slot_id": slot.id})
+        signals.slots_reserved.send(sender=SlotService, doctor_id=slot.doctor_id, slots=[(slot.id, slot.time)])
+        return slot, token
+
+    @staticmethod
+    def confirm_hold(slot_id: uuid.UUID, hold_token: uuid.UUID) -> Optional[Slot]:
+        """
+        Turn an unexpired hold into a plain reservation, returning the slot (with its doctor).
+        Return None if the token does not match or the hold expired. The slot stays reserved,
+        so listings and subscribers see no change.
+        """
+        updated = Slot.objects.filter(id=slot_id, hold_token=hold_token, held_until__gt=timezone.now()).update(
+            held_until=None, hold_token=None
+        )
+        if updated != 1:
+            return None
+        return SlotService.get_slot_by_id(slot_id)
+
+    @staticmethod
+    def release_expired_holds(batch_size: int = HOLD_SWEEP_BATCH_SIZE) -> int:
+        """
+        Free up to ``batch_size`` expired holds, oldest first, with one conditional UPDATE, and
+        return how many were freed. Both statements are range scans of ``slot_hold_expiry_idx``.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            expired = list(
+                Slot.objects.select_for_update()
+                .filter(held_until__lt=now)
+                .order_by("held_until")
+                .values_list("id", "doctor_id", "time")[:batch_size]
+            )
+            if not expired:
+                return 0
+
+            # The held_until condition skips holds confirmed since they were read
+            released = Slot.objects.filter(id__in=[slot_id for slot_id, _, _ in expired], held_until__lt=now).update(
+                is_reserved=False, held_until=None, hold_token=None
+            )
+            if released == len(expired):
+                SlotService._announce_released(expired)
+            else:
+                SlotService._announce_released(
+                    Slot.objects.filter(id__in=[slot_id for slot_id, _, _ in expired], is_reserved=False).values_list(
+                        "id", "doctor_id", "time"
+                    )
+                )
+        return released
+
+    @staticmethod
+    def _announce_released(released: Iterable[Tuple[uuid.UUID, uuid.UUID, datetime]]) -> None:
+        """
+        Publish ``slot.released`` for each freed ``(slot_id, doctor_id, time)`` on commit, and send
+        ``slots_released`` once per doctor right away, with the slots in time order.
+        """
+        by_doctor = defaultdict(list)
+        for slot_id, doctor_id, slot_time in sorted(released, key=lambda row: (row[2], row[0])):
+            SlotService._slots_changed(doctor_id, {"type": slot_events.SLOT_RELEASED, "slot_id": slot_id})
+            by_doctor[doctor_id].append((slot_id, slot_time))
+        for doctor_id, slots in by_doctor.items():
+            signals.slots_released.send(sender=SlotService, doctor_id=doctor_id, slots=slots)
+
+    @staticmethod
+    def _slots_changed(doctor_id: uuid.UUID, event: dict) -> None:
+        """
+        Publish a slot change once the current transaction commits.
+        """
+        transaction.on_commit(lambda: SlotService._publish_change(doctor_id, event))
+
+    @staticmethod
+    def _publish_change(doctor_id: uuid.UUID, event: dict) -> None:
+        """
+        Bump the doctor's listing version (cache keys and ETags) and push ``event`` to the
+        doctor's slot event subscribers. Only call this for committed changes.
+        """
+        listing_cache.bump_version(doctor_id)
+        slot_events.hub.publish(doctor_id, event)
+
+
+class DoctorService:
+    """
+    Handles business logic related to doctors.
+    """
+
+    @staticmethod
+    def list_doctors(specialization: Optional[str] = None, after: Optional[Tuple[str, uuid.UUID]] = None):
+        """
+        Retrieve doctors ordered by (name, id), each annotated with ``next_free_slot`` (the time of
+        its next free slot, or None) and ``free_slots_next_7_days``.
+
+        Both annotations are correlated subqueries answered from ``slot_doctor_free_time_idx``, so a
+        page of doctors is one query however many doctors it holds. ``specialization`` must match
+        exactly; ``after`` is the (name, id) keyset position of the previous page's last doctor.
+        """
+        now = timezone.now()
+        free_slots = Slot.objects.filter(doctor_id=OuterRef("id"), is_reserved=False, time__gt=now)
+        free_soon = (
+            free_slots.filter(time__lt=now + timedelta(days=DIRECTORY_AVAILABILITY_DAYS))
+            .order_by()
+            .values("doctor_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+
+        doctors = Doctor.objects.all()
+        if specialization is not None:
+            doctors = doctors.filter(specialization=specialization)
+        if after is not None:
+            after_name, after_id = after
+            # name >= n bounds the range scan; the OR only breaks ties within equal names
+            doctors = doctors.filter(Q(name__gte=after_name) & (Q(name__gt=after_name) | Q(id__gt=after_id)))
+        return doctors.annotate(
+            next_free_slot=Subquery(free_slots.order_by("time").values("time")[:1]),
+            free_slots_next_7_days=Coalesce(Subquery(free_soon, output_field=IntegerField()), 0),
+        ).order_by("name", "id")
 
-        slot.is_reserved = True
-        slot.save()
-        return True
+    @staticmethod
+    def search_doctors(query: str, limit: int) -> List[Doctor]:
+        """
+        Full-text search over doctors' names and specializations; see ``doctor_availability.search``.
+        """
+        return search.search_doctors(query, limit)
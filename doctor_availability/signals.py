@@ -0,0 +1,19 @@
+"""
+Signals other modules can connect to without importing their code into this one.
+"""
+
+from django.dispatch import Signal
+
+# Every signal carries ``doctor_id`` and ``slots``: the slots as ``(slot_id, time)`` pairs in time
+# order. They are sent inside the transaction that changed the slots, so receivers that write
+# (e.g. to hand a slot to a waiting patient) commit or roll back together with the change. The
+# async booking path autocommits each statement and sends them with ``asend`` instead.
+
+# Sent by ``SlotService.release_slots`` once per doctor, for the slots that became free again
+slots_released = Signal()
+
+# Sent once per ``create_slot`` / ``create_recurring_slots`` call, for the new slots
+slots_created = Signal()
+
+# Sent once per doctor by ``reserve_slot``, ``reserve_slots`` and ``hold_slot``, for the slots taken
+slots_reserved = Signal()
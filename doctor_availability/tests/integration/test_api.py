@@ -1,12 +1,18 @@
+import asyncio
+import json
 import uuid
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from doctor_availability import cache as listing_cache
+from doctor_availability import events as slot_events
 from doctor_availability.models import Doctor, Slot
+from doctor_availability.services import DoctorService, SlotService
 
 
 class SlotAPITest(TestCase):
@@ -34,8 +40,10 @@ class SlotAPITest(TestCase):
     def setUp(self):
         """
         Called once per test. Good place to initialize fresh state if needed.
+        The listing cache outlives the per-test rollback, so it is cleared here.
         """
         self.client = APIClient()
+        cache.clear()
 
     def test_list_empty_slots(self):
         """
@@ -44,7 +52,8 @@ class SlotAPITest(TestCase):
         """
         response = self.client.get(self.list_create_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
+        self.assertEqual(response.data["results"], [])
+        self.assertIsNone(response.data["next"])
 
     def test_create_slot_success(self):
         """
@@ -157,11 +166,158 @@ class SlotAPITest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # We expect only the first two slots (unreserved) in the results
-        returned_ids = [item["id"] for item in response.data]
+        returned_ids = [item["id"] for item in response.data["results"]]
         self.assertIn(str(slot1.id), returned_ids)
         self.assertIn(str(slot2.id), returned_ids)
         self.assertNotIn(str(slot3.id), returned_ids)
 
+    def test_list_slots_keyset_pagination(self):
+        """
+        Test walking the listing page by page with the next cursor.
+        Slots sharing the same time must neither repeat nor go missing across pages.
+        """
+        future_time = timezone.now() + timezone.timedelta(days=1)
+        created_ids = set()
+        for i in range(5):
+            slot = Slot.objects.create(
+                doctor=self.doctor, time=future_time + timezone.timedelta(hours=i // 2), cost=100
+            )
+            created_ids.add(str(slot.id))
+
+        returned_ids = []
+        url = f"{self.list_create_url}?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            returned_ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(len(returned_ids), 5)
+        self.assertEqual(set(returned_ids), created_ids)
+
+    def test_list_slots_with_filters(self):
+        """
+        Test filtering the listing by doctor, time window and cost range.
+        """
+        future_time = timezone.now() + timezone.timedelta(days=1)
+        match = Slot.objects.create(doctor=self.doctor, time=future_time + timezone.timedelta(hours=1), cost=150)
+        Slot.objects.create(doctor=self.doctor2, time=future_time + timezone.timedelta(hours=1), cost=150)
+        Slot.objects.create(doctor=self.doctor, time=future_time + timezone.timedelta(days=3), cost=150)
+        Slot.objects.create(doctor=self.doctor, time=future_time + timezone.timedelta(hours=2), cost=500)
+
+        response = self.client.get(
+            self.list_create_url,
+            {
+                "doctor_id": str(self.doctor.id),
+                "from": future_time.isoformat(),
+                "to": (future_time + timezone.timedelta(days=1)).isoformat(),
+                "min_cost": "100",
+                "max_cost": "200",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["id"] for item in response.data["results"]], [str(match.id)])
+
+    def test_list_slots_invalid_cursor(self):
+        """
+        Test that a malformed cursor is rejected.
+        """
+        response = self.client.get(self.list_create_url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cursor", response.data)
+
+    def test_list_slots_is_cached_until_reserved(self):
+        """
+        Test that a repeated listing is served from the cache without queries,
+        and that reserving a slot invalidates the doctor's cached pages.
+        """
+        future_time = timezone.now() + timezone.timedelta(days=1)
+        slot = Slot.objects.create(doctor=self.doctor, time=future_time, cost=100)
+        query = {"doctor_id": str(self.doctor.id)}
+
+        listing_cache.reset_stats()
+        first = self.client.get(self.list_create_url, query)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.list_create_url, query)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(listing_cache.stats(), {"hits": 1, "misses": 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SlotService.reserve_slot(slot.id)
+
+        response = self.client.get(self.list_create_url, query)
+        self.assertEqual(response.data["results"], [])
+        self.assertEqual(listing_cache.stats(), {"hits": 1, "misses": 2})
+
+    def test_list_slots_conditional_get(self):
+        """
+        Test that a matching If-None-Match gets a 304 without any query,
+        until a slot of the doctor is created.
+        """
+        Slot.objects.create(doctor=self.doctor, time=timezone.now() + timezone.timedelta(days=1), cost=100)
+        query = {"doctor_id": str(self.doctor.id)}
+
+        response = self.client.get(self.list_create_url, query)
+        etag = response["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_create_url, query, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+        # A different page of the same resource does not match
+        response = self.client.get(self.list_create_url, {**query, "page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SlotService.create_slot(self.doctor.id, timezone.now() + timezone.timedelta(days=2), 100)
+
+        response = self.client.get(self.list_create_url, query, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertNotEqual(response["ETag"], etag)
+
+    async def test_list_slots_async(self):
+        """
+        Test that the async listing returns the same page as the sync one, with an ETag.
+        """
+        slot = await Slot.objects.acreate(
+            doctor=self.doctor, time=timezone.now() + timezone.timedelta(days=1), cost=100
+        )
+
+        response = await self.async_client.get(reverse("slot-list-async"), {"doctor_id": str(self.doctor.id)})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["id"] for item in response.json()["results"]], [str(slot.id)])
+        self.assertIsNone(response.json()["next"])
+
+        response = await self.async_client.get(
+            reverse("slot-list-async"), {"doctor_id": str(self.doctor.id)}, headers={"If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_slots_streaming(self):
+        """
+        Test that the streaming mode returns every matching slot as one JSON array,
+        selected either by query parameter or by Accept header.
+        """
+        future_time = timezone.now() + timezone.timedelta(days=1)
+        slots = [
+            Slot.objects.create(doctor=self.doctor, time=future_time + timezone.timedelta(hours=i), cost=100)
+            for i in range(3)
+        ]
+        Slot.objects.create(doctor=self.doctor, time=future_time, cost=100, is_reserved=True)
+
+        for response in (
+            self.client.get(self.list_create_url, {"format": "jsonstream", "page_size": 1}),
+            self.client.get(self.list_create_url, HTTP_ACCEPT="application/stream+json"),
+        ):
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.streaming)
+            data = json.loads(b"".join(response.streaming_content))
+            self.assertEqual([item["id"] for item in data], [str(slot.id) for slot in slots])
+            self.assertEqual(data[0]["doctor_name"], "Dr. Ahmed")
+            self.assertEqual(data[0]["cost"], "100.00")
+
     def test_create_slot_for_second_doctor(self):
         """
         Test creating a slot for a different doctor.
@@ -181,3 +337,151 @@ class SlotAPITest(TestCase):
         self.assertEqual(created_slot.doctor, self.doctor2)
         self.assertEqual(created_slot.cost, 300.00)
         self.assertFalse(created_slot.is_reserved)
+
+    def test_create_recurring_slots(self):
+        """
+        Test the recurring schedule endpoint returns a summary instead of the slots.
+        """
+        today = timezone.localdate()
+        payload = {
+            "doctor_id": str(self.doctor.id),
+            "start_date": (today + timezone.timedelta(days=7 - today.weekday())).isoformat(),
+            "weeks": 2,
+            "weekdays": [0, 1, 2, 3, 4],
+            "start_time": "09:00",
+            "end_time": "17:00",
+            "slot_minutes": 20,
+            "cost": "150.00",
+        }
+        response = self.client.post(reverse("slot-recurring-create"), data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 24 * 5 * 2)
+        self.assertEqual(response.data["skipped"], 0)
+        self.assertEqual(Slot.objects.filter(doctor=self.doctor).count(), 24 * 5 * 2)
+
+    def test_create_recurring_slots_invalid_window(self):
+        """
+        Test that an end time before the start time is rejected.
+        """
+        payload = {
+            "doctor_id": str(self.doctor.id),
+            "start_date": timezone.localdate().isoformat(),
+            "weeks": 1,
+            "weekdays": [0],
+            "start_time": "17:00",
+            "end_time": "09:00",
+            "slot_minutes": 20,
+            "cost": "150.00",
+        }
+        response = self.client.post(reverse("slot-recurring-create"), data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("end_time", response.data)
+        self.assertEqual(Slot.objects.count(), 0)
+
+
+class SlotEventsStreamTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = Doctor.objects.create(name="Dr. Ahmed")
+
+    async def test_stream_pushes_slot_events(self):
+        """
+        Test that a subscriber receives a published slot event as an SSE frame.
+        """
+        response = await self.async_client.get(reverse("slot-events", args=[self.doctor.id]))
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b"retry:"))
+
+        slot_events.hub.publish(self.doctor.id, {"type": slot_events.SLOT_RESERVED, "slot_id": "abc"})
+        frame = await asyncio.wait_for(anext(stream), timeout=1)
+        self.assertEqual(frame, b'event: slot.reserved\ndata: {"type":"slot.reserved","slot_id":"abc"}\n\n')
+
+        # A client disconnect cancels the pending read, which must drop the subscription
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        self.assertEqual(slot_events.hub.subscriber_count(self.doctor.id), 0)
+
+
+class DoctorDirectoryAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.ahmed = Doctor.objects.create(name="Dr. Ahmed", specialization="Cardiology")
+        cls.jane = Doctor.objects.create(name="Dr. Jane", specialization="Dermatology")
+        cls.sara = Doctor.objects.create(name="Dr. Sara", specialization="Cardiology")
+        cls.next_slot = now + timezone.timedelta(hours=1)
+        Slot.objects.create(doctor=cls.ahmed, time=now - timezone.timedelta(hours=1), cost=100)
+        Slot.objects.create(doctor=cls.ahmed, time=now + timezone.timedelta(minutes=30), cost=100, is_reserved=True)
+        Slot.objects.create(doctor=cls.ahmed, time=cls.next_slot, cost=100)
+        Slot.objects.create(doctor=cls.ahmed, time=now + timezone.timedelta(days=2), cost=100)
+        Slot.objects.create(doctor=cls.ahmed, time=now + timezone.timedelta(days=10), cost=100)
+        cls.sara_slot = now + timezone.timedelta(days=9)
+        Slot.objects.create(doctor=cls.sara, time=cls.sara_slot, cost=100)
+        cls.url = reverse("doctor-directory")
+
+    @staticmethod
+    def iso(value):
+        return value.isoformat().replace("+00:00", "Z")
+
+    def test_lists_doctors_with_their_availability(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(
+            [
+                (row["name"], row["specialization"], row["next_free_slot"], row["free_slots_next_7_days"])
+                for row in response.data["results"]
+            ],
+            [
+                ("Dr. Ahmed", "Cardiology", self.iso(self.next_slot), 2),
+                ("Dr. Jane", "Dermatology", None, 0),
+                # Free, but beyond the 7-day window
+                ("Dr. Sara", "Cardiology", self.iso(self.sara_slot), 0),
+            ],
+        )
+
+    def test_filters_by_specialization_and_pages_by_name(self):
+        response = self.client.get(self.url, {"specialization": "Cardiology", "page_size": 1})
+        self.assertEqual([row["name"] for row in response.data["results"]], ["Dr. Ahmed"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual([row["name"] for row in response.data["results"]], ["Dr. Sara"])
+        self.assertIsNone(response.data["next"])
+
+    def test_counts_come_from_the_free_slot_index(self):
+        plan = DoctorService.list_doctors(specialization="Cardiology")[:50].explain()
+        self.assertIn("slot_doctor_free_time_idx", plan)
+        self.assertIn("doctor_specialization_name_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cursor", response.data)
+
+
+class DoctorSearchAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ahmed = Doctor.objects.create(name="Dr. Ahmed", specialization="Cardiology")
+        Doctor.objects.create(name="Dr. Jane", specialization="Dermatology")
+        cls.url = reverse("doctor-search")
+
+    def test_search(self):
+        response = self.client.get(self.url, {"q": "cardio"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            [{"id": str(self.ahmed.id), "name": "Dr. Ahmed", "specialization": "Cardiology"}],
+        )
+
+    def test_query_needs_a_word(self):
+        for params in ({}, {"q": ""}, {"q": "*:()"}, {"q": "dr", "limit": 0}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
@@ -0,0 +1,30 @@
+from django.core.checks import run_checks
+from django.test import SimpleTestCase, override_settings
+
+LOCMEM = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+SHARED = {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "cache_table"}
+
+
+class SharedCacheCheckTest(SimpleTestCase):
+    def warned_settings(self):
+        return [
+            message.msg.split()[0]
+            for message in run_checks(include_deployment_checks=True)
+            if message.id == "doctor_appointment_app.W001"
+        ]
+
+    @override_settings(
+        CACHES={"default": LOCMEM}, CHANGE_VERSION_CACHE_ALIAS="default", SLOT_LISTING_CACHE_ALIAS="default"
+    )
+    def test_per_process_cache_is_reported_on_deploy(self):
+        self.assertEqual(self.warned_settings(), ["CHANGE_VERSION_CACHE_ALIAS", "SLOT_LISTING_CACHE_ALIAS"])
+        # Not a problem for runserver or the test suite
+        self.assertFalse([message for message in run_checks() if message.id == "doctor_appointment_app.W001"])
+
+    @override_settings(
+        CACHES={"default": LOCMEM, "shared": SHARED},
+        CHANGE_VERSION_CACHE_ALIAS="shared",
+        SLOT_LISTING_CACHE_ALIAS="shared",
+    )
+    def test_shared_cache_passes(self):
+        self.assertEqual(self.warned_settings(), [])
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+import unittest
+import uuid
+
+from doctor_availability.events import RESYNC, SLOT_CREATED, SlotEventHub
+
+
+class TestSlotEventHub(unittest.TestCase):
+    """
+    Unit tests for the in-process slot event fan-out.
+    """
+
+    def test_publish_reaches_only_the_doctors_subscribers(self):
+        hub = SlotEventHub(queue_size=10)
+        doctor_id, other_doctor_id = uuid.uuid4(), uuid.uuid4()
+
+        async def scenario():
+            subscription = hub.subscribe(doctor_id)
+            other = hub.subscribe(other_doctor_id)
+            # Publish from another thread, as a sync view would
+            thread = threading.Thread(target=hub.publish, args=(doctor_id, {"type": SLOT_CREATED}))
+            thread.start()
+            thread.join()
+            event = await asyncio.wait_for(subscription.get(), timeout=1)
+            self.assertTrue(other.queue.empty())
+            hub.unsubscribe(subscription)
+            hub.unsubscribe(other)
+            return event
+
+        self.assertEqual(asyncio.run(scenario()), {"type": SLOT_CREATED})
+        self.assertEqual(hub.subscriber_count(doctor_id), 0)
+
+    def test_overflow_drops_to_resync(self):
+        """
+        A slow subscriber's backlog is replaced by one resync event instead of growing.
+        """
+        hub = SlotEventHub(queue_size=3)
+        doctor_id = uuid.uuid4()
+
+        async def scenario():
+            subscription = hub.subscribe(doctor_id)
+            for i in range(5):
+                hub.publish(doctor_id, {"type": SLOT_CREATED, "n": i})
+            await asyncio.sleep(0)  # let the loop run the scheduled deliveries
+            events = []
+            while not subscription.queue.empty():
+                events.append(subscription.queue.get_nowait())
+            return subscription, events
+
+        subscription, events = asyncio.run(scenario())
+        self.assertEqual(events[0], {"type": RESYNC, "doctor_id": str(doctor_id)})
+        self.assertEqual(events[1:], [{"type": SLOT_CREATED, "n": 4}])
+        self.assertEqual(subscription.dropped, 3)
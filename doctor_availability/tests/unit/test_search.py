@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from doctor_availability import search
+from doctor_availability.models import Doctor
+
+
+class DoctorSearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ahmed = Doctor.objects.create(name="Dr. Ahmed Hassan", specialization="Cardiology")
+        cls.cardoso = Doctor.objects.create(name="Dr. Maria Cardoso", specialization="Dermatology")
+        cls.jane = Doctor.objects.create(name="Dr. Jane Doe", specialization=None)
+
+    def names(self, query, limit=20):
+        return [doctor.name for doctor in search.search_doctors(query, limit)]
+
+    def test_uses_fts5_here(self):
+        # The fallback tests below only mean something if the main path is the FTS table
+        self.assertTrue(search.fts_available())
+
+    def test_prefix_matching_and_ranking(self):
+        # A name hit outranks a specialization hit
+        self.assertEqual(self.names("card"), ["Dr. Maria Cardoso", "Dr. Ahmed Hassan"])
+        # Every word must match, in either column
+        self.assertEqual(self.names("ahm cardio"), ["Dr. Ahmed Hassan"])
+        self.assertEqual(self.names("JANE"), ["Dr. Jane Doe"])
+        self.assertEqual(self.names("card", limit=1), ["Dr. Maria Cardoso"])
+        self.assertEqual(self.names("neuro"), [])
+
+    def test_query_syntax_is_not_passed_through(self):
+        self.assertEqual(self.names('"ahm* OR) NEAR(jane'), [])
+        self.assertEqual(self.names('ahmed" -'), ["Dr. Ahmed Hassan"])
+        self.assertEqual(self.names("*** ---"), [])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.ahmed.name = "Dr. Omar Hassan"
+        self.ahmed.save()
+        self.assertEqual(self.names("ahmed"), [])
+        self.assertEqual(self.names("omar"), ["Dr. Omar Hassan"])
+
+        Doctor.objects.filter(id=self.jane.id).update(specialization="Neurology")
+        self.assertEqual(self.names("neuro"), ["Dr. Jane Doe"])
+
+        Doctor.objects.bulk_create([Doctor(name="Dr. Nadia Karim", specialization="Neurology")])
+        self.assertEqual(self.names("neuro"), ["Dr. Jane Doe", "Dr. Nadia Karim"])
+
+        self.cardoso.delete()
+        Doctor.objects.filter(name="Dr. Nadia Karim").delete()
+        self.assertEqual(self.names("card"), ["Dr. Omar Hassan"])
+        self.assertEqual(self.names("nadia"), [])
+
+    def test_search_is_one_query(self):
+        search.fts_available()
+        with self.assertNumQueries(1):
+            self.names("card")
+
+    def test_fallback_without_fts5(self):
+        with patch.object(search, "fts_available", return_value=False):
+            self.assertEqual(self.names("card"), ["Dr. Ahmed Hassan", "Dr. Maria Cardoso"])
+            self.assertEqual(self.names("ahm cardio"), ["Dr. Ahmed Hassan"])
+            self.assertEqual(self.names("jane"), ["Dr. Jane Doe"])
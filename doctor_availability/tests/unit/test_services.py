@@ -1,10 +1,13 @@
+import datetime
 import uuid
+from unittest.mock import patch
 
 from django.test import TestCase
 from django.utils import timezone
 
 from doctor_availability.models import Doctor, Slot
 from doctor_availability.services import SlotService
+from doctor_availability.signals import slots_released
 
 
 class TestSlotService(TestCase):
@@ -98,3 +101,188 @@ class TestSlotService(TestCase):
         self.assertIn(slot3, available_slots)
         self.assertNotIn(slot2, available_slots)
         self.assertEqual(available_slots.count(), 2)
+
+    def test_reserve_slot(self):
+        """
+        Test that reserve_slot flips an unreserved slot and reports success only once.
+        """
+        slot = SlotService.create_slot(self.doctor1.id, timezone.now() + timezone.timedelta(days=1), 200)
+
+        # The conditional UPDATE, loading the reserved slot with its doctor, then the
+        # slots_reserved receivers (the dashboard counts the slot as taken)
+        with self.assertNumQueries(3):
+            reserved = SlotService.reserve_slot(slot.id)
+        self.assertEqual(reserved, slot)
+        self.assertEqual(reserved.doctor.name, "Dr. Ahmed")
+        self.assertIsNone(SlotService.reserve_slot(slot.id))
+
+        slot.refresh_from_db()
+        self.assertTrue(slot.is_reserved)
+
+    def test_reserve_nonexistent_slot(self):
+        """
+        Test that reserving an unknown slot returns None.
+        """
+        self.assertIsNone(SlotService.reserve_slot(uuid.uuid4()))
+
+    def _next_monday(self):
+        today = timezone.localdate()
+        return today + timezone.timedelta(days=7 - today.weekday())
+
+    def test_create_recurring_slots(self):
+        """
+        Test expanding Mon-Fri 09:00-17:00 with 20-minute slots over 12 weeks.
+        """
+        summary = SlotService.create_recurring_slots(
+            doctor_id=self.doctor1.id,
+            start_date=self._next_monday(),
+            weeks=12,
+            weekdays=[0, 1, 2, 3, 4],
+            start_time=datetime.time(9, 0),
+            end_time=datetime.time(17, 0),
+            slot_minutes=20,
+            cost=150,
+        )
+
+        self.assertEqual(summary["created"], 24 * 5 * 12)
+        self.assertEqual(summary["skipped"], 0)
+        self.assertEqual(Slot.objects.filter(doctor=self.doctor1).count(), 24 * 5 * 12)
+        self.assertEqual(summary["first_slot"].hour, 9)
+        self.assertEqual(summary["last_slot"].hour, 16)
+        self.assertEqual(summary["last_slot"].minute, 40)
+
+    def test_create_recurring_slots_skips_overlaps(self):
+        """
+        Test that generated slots overlapping an existing slot are skipped, using a bounded number of queries.
+        """
+        monday = self._next_monday()
+        SlotService.create_slot(
+            self.doctor1.id, timezone.make_aware(datetime.datetime.combine(monday, datetime.time(9, 10))), 100
+        )
+
+        # doctor exists check, savepoint, range query, bulk insert, waitlist lookup,
+        # dashboard counters of the day, release savepoint
+        with self.assertNumQueries(7):
+            summary = SlotService.create_recurring_slots(
+                doctor_id=self.doctor1.id,
+                start_date=monday,
+                weeks=1,
+                weekdays=[0],
+                start_time=datetime.time(9, 0),
+                end_time=datetime.time(10, 0),
+                slot_minutes=20,
+                cost=150,
+            )
+
+        self.assertEqual(summary["created"], 2)
+        self.assertEqual(summary["skipped"], 1)
+        self.assertEqual(Slot.objects.filter(doctor=self.doctor1).count(), 3)
+
+    def test_create_recurring_slots_nonexistent_doctor(self):
+        """
+        Test that a recurring schedule for an unknown doctor raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            SlotService.create_recurring_slots(
+                doctor_id=uuid.uuid4(),
+                start_date=self._next_monday(),
+                weeks=1,
+                weekdays=[0],
+                start_time=datetime.time(9, 0),
+                end_time=datetime.time(10, 0),
+                slot_minutes=20,
+                cost=150,
+            )
+        self.assertEqual(Slot.objects.count(), 0)
+
+    def test_list_available_slots_uses_listing_indexes(self):
+        """
+        Test that a keyset page is answered by an index range scan without a sort step.
+        """
+        future_time = timezone.now() + timezone.timedelta(days=1)
+        slot = Slot.objects.create(doctor=self.doctor1, time=future_time, cost=200)
+
+        plan = SlotService.list_available_slots(after=(slot.time, slot.id))[:50].explain()
+        self.assertIn("slot_free_time_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+        plan = SlotService.list_available_slots(doctor_id=self.doctor1.id, after=(slot.time, slot.id))[:50].explain()
+        self.assertIn("slot_doctor_free_time_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_slot_changes_are_published_on_commit(self):
+        """
+        Test that creating and reserving a slot push events to the doctor's subscribers after commit.
+        """
+        with patch("doctor_availability.services.slot_events.hub.publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                slot = SlotService.create_slot(self.doctor1.id, timezone.now() + timezone.timedelta(days=1), 100)
+            with self.captureOnCommitCallbacks(execute=True):
+                SlotService.reserve_slot(slot.id)
+
+        (created_doctor, created), (reserved_doctor, reserved) = [c.args for c in publish.call_args_list]
+        self.assertEqual(created_doctor, self.doctor1.id)
+        self.assertEqual(created["type"], "slot.created")
+        self.assertEqual(created["slot"]["id"], slot.id)
+        self.assertEqual(reserved_doctor, self.doctor1.id)
+        self.assertEqual(reserved, {"type": "slot.reserved", "slot_id": slot.id})
+
+    def test_release_slots(self):
+        """
+        Test that only reserved slots are released, each publishing an event on commit, with one slots_released.
+        """
+        future_time = timezone.now() + timezone.timedelta(days=1)
+        reserved = Slot.objects.create(doctor=self.doctor1, time=future_time, cost=100, is_reserved=True)
+        free = Slot.objects.create(doctor=self.doctor1, time=future_time, cost=100)
+
+        received = []
+        slots_released.connect(lambda sender, **kwargs: received.append(kwargs), weak=False, dispatch_uid="test")
+        self.addCleanup(slots_released.disconnect, dispatch_uid="test")
+
+        with patch("doctor_availability.services.slot_events.hub.publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertEqual(SlotService.release_slots([reserved.id, free.id, uuid.uuid4()]), 1)
+                self.assertEqual(publish.call_count, 0)
+
+        publish.assert_called_once_with(self.doctor1.id, {"type": "slot.released", "slot_id": reserved.id})
+        self.assertEqual(
+            received,
+            [{"signal": slots_released, "doctor_id": self.doctor1.id, "slots": [(reserved.id, reserved.time)]}],
+        )
+        reserved.refresh_from_db()
+        self.assertFalse(reserved.is_reserved)
+        self.assertFalse(SlotService.release_slot(reserved.id))
+
+    def test_hold_slot_hides_it_until_it_is_confirmed_or_expires(self):
+        """
+        Test that a held slot is not listed, confirms only with its token, and is freed by the sweeper once expired.
+        """
+        future_time = timezone.now() + timezone.timedelta(days=1)
+        confirmed = Slot.objects.create(doctor=self.doctor1, time=future_time, cost=100)
+        expired = Slot.objects.create(doctor=self.doctor1, time=future_time, cost=100)
+
+        _, token = SlotService.hold_slot(confirmed.id)
+        _, expired_token = SlotService.hold_slot(expired.id, ttl=-1)
+        self.assertIsNone(SlotService.hold_slot(confirmed.id))
+        self.assertFalse(SlotService.list_available_slots().exists())
+
+        self.assertIsNone(SlotService.confirm_hold(confirmed.id, uuid.uuid4()))
+        self.assertIsNone(SlotService.confirm_hold(expired.id, expired_token))
+        self.assertEqual(SlotService.confirm_hold(confirmed.id, token).id, confirmed.id)
+
+        with patch("doctor_availability.services.slot_events.hub.publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertEqual(SlotService.release_expired_holds(), 1)
+        publish.assert_called_once_with(self.doctor1.id, {"type": "slot.released", "slot_id": expired.id})
+        self.assertEqual(list(SlotService.list_available_slots()), [expired])
+        confirmed.refresh_from_db()
+        self.assertTrue(confirmed.is_reserved)
+        self.assertIsNone(confirmed.held_until)
+
+    def test_expired_hold_sweep_uses_the_expiry_index(self):
+        """
+        Test that the sweeper's batch query is a range scan of the partial expiry index.
+        """
+        plan = Slot.objects.filter(held_until__lt=timezone.now()).order_by("held_until")[:500].explain()
+        self.assertIn("slot_hold_expiry_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
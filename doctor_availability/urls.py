@@ -1,7 +1,19 @@
 from django.urls import path
 
-from .views import SlotListCreateView
+from .views import (
+    DoctorDirectoryView,
+    DoctorSearchView,
+    RecurringSlotCreateView,
+    SlotListCreateView,
+    slot_events_stream,
+    slot_list_async,
+)
 
 urlpatterns = [
     path("slots/", SlotListCreateView.as_view(), name="slot-list-create"),
+    path("slots/async/", slot_list_async, name="slot-list-async"),
+    path("slots/recurring/", RecurringSlotCreateView.as_view(), name="slot-recurring-create"),
+    path("doctors/", DoctorDirectoryView.as_view(), name="doctor-directory"),
+    path("doctors/search/", DoctorSearchView.as_view(), name="doctor-search"),
+    path("doctors/<uuid:doctor_id>/slot-events/", slot_events_stream, name="slot-events"),
 ]
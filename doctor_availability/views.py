@@ -1,8 +1,35 @@
+import asyncio
+import uuid
+
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
 from rest_framework import generics, status
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.urls import replace_query_param
+
+from doctor_appointment_app import conditional
+from doctor_appointment_app.pagination import encode_cursor, encode_doctor_cursor
+from doctor_appointment_app.streaming import (
+    STREAM_CHUNK_SIZE,
+    STREAMING_RENDERER_CLASSES,
+    streaming_json_response,
+    wants_streaming,
+)
 
-from .serializers import SlotSerializer
-from .services import SlotService
+from . import cache as listing_cache
+from . import events as slot_events
+from .serializers import (
+    DoctorDirectoryQuerySerializer,
+    DoctorDirectorySerializer,
+    DoctorSearchQuerySerializer,
+    DoctorSerializer,
+    RecurringSlotScheduleSerializer,
+    RecurringSlotSummarySerializer,
+    SlotListQuerySerializer,
+    SlotSerializer,
+)
+from .services import DoctorService, SlotService
 
 
 class SlotListCreateView(generics.GenericAPIView):
@@ -11,14 +38,46 @@ class SlotListCreateView(generics.GenericAPIView):
     """
 
     serializer_class = SlotSerializer
+    renderer_classes = STREAMING_RENDERER_CLASSES
 
     def get(self, request, *args, **kwargs):
         """
-        List all available slots.
+        List available slots, one keyset-paginated page at a time.
+        Supports doctor_id, from/to and min_cost/max_cost filters.
+        Pages are served through the versioned listing cache and carry an ETag;
+        a matching ``If-None-Match`` is answered with 304 without touching the database.
+
+        With ``?format=jsonstream`` (or ``Accept: application/stream+json``) every matching
+        slot from the cursor on is streamed as a single JSON array instead.
         """
-        slots = SlotService.list_available_slots()
-        serializer = self.serializer_class(slots, many=True)
-        return Response(serializer.data)
+        query = SlotListQuerySerializer(data=request.query_params.dict())
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        params = dict(query.validated_data)
+        page_size = params.pop("page_size")
+        after = params.pop("cursor", None)
+
+        if wants_streaming(request):
+            return streaming_json_response(
+                SlotService.iter_available_slot_rows(chunk_size=STREAM_CHUNK_SIZE, after=after, **params)
+            )
+
+        page_params = {**params, "after": after, "page_size": page_size}
+        version = listing_cache.current_version(params.get("doctor_id"))
+        if conditional.is_not_modified(request, version, page_params):
+            return conditional.not_modified_response(request)
+
+        def load_page():
+            # Fetch one extra row to know whether another page exists
+            slots = list(SlotService.list_available_slots(after=after, **params)[: page_size + 1])
+            return _build_page(slots, page_size)
+
+        page = listing_cache.get_or_set(params.get("doctor_id"), page_params, load_page)
+        return Response(
+            {"next": _next_url(request, page), "results": page["results"]},
+            headers={"ETag": conditional.make_etag(version, page_params)},
+        )
 
     def post(self, request, *args, **kwargs):
         """
@@ -38,3 +97,150 @@ class SlotListCreateView(generics.GenericAPIView):
             except ValueError as e:
                 return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class RecurringSlotCreateView(generics.GenericAPIView):
+    """
+    Expands a recurring weekly schedule into slots and bulk-creates them.
+    """
+
+    serializer_class = RecurringSlotScheduleSerializer
+
+    def post(self, request, *args, **kwargs):
+        """
+        Create every slot of the schedule and return a summary of what was written.
+        """
+        serializer = self.serializer_class(data=request.data)
+        if serializer.is_valid():
+            try:
+                summary = SlotService.create_recurring_slots(**serializer.validated_data)
+                return Response(RecurringSlotSummarySerializer(summary).data, status=status.HTTP_201_CREATED)
+            except ValueError as e:
+                return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class DoctorDirectoryView(generics.GenericAPIView):
+    """
+    Lists doctors with their next free slot and their free slots over the next 7 days.
+    """
+
+    serializer_class = DoctorDirectorySerializer
+
+    def get(self, request, *args, **kwargs):
+        """
+        List doctors by name, one keyset-paginated page at a time, optionally of one specialization.
+        """
+        query = DoctorDirectoryQuerySerializer(data=request.query_params.dict())
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        page_size = query.validated_data["page_size"]
+        # Fetch one extra row to know whether another page exists
+        doctors = list(
+            DoctorService.list_doctors(
+                specialization=query.validated_data.get("specialization"),
+                after=query.validated_data.get("cursor"),
+            )[: page_size + 1]
+        )
+        next_url = None
+        if len(doctors) > page_size:
+            doctors = doctors[:page_size]
+            cursor = encode_doctor_cursor(doctors[-1].name, doctors[-1].id)
+            next_url = replace_query_param(request.build_absolute_uri(), "cursor", cursor)
+        return Response({"next": next_url, "results": self.serializer_class(doctors, many=True).data})
+
+
+class DoctorSearchView(generics.GenericAPIView):
+    """
+    Searches doctors by name and specialization.
+    """
+
+    serializer_class = DoctorSerializer
+
+    def get(self, request, *args, **kwargs):
+        """
+        Return the best matches for ``q``, matching each of its words as a prefix.
+        """
+        query = DoctorSearchQuerySerializer(data=request.query_params.dict())
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        doctors = DoctorService.search_doctors(query.validated_data["q"], query.validated_data["limit"])
+        return Response({"results": self.serializer_class(doctors, many=True).data})
+
+
+async def slot_list_async(request):
+    """
+    Async variant of the slot listing (``SlotListCreateView.get``) for the ASGI entry point.
+    Same filters, pagination, cache and ETags; streaming is only offered by the sync view.
+    """
+    query = SlotListQuerySerializer(data=request.GET.dict())
+    if not query.is_valid():
+        return JsonResponse(query.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    params = dict(query.validated_data)
+    page_size = params.pop("page_size")
+    after = params.pop("cursor", None)
+
+    page_params = {**params, "after": after, "page_size": page_size}
+    version = await listing_cache.acurrent_version(params.get("doctor_id"))
+    if conditional.is_not_modified(request, version, page_params):
+        return conditional.not_modified_response(request)
+
+    async def load_page():
+        slots = [slot async for slot in SlotService.list_available_slots(after=after, **params)[: page_size + 1]]
+        return _build_page(slots, page_size)
+
+    page = await listing_cache.aget_or_set(params.get("doctor_id"), page_params, load_page)
+    return JsonResponse(
+        {"next": _next_url(request, page), "results": page["results"]},
+        headers={"ETag": conditional.make_etag(version, page_params)},
+    )
+
+
+def _build_page(slots, page_size: int) -> dict:
+    """
+    Turn ``page_size + 1`` fetched slots into the cacheable page: serialized results plus the next cursor.
+    """
+    cursor = None
+    if len(slots) > page_size:
+        slots = slots[:page_size]
+        cursor = encode_cursor(slots[-1].time, slots[-1].id)
+    return {"cursor": cursor, "results": SlotSerializer(slots, many=True).data}
+
+
+def _next_url(request, page: dict):
+    if not page["cursor"]:
+        return None
+    return replace_query_param(request.build_absolute_uri(), "cursor", page["cursor"])
+
+
+async def slot_events_stream(request, doctor_id: uuid.UUID):
+    """
+    Server-sent events feed of one doctor's slot changes (``slot.created``, ``slot.reserved``,
+    ``slot.released`` and ``resync``). Requires the ASGI entry point; idle listeners only hold a small queue.
+    """
+    return StreamingHttpResponse(
+        _iter_slot_events(doctor_id),
+        content_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _iter_slot_events(doctor_id: uuid.UUID):
+    heartbeat = getattr(settings, "SLOT_EVENTS_HEARTBEAT", 15)
+    encoder = JSONEncoder(separators=(",", ":"))
+    subscription = slot_events.hub.subscribe(doctor_id)
+    try:
+        # Subscribed before the first byte, so nothing published after this is missed
+        yield f"retry: {heartbeat * 1000}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: {event['type']}\ndata: {encoder.encode(event)}\n\n"
+    finally:
+        slot_events.hub.unsubscribe(subscription)